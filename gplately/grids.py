@@ -6,10 +6,14 @@ Grids can be searched for invalid, NaN-type data cells. These can be replaced wi
 
 Classes
 -------
+LonWrappedGrid
 RegularGridInterpolator
+SamplingPlan
 Raster
 TimeRaster
 """
+import itertools
+import warnings
 import numpy as np
 from scipy.interpolate import RegularGridInterpolator as _RGI
 from scipy.ndimage import distance_transform_edt
@@ -56,11 +60,232 @@ def fill_raster(data,invalid=None):
     ind = distance_transform_edt(invalid, return_distances=False, return_indices=True)
     return data[tuple(ind)]
 
-def read_netcdf_grid(filename, return_grids=False, resample=None):
+def _netcdf_coords(cdf):
+    """Returns the longitude and latitude coordinate arrays of an open netCDF4 dataset."""
+    try:
+        return cdf['lon'][:], cdf['lat'][:]
+    except:
+        return cdf['x'][:], cdf['y'][:]
+
+def _seam_columns(lons):
+    """Returns a global longitude axis that does not reach -180 (or 180) degrees padded across the seam with its last 
+    column at longitude - 360 (or its first column at longitude + 360), and the index into `lons` of each padded 
+    column. Returns None if `lons` is not an ascending global axis with a gap at the seam.
+    """
+    if lons.size < 2 or lons[1] <= lons[0] or not np.isclose(lons[-1] - lons[0] + (lons[1] - lons[0]), 360):
+        return None
+    pad_start, pad_end = int(lons[0] > -180), int(lons[-1] < 180)
+    if not pad_start and not pad_end:
+        return None
+    index = np.arange(lons.size)
+    index = np.hstack([index[-1:]] * pad_start + [index] + [index[:1]] * pad_end)
+    lons = np.hstack([lons[-1:] - 360] * pad_start + [lons] + [lons[:1] + 360] * pad_end)
+    return lons, index
+
+def _wrapped_columns(lons):
+    """Returns longitudes re-aligned from -180 to 180 degrees and the file column that holds each of them.
+
+    A global grid that does not reach -180 (or 180) degrees is padded across the seam (see _seam_columns). The number
+    of padding columns at the (start, end) is returned as well.
+    """
+    columns = np.arange(len(lons))
+    if lons.max() > 180:
+        if np.isclose(lons[-1] - lons[0], 360):
+            # the last column repeats the first one across the seam
+            columns = columns[:-1]
+            lons = lons[:-1]
+        lon_mask = lons > 180
+        columns = np.hstack([columns[lon_mask], columns[~lon_mask]])
+        lons = np.hstack([lons[lon_mask]-360, lons[~lon_mask]])
+
+    seam = _seam_columns(lons)
+    if seam is None:
+        return lons, columns, (0, 0)
+    padded_lons, index = seam
+    return padded_lons, columns[index], (int(lons[0] > -180), int(lons[-1] < 180))
+
+def _xy_factors(factor, name):
+    """Returns an integer factor, given as one integer, a (factorX, factorY) tuple or None, as a positive (x, y) pair."""
+    if factor is None:
+        factor = 1
+    factor_x, factor_y = (factor, factor) if np.ndim(factor) == 0 else factor
+    factor_x, factor_y = int(factor_x), int(factor_y)
+    if factor_x < 1 or factor_y < 1:
+        raise ValueError("{} must be a positive integer ({} = {})".format(name, name, factor))
+    return factor_x, factor_y
+
+def _netcdf_window(lons, lats, extent=None, stride=None, pad_seam=True):
+    """Finds the rows and file columns of a grid that fall inside a [min lon, max lon, min lat, max lat] extent, 
+    keeping every stride-th row and column. 
+
+    Returns the row slice, the array of file columns (in -180 to 180 order) and the matching lons and lats. With 
+    `pad_seam`, a window of a global grid that reaches past its first (or last) column into the gap at the seam 
+    includes the column across it (see _wrapped_columns). The whole grid, read without an extent, is never padded.
+    """
+    stride_x, stride_y = _xy_factors(stride, "stride")
+
+    lons, columns, (pad_start, pad_end) = _wrapped_columns(np.asarray(lons))
+    if not pad_seam or extent is None:
+        lons, columns = lons[pad_start:lons.size-pad_end], columns[pad_start:columns.size-pad_end]
+        pad_start = pad_end = 0
+    lats = np.asarray(lats)
+    if extent is None:
+        extent = [-180, 180, -90, 90]
+
+    lon_in_extent = (lons >= extent[0]) & (lons <= extent[1])
+    # a window that reaches past the first (or last) column of the grid needs the padding to interpolate there
+    if pad_start and extent[0] < lons[1] and extent[1] >= lons[0]:
+        lon_in_extent[:2] = True
+    if pad_end and extent[1] > lons[-2] and extent[0] <= lons[-1]:
+        lon_in_extent[-2:] = True
+    col_index = np.flatnonzero(lon_in_extent)
+    row_index = np.flatnonzero((lats >= extent[2]) & (lats <= extent[3]))
+    if col_index.size == 0 or row_index.size == 0:
+        raise ValueError("The extent {} does not overlap the grid".format(list(extent)))
+
+    col_index = np.arange(col_index[0], col_index[-1]+1, stride_x)
+    rows = slice(row_index[0], row_index[-1]+1, stride_y)
+    return rows, columns[col_index], lons[col_index], lats[rows]
+
+_READ_CHUNK_CELLS = 1 << 20
+
+def _column_runs(columns):
+    """Splits an array of file columns into strided runs, returned as (stored column slice, output column slice)."""
+    targets = []
+    offset = 0
+    # file columns only decrease at the seam
+    for run in np.split(columns, np.flatnonzero(np.diff(columns) <= 0) + 1):
+        step = run[1] - run[0] if run.size > 1 else 1
+        targets.append((slice(run[0], run[-1]+1, step), slice(offset, offset + run.size)))
+        offset += run.size
+    return targets
+
+def _iter_window_rows(cdf_grid, rows, columns, chunk_rows=None):
+    """Reads the hyperslab given by a row slice and an array of file columns in blocks of rows.
+
+    Yields the first output row of each block with the block's data and mask (None if no cell is masked), with the
+    columns in the order of `columns`.
+    """
+    targets = _column_runs(columns)
+    row_index = np.arange(cdf_grid.shape[0])[rows]
+    if chunk_rows is None:
+        chunk_rows = max(1, _READ_CHUNK_CELLS // columns.size)
+    for r in range(0, row_index.size, chunk_rows):
+        block_rows = row_index[r:r+chunk_rows]
+        row_slice = slice(block_rows[0], block_rows[-1]+1, rows.step)
+        data = mask = None
+        for src, dst in targets:
+            block = cdf_grid[row_slice, src]
+            if data is None:
+                data = np.empty((block_rows.size, columns.size), dtype=block.dtype)
+            data[:, dst] = np.ma.getdata(block)
+            if np.ma.is_masked(block):
+                if mask is None:
+                    mask = np.zeros(data.shape, dtype=bool)
+                mask[:, dst] = np.ma.getmaskarray(block)
+        yield r, data, mask
+
+def _read_window(cdf_grid, rows, columns, wrap_view=False):
+    """Reads the hyperslab of a netCDF variable given by a row slice and an array of file columns. 
+
+    The columns are read as strided runs, so a window that crosses the seam of a 0-360 degree grid costs two reads
+    per block of rows. Blocks are copied straight into the output, so the peak memory stays close to the size of the 
+    window. With `wrap_view`, a window of contiguous columns that crosses the seam and spans most of the stored 
+    columns is kept in stored order and returned as a LonWrappedGrid.
+    """
+    start, stop = columns.min(), columns.max() + 1
+    view = wrap_view and len(_column_runs(columns)) > 1 and np.all(np.diff(columns)[np.diff(columns) > 0] == 1) \
+        and stop - start <= 2 * columns.size
+    read_columns = np.arange(start, stop) if view else columns
+
+    data = mask = None
+    for r, block, block_mask in _iter_window_rows(cdf_grid, rows, read_columns):
+        if data is None:
+            data = np.empty((len(range(*rows.indices(cdf_grid.shape[0]))), read_columns.size), dtype=block.dtype)
+        data[r:r+block.shape[0]] = block
+        if block_mask is not None:
+            if mask is None:
+                mask = np.zeros(data.shape, dtype=bool)
+            mask[r:r+block.shape[0]] = block_mask
+
+    grid = np.ma.MaskedArray(data, mask=np.ma.nomask if mask is None else mask)
+    if view:
+        return LonWrappedGrid(grid, columns - start)
+    return grid
+
+def _read_blocks(cdf_grid, rows, columns, block, block_method):
+    """Reads the hyperslab given by a row slice and an array of file columns, reduced to the mean or median of each
+    (blockY, blockX) block of cells. 
+
+    Rows are read a whole number of blocks at a time and reduced straight away, so only the output grid and one 
+    block of rows are held in memory. Masked and NaN cells are left out; blocks with no valid cell are masked.
+    """
+    if block_method not in ["mean", "median"]:
+        raise ValueError("block_method must be 'mean' or 'median' (block_method = {})".format(block_method))
+    reduce = np.nanmean if block_method == "mean" else np.nanmedian
+    block_x, block_y = block
+    nrows = len(range(*rows.indices(cdf_grid.shape[0]))) // block_y
+    ncols = columns.size // block_x
+    if nrows == 0 or ncols == 0:
+        raise ValueError("The block {} is larger than the window read".format(block))
+
+    rows = slice(rows.start, rows.start + nrows * block_y * (rows.step or 1), rows.step)
+    columns = columns[:ncols * block_x]
+    chunk_rows = max(1, _READ_CHUNK_CELLS // (columns.size * block_y)) * block_y
+    data = None
+    for r, values, mask in _iter_window_rows(cdf_grid, rows, columns, chunk_rows):
+        values = values.astype(float)
+        if mask is not None:
+            values[mask] = np.nan
+        values = values.reshape(-1, block_y, ncols, block_x).transpose(0, 2, 1, 3).reshape(-1, ncols, block_y * block_x)
+        if data is None:
+            data = np.empty((nrows, ncols))
+        with warnings.catch_warnings():
+            # blocks without a valid cell
+            warnings.simplefilter("ignore", RuntimeWarning)
+            data[r // block_y:r // block_y + values.shape[0]] = reduce(values, axis=-1)
+    return np.ma.masked_invalid(data)
+
+def _block_coords(coords, factor):
+    """Returns the centre coordinate of each complete block of `factor` coordinates."""
+    n = coords.size // factor
+    return np.asarray(coords[:n * factor], dtype=float).reshape(n, factor).mean(axis=1)
+
+def _netcdf_grid_coords(filename, resample=None, extent=None, stride=None, block=None, block_method="mean"):
+    """Returns the lon, lat arrays that read_netcdf_grid gives for the same arguments, without reading the grid."""
+    import netCDF4
+
+    with netCDF4.Dataset(filename, 'r') as cdf:
+        cdf_lon, cdf_lat = _netcdf_coords(cdf)
+    rows, columns, cdf_lon, cdf_lat = _netcdf_window(cdf_lon, cdf_lat, extent, stride, pad_seam=block is None)
+    if block is not None:
+        block_x, block_y = _xy_factors(block, "block")
+        cdf_lon, cdf_lat = _block_coords(cdf_lon, block_x), _block_coords(cdf_lat, block_y)
+    if resample is not None:
+        cdf_lon, cdf_lat = _resample_coords(cdf_lon, cdf_lat, resample)
+    return cdf_lon, cdf_lat
+
+def _resample_coords(lons, lats, resample):
+    """Returns the lon, lat arrays of a grid resampled to a (spacingX, spacingY) spacing."""
+    spacingX, spacingY = resample
+    return _spaced_coords(lons, spacingX), _spaced_coords(lats, spacingY)
+
+def _spaced_coords(coords, spacing):
+    """Returns coordinates from the minimum of `coords` up to (and not past) their maximum, at the given spacing."""
+    start, stop = coords.min(), coords.max()
+    count = int(np.floor((stop - start) / spacing + 1e-9)) + 1
+    return start + spacing * np.arange(count)
+
+def read_netcdf_grid(filename, return_grids=False, resample=None, extent=None, stride=None, wrap_view=False,
+                     block=None, block_method="mean"):
     """Reads in a netCDF file and re-aligns its grid, lat and lon variables from -180 to 180 degrees.
 
     Can optionally resample grid if given required spacing in X and Y direction. Depending on user preference, it can 
-    return the grid read from the file, or the grid along with its associated lat, lon arrays.
+    return the grid read from the file, or the grid along with its associated lat, lon arrays. Only the part of the 
+    grid inside `extent` (and every `stride`-th row and column of it) is read from the file, so regional windows of 
+    large grids do not load the whole grid into memory. Grids can also be downsampled while they are read, by 
+    decimating with `stride` or by averaging blocks of cells with `block`, so that the memory used follows the size 
+    of the output grid.
     
     Parameters
     ----------
@@ -74,42 +299,60 @@ def read_netcdf_grid(filename, return_grids=False, resample=None):
         Optionally resample grid, pass spacing in X and Y direction as a tuple
         e.g. resample=(spacingX, spacingY)
 
+    extent : 1D numpy array, default=None
+        Optionally read only the window [min lon, max lon, min lat, max lat], given in degrees between -180 and 180. 
+        Windows crossing the seam of a 0 to 360 degree grid are read in two parts.
+        A window of a global grid that does not reach -180 or 180 degrees (e.g. one stored with longitudes from 0 to 
+        359.5) is padded with the column across the seam if it reaches into the gap there, so it can be sampled up to
+        the seam. Without an extent, the grid is read as stored.
+
+    stride : int or tuple, default=None
+        Optionally read only every stride-th column and row, given as one integer or as (strideX, strideY).
+
+    wrap_view : bool, default=False
+        If the grid is stored with longitudes from 0 to 360 degrees, return it as a LonWrappedGrid view of the stored
+        columns rather than copying it into -180 to 180 degree order, which halves the peak memory of the read.
+
+    block : int or tuple, default=None
+        Optionally reduce every block of cells, given as one integer or as (blockX, blockY), to one cell while reading.
+        Incomplete blocks at the end of the window are dropped, and the lon, lat of each cell are the block centres.
+        Blocks are taken from the stored columns only, without any padding across the seam. Cannot be combined with 
+        `stride`.
+
+    block_method : str, default=’mean’
+        How blocks are reduced, either "mean" or "median". Masked and NaN cells are ignored.
+
     Returns
     -------
     cdf_grid_z : array-like
         A numpy array of the grid defined by the supplied netCDF4 file. Can be resampled if given a specific spacing in 
-        the X and Y directions. Entries are rescaled using longitudes between -180 and 180 degrees.
+        the X and Y directions. Entries are rescaled using longitudes between -180 and 180 degrees. A LonWrappedGrid if
+        `wrap_view` is set and the grid has to be re-aligned.
 
     cdf_lon, cdf_lat : array-like
         Numpy arrays encasing longitude and latitude variables belonging to the supplied netCDF4 file. Longitudes are 
-        rescaled between -180 and 180 degrees.  
+        rescaled between -180 and 180 degrees, plus any padding column across the seam.
     """
     import netCDF4
     
     # open netCDF file and re-align from -180, 180 degrees
     with netCDF4.Dataset(filename, 'r') as cdf:
         cdf_grid = cdf["z"]
-        try:
-            cdf_lon = cdf['lon'][:]
-            cdf_lat = cdf['lat'][:]
-        except:
-            cdf_lon = cdf['x'][:]
-            cdf_lat = cdf['y'][:]
-            
-        cdf_lon_mask = cdf_lon[:] > 180
-        dlon = np.diff(cdf_lon[:]).mean()
-        
-        if cdf_lon_mask.any():
-            cdf_grid_z = np.hstack([cdf_grid[:,cdf_lon_mask], cdf_grid[:,~cdf_lon_mask]])
-            cdf_lon = np.hstack([cdf_lon[cdf_lon_mask]-360-dlon, cdf_lon[~cdf_lon_mask]])
+        cdf_lon, cdf_lat = _netcdf_coords(cdf)
+
+        rows, columns, cdf_lon, cdf_lat = _netcdf_window(cdf_lon, cdf_lat, extent, stride, pad_seam=block is None)
+        if block is not None:
+            if stride is not None:
+                raise ValueError("Supply either a stride or a block to downsample with")
+            block = _xy_factors(block, "block")
+            cdf_grid_z = _read_blocks(cdf_grid, rows, columns, block, block_method)
+            cdf_lon, cdf_lat = _block_coords(cdf_lon, block[0]), _block_coords(cdf_lat, block[1])
         else:
-            cdf_grid_z = cdf_grid[:]
+            cdf_grid_z = _read_window(cdf_grid, rows, columns, wrap_view or resample is not None)
 
     # resample
     if resample is not None:
-        spacingX, spacingY = resample
-        lon_grid = np.arange(cdf_lon.min(), cdf_lon.max()+spacingX, spacingX)
-        lat_grid = np.arange(cdf_lat.min(), cdf_lat.max()+spacingY, spacingY)
+        lon_grid, lat_grid = _resample_coords(cdf_lon, cdf_lat, resample)
         lonq, latq = np.meshgrid(lon_grid, lat_grid)
         interp = RegularGridInterpolator((cdf_lat, cdf_lon), cdf_grid_z, method='nearest', bounds_error=False)
         cdf_grid_z = interp((latq, lonq))
@@ -174,11 +417,238 @@ def write_netcdf_grid(filename, grid, extent=[-180,180,-90,90]):
 
 
 
+class LonWrappedGrid(object):
+    """A read-only view of a grid stored with longitudes from 0 to 360 degrees, indexed as if its columns were 
+    re-aligned from -180 to 180 degrees.
+
+    The grid keeps its original storage; indexing maps every requested column to the stored column that holds it, 
+    so slices that do not cross the seam are views and only the selected cells are copied otherwise. A contiguous 
+    array is made only when one is requested explicitly, with `copy()` or `np.asarray` (which, unlike `copy()`, drops
+    the mask of a masked grid). The view does not support arithmetic or array methods; copy it first.
+
+    Attributes
+    ----------
+    values : ndarray
+        The grid in its stored column order.
+    columns : ndarray
+        The stored column of each re-aligned column.
+    shape
+    ndim
+    dtype
+
+    Methods
+    -------
+    __getitem__(self, key)
+        Indexes the grid in re-aligned column order.
+    copy(self)
+        Returns the grid as a contiguous array in re-aligned column order.
+    """
+    def __init__(self, values, columns):
+        """Constructs all necessary attributes for the LonWrappedGrid object.
+
+        Parameters
+        ----------
+        values : ndarray
+            The stored grid, with rows of latitude and columns of longitude.
+        columns : 1d array of int
+            The stored column of each re-aligned column, e.g. the columns above 180 degrees followed by the rest.
+        """
+        self.values = values
+        self.columns = np.asarray(columns, dtype=np.intp)
+
+    @property
+    def shape(self):
+        return (self.values.shape[0], self.columns.size) + self.values.shape[2:]
+
+    @property
+    def ndim(self):
+        return self.values.ndim
+
+    @property
+    def dtype(self):
+        return self.values.dtype
+
+    @property
+    def size(self):
+        return int(np.prod(self.shape))
+
+    def __len__(self):
+        return self.shape[0]
+
+    def __getitem__(self, key):
+        if not isinstance(key, tuple):
+            key = (key,)
+        if len(key) == 1 and np.ndim(key[0]) > 1:
+            # e.g. a boolean mask of the whole grid
+            return self.copy()[key]
+        row_key, col_key = key[0], key[1] if len(key) > 1 else slice(None)
+        cols = self.columns[col_key]
+
+        if isinstance(col_key, slice):
+            # evenly spaced columns that do not cross the seam are a view of the storage
+            step = cols[1] - cols[0] if cols.size > 1 else 1
+            if cols.size and step > 0 and np.all(np.diff(cols) == step):
+                return self.values[(row_key, slice(cols[0], cols[-1]+1, step)) + key[2:]]
+            if np.ndim(row_key) > 0:
+                return self.values[row_key][(slice(None), cols) + key[2:]]
+        return self.values[(row_key, cols) + key[2:]]
+
+    def copy(self):
+        """Returns the grid as a contiguous array with columns re-aligned from -180 to 180 degrees (a masked array if 
+        the stored grid is masked)."""
+        return np.take(self.values, self.columns, axis=1)
+
+    def __array__(self, dtype=None, copy=None):
+        array = np.asarray(self.copy())
+        return array if dtype is None else array.astype(dtype, copy=False)
+
+
+def _lon_wrapped(values, columns):
+    """Returns a LonWrappedGrid of the given columns of a grid (or of a LonWrappedGrid, without nesting the views)."""
+    if isinstance(values, LonWrappedGrid):
+        return LonWrappedGrid(values.values, values.columns[columns])
+    return LonWrappedGrid(values, columns)
+
+def _seam_interpolator(lats, lons, values, method="linear"):
+    """Returns a RegularGridInterpolator of a 2D grid and the column of the grid held by each of its columns.
+
+    A global longitude axis with a gap at the seam is padded across it (see _seam_columns) with a LonWrappedGrid view 
+    of the grid, so points in the gap are interpolated without copying the grid. The columns are None if the axis is 
+    not padded.
+    """
+    seam = _seam_columns(np.asarray(lons))
+    if seam is None or np.ndim(values) != 2:
+        return RegularGridInterpolator((lats, lons), values, method=method), None
+    padded_lons, columns = seam
+    return RegularGridInterpolator((lats, padded_lons), _lon_wrapped(values, columns), method=method), columns
+
+def _sample_coords(xi, ndim):
+    """Returns sample point coordinates, given as a tuple of arrays or as one array of shape (..., ndim), as a list of 
+    flat coordinate arrays (one per dimension) and the shape of the sample points.
+
+    The shapes follow scipy's RegularGridInterpolator: a tuple of scalar coordinates is one point of shape (), and a 
+    1D array is read as consecutive points of `ndim` coordinates, so a single point given that way has shape (1,).
+    """
+    if isinstance(xi, tuple) and len(xi) > 1:
+        arrays = np.broadcast_arrays(*[np.asarray(x, dtype=float) for x in xi])
+        shape = arrays[0].shape
+        coords = [a.ravel() for a in arrays]
+    else:
+        xi = np.asarray(xi[0] if isinstance(xi, tuple) else xi, dtype=float)
+        if xi.ndim == 1:
+            xi = xi.reshape(-1, ndim)
+        shape = xi.shape[:-1]
+        coords = [xi[..., k].ravel() for k in range(xi.shape[-1])]
+    if len(coords) != ndim:
+        raise ValueError("The requested sample points xi have dimension "
+                         "%d, but this RegularGridInterpolator has "
+                         "dimension %d" % (len(coords), ndim))
+    return coords, shape
+
+def _uniform_spacing(points, dtype=None):
+    """Returns the (first point, step) of an evenly spaced axis, or None if the spacing is not regular.
+
+    Points may deviate from even spacing by the rounding error of the floating-point type `dtype` that the axis was 
+    stored in (by default, the type of `points`), so that e.g. float32 axes read from netCDF files are accepted.
+    """
+    if points.size < 2:
+        return None
+    if dtype is None:
+        dtype = points.dtype
+    eps = np.finfo(dtype if np.issubdtype(dtype, np.floating) else float).eps
+    step = (points[-1] - points[0]) / (points.size - 1)
+    tolerance = max(1e-6 * step, 8 * eps * max(abs(points[0]), abs(points[-1])))
+    if np.abs(points - (points[0] + step * np.arange(points.size))).max() > tolerance:
+        return None
+    return points[0], step
+
+def _find_grid_indices(grid, xi, spacings=None):
+    """Finds the lower cell index and the normalised distance into the cell of each coordinate along each grid axis.
+
+    Axes with a (first point, step) in `spacings` are indexed arithmetically; the others are binary searched.
+    """
+    if spacings is None:
+        spacings = [None] * len(grid)
+    indices = []
+    norm_distances = []
+    out_of_bounds = np.zeros(xi[0].shape, dtype=bool)
+    for x, g, spacing in zip(xi, grid, spacings):
+        if spacing is not None:
+            u = x - spacing[0]
+            u /= spacing[1]
+            # fmin/fmax keep NaN coordinates from becoming invalid indices
+            i = np.floor(np.fmax(np.fmin(u, g.size - 2), 0)).astype(np.intp)
+            u -= i
+            norm_distances.append(u)
+        else:
+            i = np.searchsorted(g, x) - 1
+            np.clip(i, 0, g.size - 2, out=i)
+            norm_distances.append((x - g[i]) / (g[i+1] - g[i]))
+        indices.append(i)
+        # NaN coordinates count as out of bounds
+        out_of_bounds |= ~((x >= g[0]) & (x <= g[-1]))
+    return indices, norm_distances, out_of_bounds
+
+def _evaluate_linear(values, indices, norm_distances):
+    """Interpolates linearly between the values at the corners of the grid cells found by _find_grid_indices."""
+    vslice = (slice(None),) + (None,)*(values.ndim - len(indices))
+    result = 0.0
+    for corner in itertools.product((0, 1), repeat=len(indices)):
+        weight = 1.0
+        for upper, yi in zip(corner, norm_distances):
+            weight = weight * (yi if upper else 1 - yi)
+        edge_indices = tuple(i + upper for i, upper in zip(indices, corner))
+        result = result + np.asarray(values[edge_indices]) * weight[vslice]
+    return result
+
+def _evaluate_nearest(values, indices, norm_distances):
+    """Takes the value at the grid node nearest to each point of the cells found by _find_grid_indices."""
+    idx_res = tuple(np.where(yi <= .5, i, i + 1) for i, yi in zip(indices, norm_distances))
+    return np.asarray(values[idx_res])
+
+def _evaluate_2d(values, indices, norm_distances, method, out=None):
+    """Evaluates a 2D grid (or LonWrappedGrid) in one pass, gathering straight from the stored array.
+
+    Linear interpolation is done as two interpolations along the rows and one between them, in place.
+    """
+    (i0, t0), (i1, t1) = zip(indices, norm_distances)
+    if isinstance(values, LonWrappedGrid):
+        storage, columns = np.asarray(values.values), values.columns
+    else:
+        storage, columns = np.asarray(values), None
+
+    if method == "nearest":
+        rows = np.where(t0 <= .5, i0, i0 + 1)
+        cols = np.where(t1 <= .5, i1, i1 + 1)
+        if columns is not None:
+            cols = columns[cols]
+        result = storage[rows, cols]
+        if out is None:
+            return result
+        out[...] = result
+        return out
+
+    c0, c1 = (i1, i1 + 1) if columns is None else (columns[i1], columns[i1 + 1])
+    lower = storage[i0, c0].astype(float)
+    step = np.subtract(storage[i0, c1], lower)
+    step *= t1
+    lower += step
+    upper = storage[i0 + 1, c0].astype(float)
+    np.subtract(storage[i0 + 1, c1], upper, out=step)
+    step *= t1
+    upper += step
+    upper -= lower
+    upper *= t0
+    return np.add(lower, upper, out=out)
+
+
 class RegularGridInterpolator(_RGI):
     """A class to sample gridded data at a set of point coordinates using either linear or nearest-neighbour 
     interpolation methods.
 
-    It is a child class of the scipy.interpolate module’s RegularGridInterpolator class. 
+    It is a child class of the scipy.interpolate module’s RegularGridInterpolator class, but keeps its own grid and 
+    values and evaluates them itself. Cell indices along evenly spaced axes (e.g. lons and lats built with linspace or 
+    arange) are computed arithmetically instead of by binary search.
 
     Attributes
     ----------
@@ -192,7 +662,7 @@ class RegularGridInterpolator(_RGI):
     -------
     __init__(self, points, values, method="linear", bounds_error=False, fill_value=np.nan)
         Constructs all necessary attributes for the RegularGridInterpolator object.
-    __call__(self, xi, method=None, return_indices=False, return_distances=False)
+    __call__(self, xi, method=None, return_indices=False, return_distances=False, out=None)
         Allows the RegularGridInterpolator object to be called as a method.
     """
     def __init__(self, points, values, method="linear", bounds_error=False, fill_value=np.nan):
@@ -215,9 +685,52 @@ class RegularGridInterpolator(_RGI):
         fill_value : float, default=np.nan
             Used to replace point values that are out of grid bounds, provided that ‘bounds_error’ is false.
         """ 
-        super(RegularGridInterpolator, self).__init__(points, values, method, bounds_error, fill_value)
-
-    def __call__(self, xi, method=None, return_indices=False, return_distances=False):
+        if method not in ["linear", "nearest"]:
+            raise ValueError("Method '%s' is not defined" % method)
+        if not hasattr(values, 'ndim'):
+            values = np.asarray(values)
+        if len(points) > values.ndim:
+            raise ValueError("There are %d point arrays, but values has %d "
+                             "dimensions" % (len(points), values.ndim))
+        if not np.issubdtype(values.dtype, np.inexact):
+            values = np.asarray(values).astype(float)
+
+        grid = []
+        dtypes = []
+        for i, p in enumerate(points):
+            dtypes.append(np.asarray(p).dtype)
+            p = np.asarray(p, dtype=float)
+            if p.ndim != 1 or p.size != values.shape[i]:
+                raise ValueError("There are %d points in dimension %d, but values has "
+                                 "%d values in that dimension" % (p.size, i, values.shape[i]))
+            if p.size > 1 and p[0] > p[-1]:
+                # descending axes are flipped, which is a view for arrays and for the rows of a LonWrappedGrid
+                p = p[::-1]
+                if isinstance(values, LonWrappedGrid) and i == 0:
+                    values = LonWrappedGrid(values.values[::-1], values.columns)
+                else:
+                    values = np.flip(np.asarray(values), axis=i)
+            if not np.all(np.diff(p) > 0.):
+                raise ValueError("The points in dimension %d must be strictly ascending or descending" % i)
+            grid.append(p)
+
+        # the grid and values are kept here rather than by scipy, which converts them to arrays on every access
+        self._grid_points = tuple(grid)
+        self._spacings = [_uniform_spacing(p, dtype) for p, dtype in zip(grid, dtypes)]
+        self._grid_values = values
+        self.method = method
+        self.bounds_error = bounds_error
+        self.fill_value = fill_value
+
+    @property
+    def grid(self):
+        return self._grid_points
+
+    @property
+    def values(self):
+        return self._grid_values
+
+    def __call__(self, xi, method=None, return_indices=False, return_distances=False, out=None):
         """Samples gridded data at a set of point coordinates. Uses either linear or nearest-neighbour interpolation methods.
 
         Uses the gridded data specified in the sample_grid method parameter. Note: if any provided sample points are out of 
@@ -240,6 +753,9 @@ class RegularGridInterpolator(_RGI):
         return_distances : bool, default=False
             Choose whether to return normal distances between interpolated points and neighbouring sampling points.
 
+        out : ndarray, optional
+            A contiguous array with the shape of the sample points to write the interpolated grid data into.
+
         Returns
         -------
         output_tuple : tuple of ndarrays
@@ -251,45 +767,45 @@ class RegularGridInterpolator(_RGI):
         ValueError
             * Raised if the string method supplied is not “linear” or “nearest”.
             * Raised if the provided sample points for interpolation (xi) do not have the same dimensions as the supplied grid. 
+            * Raised if ‘out’ is not a contiguous array with the shape of the sample points.
             * Raised if the provided sample points for interpolation include any point out of grid bounds. Alerts user which
             dimension (index) the point is located. Only raised if the RegularGridInterpolator attribute bounds_error is set
             to True. If suppressed, out-of-bound points are replaced with a set fill_value. 
         """
-        from scipy.interpolate.interpnd import _ndim_coords_from_arrays
         method = self.method if method is None else method
         if method not in ["linear", "nearest"]:
             raise ValueError("Method '%s' is not defined" % method)
 
         ndim = len(self.grid)
-        xi = _ndim_coords_from_arrays(xi, ndim=ndim)
-        if xi.shape[-1] != len(self.grid):
-            raise ValueError("The requested sample points xi have dimension "
-                             "%d, but this RegularGridInterpolator has "
-                             "dimension %d" % (xi.shape[1], ndim))
-
-        xi_shape = xi.shape
-        xi = xi.reshape(-1, xi_shape[-1])
+        xi, xi_shape = _sample_coords(xi, ndim)
+        result_shape = xi_shape + self.values.shape[ndim:]
+        if out is not None:
+            if out.shape != result_shape or not out.flags.c_contiguous:
+                raise ValueError("out must be a contiguous array of shape {}".format(result_shape))
 
         if self.bounds_error:
-            for i, p in enumerate(xi.T):
+            for i, p in enumerate(xi):
                 if not np.logical_and(np.all(self.grid[i][0] <= p),
                                       np.all(p <= self.grid[i][-1])):
                     raise ValueError("One of the requested xi is out of bounds "
                                      "in dimension %d" % i)
 
-        indices, norm_distances, out_of_bounds = self._find_indices(xi.T)
-        if method == "linear":
-            result = self._evaluate_linear(indices,
-                                           norm_distances,
-                                           out_of_bounds)
-        elif method == "nearest":
-            result = self._evaluate_nearest(indices,
-                                            norm_distances,
-                                            out_of_bounds)
+        indices, norm_distances, out_of_bounds = _find_grid_indices(self.grid, xi, self._spacings)
+        flat_out = None if out is None else out.reshape(-1)
+        if ndim == 2 and self.values.ndim == 2:
+            result = _evaluate_2d(self.values, indices, norm_distances, method, flat_out)
+        else:
+            if method == "linear":
+                result = _evaluate_linear(self.values, indices, norm_distances)
+            elif method == "nearest":
+                result = _evaluate_nearest(self.values, indices, norm_distances)
+            if flat_out is not None:
+                flat_out[...] = result.reshape(flat_out.shape)
+                result = flat_out
         if not self.bounds_error and self.fill_value is not None:
             result[out_of_bounds] = self.fill_value
             
-        interp_output = result.reshape(xi_shape[:-1] + self.values.shape[ndim:])
+        interp_output = out if out is not None else result.reshape(result_shape)
         output_tuple = [interp_output]
 
         if return_indices:
@@ -303,6 +819,144 @@ class RegularGridInterpolator(_RGI):
             return output_tuple[0]
 
 
+class SamplingPlan(object):
+    """A precomputed set of grid cell indices and interpolation weights for sampling many co-registered grids at the 
+    same points.
+
+    The cells and weights of each point are found once for a grid geometry (its lons and lats). Every grid with that 
+    geometry, or a 3D stack of them, is then sampled with one gather and a weighted sum, so N interpolations cost one 
+    index computation and N gathers. Results match RegularGridInterpolator and Raster.interpolate.
+
+    Attributes
+    ----------
+    method
+    fill_value
+    shape
+    indices
+    weights
+    out_of_bounds
+
+    Methods
+    -------
+    __init__(self, lons, lats, grid_lons, grid_lats, method='linear', fill_value=np.nan)
+        Constructs all necessary attributes for the SamplingPlan object.
+    __call__(self, grid, out=None)
+        Samples a grid, or a stack of grids, at the points of the plan.
+    """
+    def __init__(self, lons, lats, grid_lons, grid_lats, method='linear', fill_value=np.nan):
+        """Constructs all necessary attributes for the SamplingPlan object.
+
+        Parameters
+        ----------
+        lons, lats : ndarray
+            Longitudes and latitudes of the points to sample.
+
+        grid_lons, grid_lats : 1d arrays
+            The longitudes of the grid columns and latitudes of the grid rows (e.g. Raster.lons and Raster.lats).
+
+        method : str, default=’linear’
+            The method of interpolation to perform. Supported are "linear" and "nearest".
+
+        fill_value : float, default=np.nan
+            The value given to points outside the grid.
+        """
+        if method not in ["linear", "nearest"]:
+            raise ValueError("Method '%s' is not defined" % method)
+        dtypes = [np.asarray(grid_lats).dtype, np.asarray(grid_lons).dtype]
+        grid = [np.asarray(grid_lats, dtype=float), np.asarray(grid_lons, dtype=float)]
+        descending = [False, False]
+        for i, p in enumerate(grid):
+            if p.ndim == 1 and p.size > 1 and p[0] > p[-1]:
+                grid[i] = p[::-1]
+                descending[i] = True
+            if p.ndim != 1 or p.size < 2 or not np.all(np.diff(grid[i]) > 0.):
+                raise ValueError("The points in dimension %d must be strictly ascending or descending" % i)
+        (lats, lons), self._points_shape = _sample_coords((lats, lons), 2)
+
+        self.method = method
+        self.fill_value = fill_value
+        self.shape = (grid[0].size, grid[1].size)
+
+        # points in the gap at the seam of a global grid are found on the longitudes padded across it
+        seam = _seam_columns(grid[1])
+        if seam is not None:
+            grid[1], seam_columns = seam
+        (i0, i1), (t0, t1), self.out_of_bounds = _find_grid_indices(
+            grid, (lats, lons), [_uniform_spacing(p, dtype) for p, dtype in zip(grid, dtypes)]
+        )
+        if method == "nearest":
+            corners = [(np.where(t0 <= .5, i0, i0 + 1), np.where(t1 <= .5, i1, i1 + 1))]
+            self.weights = None
+        else:
+            # the four cell corners and their weights, each of shape (4, n)
+            corners = [(i0, i1), (i0, i1 + 1), (i0 + 1, i1), (i0 + 1, i1 + 1)]
+            self.weights = np.stack([(1 - t0) * (1 - t1), (1 - t0) * t1, t0 * (1 - t1), t0 * t1])
+        rows = np.stack([r for r, c in corners])
+        cols = np.stack([c for r, c in corners])
+        if seam is not None:
+            cols = seam_columns[cols]
+        if descending[0]:
+            rows = self.shape[0] - 1 - rows
+        if descending[1]:
+            cols = self.shape[1] - 1 - cols
+        self.indices = rows * self.shape[1] + cols
+
+    def __call__(self, grid, out=None):
+        """Samples a grid, or a stack of grids, at the points of the plan.
+
+        Parameters
+        ----------
+        grid : ndarray or LonWrappedGrid
+            Either one grid with the shape the plan was made for, or a 3D stack of them with shape (ngrids, nlats, nlons).
+
+        out : ndarray, optional
+            An array with the shape of the sampled points (preceded by ngrids for a stack) to write the result into.
+
+        Returns
+        -------
+        ndarray
+            The sampled values, with the shape of the points given to the plan, preceded by ngrids for a stack of grids.
+        """
+        if isinstance(grid, LonWrappedGrid):
+            if grid.shape != self.shape:
+                raise ValueError("The grid has shape {}, but the plan was made for {}".format(grid.shape, self.shape))
+            # map the re-aligned columns onto the stored ones
+            rows, cols = np.divmod(self.indices, self.shape[1])
+            storage = np.asarray(grid.values)
+            flat_grids = [storage.reshape(-1)]
+            indices = rows * storage.shape[1] + grid.columns[cols]
+            stack_shape = ()
+        else:
+            grid = np.asarray(grid)
+            if grid.shape[-2:] != self.shape or grid.ndim not in (2, 3):
+                raise ValueError("The grid has shape {}, but the plan was made for {}".format(grid.shape, self.shape))
+            flat_grids = grid.reshape(-1, grid.shape[-2] * grid.shape[-1])
+            indices = self.indices
+            stack_shape = grid.shape[:-2]
+
+        result_shape = stack_shape + self._points_shape
+        in_place = out is not None and out.shape == result_shape and out.dtype == float and out.flags.c_contiguous
+        if in_place:
+            result = out.reshape(len(flat_grids), -1)
+        else:
+            result = np.empty((len(flat_grids), indices.shape[1]))
+        for flat_grid, row in zip(flat_grids, result):
+            # one gather of all corners, then the weighted sum
+            values = flat_grid[indices]
+            if self.weights is None:
+                row[:] = values[0]
+            else:
+                np.einsum('ij,ij->j', values, self.weights, out=row)
+        if self.fill_value is not None:
+            result[:, self.out_of_bounds] = self.fill_value
+
+        if out is None:
+            return result.reshape(result_shape)
+        if not in_place:
+            out[...] = result.reshape(result_shape)
+        return out
+
+
 def sample_grid(lon, lat, grid, extent=[-180,180,-90,90], return_indices=False, return_distances=False, method='linear'):
     """Samples gridded data at a set of point coordinates. Uses either linear or nearest-neighbour interpolation methods.
     
@@ -317,7 +971,9 @@ def sample_grid(lon, lat, grid, extent=[-180,180,-90,90], return_indices=False,
 
     grid : ndarray
         An array with elements that define a grid. The number of rows corresponds to the number of latitudinal points, while
-        the number of columns corresponds to the number of longitudinal points.
+        the number of columns corresponds to the number of longitudinal points. A 3D stack of grids with the same shape 
+        is sampled in one pass (unless indices or distances are requested). To sample the same points repeatedly, make a
+        SamplingPlan once instead.
 
     extent : 1D numpy array, default=[-180,180,-90,90]
         Four-element array to specify the [min lon, max lon, min lat, max lat] with which to constrain lat and lon sampling
@@ -347,11 +1003,19 @@ def sample_grid(lon, lat, grid, extent=[-180,180,-90,90], return_indices=False,
         dimension (index) the point is located. Only raised if the RegularGridInterpolator attribute bounds_error is set 
         to True. If suppressed, out-of-bound points are replaced with a set fill_value. 
     """
-    interpolator = RegularGridInterpolator((np.linspace(extent[2], extent[3], grid.shape[0]),
-                                            np.linspace(extent[0], extent[1], grid.shape[1])),
-                                            grid, method=method)
+    # a single point is sampled as a 1D array of one point, as with np.c_[lat, lon]
+    lon, lat = np.atleast_1d(lon), np.atleast_1d(lat)
+    grid_lats = np.linspace(extent[2], extent[3], grid.shape[-2])
+    grid_lons = np.linspace(extent[0], extent[1], grid.shape[-1])
+    if not return_indices and not return_distances:
+        return SamplingPlan(lon, lat, grid_lons, grid_lats, method=method)(grid)
 
-    return interpolator(np.c_[lat, lon], return_indices=return_indices, return_distances=return_distances)
+    interpolator, columns = _seam_interpolator(grid_lats, grid_lons, grid, method=method)
+    output_tuple = interpolator(np.c_[lat, lon], return_indices=return_indices, return_distances=return_distances)
+    if return_indices and columns is not None:
+        # index the columns of the grid rather than of the padded longitudes
+        output_tuple[1][1] = columns[output_tuple[1][1]]
+    return output_tuple
 
 
 
@@ -378,16 +1042,21 @@ class Raster(object):
 
     Methods
     -------
-    __init__(self, filename=None, array=None, extent=None, resample=None)
+    __init__(self, filename=None, array=None, extent=None, resample=None, stride=None, lazy=False, block=None, 
+             block_method="mean", wrap_view=False)
         Constructs all necessary attributes for the Raster object.
         
     _update(self)
         Allows RegularGridInterpolator attributes ((self.lats, self.lons), self.data, method='linear') and methods 
         (__call__(), or RegularGridInterpolator) to be accessible from the Raster object.
         
-    interpolate(self, lons, lats, method='linear', return_indices=False, return_distances=False)
+    interpolate(self, lons, lats, method='linear', return_indices=False, return_distances=False, out=None)
         Sample gridded data on a set of points using interpolation from RegularGridInterpolator.
         
+    sampling_plan(self, lons, lats, method='linear')
+        Precomputes the grid cells and weights for sampling this grid, and grids with the same geometry, at a set of 
+        points.
+
     resample(self, spacingX, spacingY, overwrite=False)
         Resamples the grid using X & Y-spaced lat-lon arrays, meshed with linear interpolation.
         
@@ -398,7 +1067,8 @@ class Raster(object):
         Searches for invalid ‘data’ cells containing NaN-type entries and replaces NaNs with the value of the nearest
         valid data cell.
     """
-    def __init__(self, filename=None, array=None, extent=None, resample=None):
+    def __init__(self, filename=None, array=None, extent=None, resample=None, stride=None, lazy=False, block=None,
+                 block_method="mean", wrap_view=False):
         """Constructs all necessary attributes for the raster object.
 
         Note: either a str path to a netCDF file OR an ndarray representing a grid must be specified. 
@@ -414,17 +1084,39 @@ class Raster(object):
 
         extent : 1D numpy array, default=None
             Four-element array to specify [min lon, max lon, min lat, max lat] extents of any sampling points. If no extents are 
-            supplied, full global extent [-180,180,-90,90] is assumed. 
+            supplied, full global extent [-180,180,-90,90] is assumed. When a filename is given, only this window of the grid
+            is read from the file.
 
         resample : tuple, default=None
             Optionally resample grid, pass spacing in X and Y direction as a tuple
             e.g. resample=(spacingX, spacingY)
 
+        stride : int or tuple, default=None
+            Optionally read only every stride-th column and row of the netCDF file, given as one integer or as 
+            (strideX, strideY).
+
+        lazy : bool, default=False
+            If a filename is given, only read the grid coordinates now and read the grid itself on first access to ‘data’.
+
+        block : int or tuple, default=None
+            Optionally reduce every block of cells of the netCDF file to one cell while reading, given as one integer or
+            as (blockX, blockY).
+
+        block_method : str, default=’mean’
+            How blocks are reduced, either "mean" or "median".
+
+        wrap_view : bool, default=False
+            If the netCDF file stores longitudes from 0 to 360 degrees, hold ‘data’ as a LonWrappedGrid view of the stored
+            columns instead of copying it into -180 to 180 degree order, which halves the peak memory of the read. The 
+            view only supports indexing; use data.copy() (which keeps the mask) for a masked array.
+
         Returns
         -------
         __init__ generates the following attributes for the raster object:
         data : ndarray
-            The grid - either a read netCDF4 file, or the ndarray supplied to __init__.
+            The grid - either a read netCDF4 file (as a masked array), or the ndarray supplied to __init__. With 
+            ‘wrap_view’, grids stored with longitudes from 0 to 360 degrees are held as a LonWrappedGrid view of the file
+            columns.
 
         extent : 1d array
             The [min lon, max lon, min lat, max lat] extents supplied to __init__. If not supplied, it is taken to be
@@ -447,7 +1139,17 @@ class Raster(object):
             raise ValueError("Supply either a filename or numpy array")
 
         elif filename is not None:
-            self.data, lons, lats = read_netcdf_grid(filename, return_grids=True, resample=resample)
+            self.filename = filename
+            self._wrap_view = wrap_view
+            self._read_kwargs = dict(
+                resample=resample, extent=extent, stride=stride, block=block, block_method=block_method
+            )
+            if lazy:
+                self._data = None
+                lons, lats = _netcdf_grid_coords(filename, **self._read_kwargs)
+            else:
+                self._data, lons, lats = read_netcdf_grid(
+                    filename, return_grids=True, wrap_view=wrap_view, **self._read_kwargs)
             self.extent = [lons.min(), lons.max(), lats.min(), lats.max()]
             self.lons = lons
             self.lats = lats
@@ -463,19 +1165,38 @@ class Raster(object):
         self._update()
 
 
+    @property
+    def data(self):
+        """The grid, read from the netCDF file on first access if the raster was created with lazy=True."""
+        if self._data is None:
+            self._data = read_netcdf_grid(self.filename, wrap_view=self._wrap_view, **self._read_kwargs)
+        return self._data
+
+    @data.setter
+    def data(self, data):
+        self._data = data
+
+
     def _update(self):
         """Stores the RegularGridInterpolator object’s method for sampling gridded data at a set of point coordinates. 
 
         Allows methods of the Raster object to access grid sampling functionalities. The gridded data used is the “data” 
         attribute - either read from a netCDF4 file, or supplied as an ndarray. Points to sample are either variables of the 
-        netCDF4 file, or are generated from the “extent” attribute and scaled to fit the grid “data”.
+        netCDF4 file, or are generated from the “extent” attribute and scaled to fit the grid “data”. The interpolation 
+        object is built on first use, so a lazy raster is not read until it is sampled. A global grid with a gap at 
+        the seam is padded across it (as a view) within the interpolation object, so it is sampled up to the seam.
         """
-        # store interpolation object
-        interpolator = RegularGridInterpolator((self.lats, self.lons), self.data, method='linear')
-        self._interpolator = interpolator
+        self._interpolator_cache = None
+        self._interpolator_columns = None
+
+    @property
+    def _interpolator(self):
+        if self._interpolator_cache is None:
+            self._interpolator_cache, self._interpolator_columns = _seam_interpolator(self.lats, self.lons, self.data)
+        return self._interpolator_cache
 
 
-    def interpolate(self, lons, lats, method='linear', return_indices=False, return_distances=False):
+    def interpolate(self, lons, lats, method='linear', return_indices=False, return_distances=False, out=None):
         """Samples gridded data at a set of point coordinates and interpolates points on grid. Uses either linear or 
         nearest-neighbour interpolation methods.
 
@@ -498,6 +1219,9 @@ class Raster(object):
         return_distances : bool, default=False
             Choose whether to return normal distances between interpolated points and neighbouring sampling points.
 
+        out : ndarray, optional
+            A contiguous array with the shape of the sample points to write the interpolated grid data into.
+
         Returns
         -------
         data_interp : tuple of ndarrays
@@ -514,10 +1238,36 @@ class Raster(object):
             Alerts user which dimension (index) the point is located. 
         """
         interp = self._interpolator
-        data_interp = interp((lats,lons), method=method, return_indices=return_indices, return_distances=return_distances)
+        data_interp = interp((lats,lons), method=method, return_indices=return_indices, return_distances=return_distances,
+                             out=out)
+        if return_indices and self._interpolator_columns is not None:
+            # index the columns of the grid rather than of the padded longitudes
+            data_interp[1][1] = self._interpolator_columns[data_interp[1][1]]
         return data_interp
 
 
+    def sampling_plan(self, lons, lats, method='linear'):
+        """Precomputes the grid cells and interpolation weights of a set of points on the grid geometry of this raster.
+
+        The returned plan samples the “data” attribute, or any other grid (or 3D stack of grids) with the same lons and
+        lats, without finding the cells again, e.g. plan(raster.data) or plan(np.stack([age, spreading_rate])).
+    
+        Parameters
+        ----------
+        lons, lats : ndarray
+            Longitudes and latitudes of the points to sample.
+
+        method : str, default=’linear’
+            The method of interpolation to perform. Supported are "linear" and "nearest".
+
+        Returns
+        -------
+        plan : SamplingPlan
+            The sampling plan of the points on this grid geometry.
+        """
+        return SamplingPlan(lons, lats, self.lons, self.lats, method=method)
+
+
     def resample(self, spacingX, spacingY, overwrite=False):
         """Resamples the grid using linear interpolation. New grid overwrites the current grid stored in the “data” attribute.
         Optional: can also resample and overwrite the arrays in the lats and lons attributes and overwrite the interpolation
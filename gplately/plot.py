@@ -40,7 +40,8 @@ are plotting methods that use shapefile strings given to the PlotTopologies obje
     * plot_subduction_teeth
 are plotting methods that use the PlotTopologies feature attributes: self.topologies, self.ridge_transforms,
 self.ridges, self.transforms, self.trenches, self.trench_left, self.trench_right and self.other. These features
-have been resolved using Plate Tectonics Tools’ ptt.resolve_topologies.resolve_topologies_into_features method. 
+have been resolved once per reconstruction time by the PlateReconstruction object’s topology_snapshot method, and are
+classified into boundary types in the same way as Plate Tectonics Tools’ ptt.resolve_topologies.resolve_topologies_into_features. 
 
 The following methods:
     *plot_grid
@@ -602,10 +603,7 @@ class PlotTopologies(object):
             Reconstructed features appended to a Python list. 
         """
         self._time = float(time)
-        resolved_topologies = ptt.resolve_topologies.resolve_topologies_into_features(
-            self.PlateReconstruction_object.rotation_model,
-            self.PlateReconstruction_object.topology_features,
-            self.time)
+        resolved_topologies = self.PlateReconstruction_object.topology_snapshot(self.time).get_resolved_features()
 
         self.topologies, self.ridge_transforms, self.ridges, self.transforms, self.trenches, self.trench_left, self.trench_right, self.other = resolved_topologies
 
@@ -1067,9 +1065,9 @@ class PlotTopologies(object):
         """Calculates plate motion velocity vector fields at a particular geological time and plots them onto a 
         standard map. 
         
-        Generates velocity domain feature collections (MeshNode-type features) from given spacing in the X and Y 
-        directions. Domain points are extracted from these features and assigned plate IDs, which are used to obtain
-        equivalent stage rotations of identified tectonic plates over a 5 Ma time interval. Each point and its stage 
+        Generates a lat-lon mesh of domain points from given spacing in the X and Y directions. Domain points are
+        assigned plate IDs, which are used to obtain equivalent stage rotations of identified tectonic plates over a
+        5 Ma time interval (through the rotation cache of the PlateReconstruction object). Each point and its stage 
         rotation are used to calculate plate velocities at a particular geological time. Obtained velocities for each
         domain point are represented in the north-east-down coordinate system.
         
@@ -1104,22 +1102,16 @@ class PlotTopologies(object):
         lats = np.arange(-90, 90+spacingY, spacingY)
         lonq, latq = np.meshgrid(lons, lats)
 
-        # create a feature from all the points
-        velocity_domain_features = ptt.velocity_tools.make_GPML_velocity_feature(lonq.ravel(), latq.ravel())
-
-        rotation_model = self.PlateReconstruction_object.rotation_model
-        topology_features = self.PlateReconstruction_object.topology_features
-
         delta_time = 5.0
-        all_velocities = ptt.velocity_tools.get_plate_velocities(
-            velocity_domain_features,
-            topology_features,
-            rotation_model,
+        all_velocities = self.PlateReconstruction_object.get_point_velocities(
+            lonq.ravel(),
+            latq.ravel(),
             self.time,
-            delta_time,
-            'vector_comp')
+            delta_time=delta_time)
 
-        X, Y, U, V = ptt.velocity_tools.get_x_y_u_v(lons, lats, all_velocities)
+        X, Y = lons, lats
+        U = all_velocities[:,1].reshape(lonq.shape)
+        V = all_velocities[:,0].reshape(lonq.shape)
 
         if normalise:
             mag = np.hypot(U, V)
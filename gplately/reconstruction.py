@@ -2,6 +2,10 @@
 
 Classes
 -------
+RotationCache
+RotationTable
+PlateIdRaster
+TopologySnapshot
 PlateReconstruction
 Points
 """
@@ -9,10 +13,714 @@ import pygplates
 import numpy as np
 import ptt
 import warnings
+import os
+import hashlib
+import time as _time
+from scipy import ndimage as _ndimage
+from collections import OrderedDict, namedtuple
+from multiprocessing import Pool, get_start_method
 
 from . import tools as _tools
 
 
+def _partition_points(plate_partitioner, lons, lats):
+    """Partitions lat-lon points into plates and returns the plate ID of each point (-1 where a point is not
+    partitioned into any plate).
+    """
+    plate_ids = np.full(len(lons), -1, dtype=int)
+    for i, (lon, lat) in enumerate(zip(lons, lats)):
+        partitioning_plate = plate_partitioner.partition_point(pygplates.PointOnSphere(float(lat), float(lon)))
+        if partitioning_plate:
+            plate_ids[i] = partitioning_plate.get_feature().get_reconstruction_plate_id()
+    return plate_ids
+
+
+def _boundary_lat_lons(partitioning_plate, tessellate_radians):
+    """Yields (lats, lons) arrays of the tessellated boundary rings of a reconstructed or resolved plate geometry."""
+    if hasattr(partitioning_plate, "get_resolved_boundary"):
+        geometry = partitioning_plate.get_resolved_boundary()
+    else:
+        geometry = partitioning_plate.get_reconstructed_geometry()
+
+    if isinstance(geometry, pygplates.PolygonOnSphere):
+        geometry = geometry.to_tessellated(tessellate_radians)
+        rings = [geometry.get_exterior_ring_points()]
+        rings.extend(geometry.get_interior_ring_points(i) for i in range(geometry.get_number_of_interior_rings()))
+        for ring in rings:
+            lat_lons = np.array([point.to_lat_lon() for point in ring])
+            yield lat_lons[:,0], lat_lons[:,1]
+    elif isinstance(geometry, pygplates.PolylineOnSphere):
+        lat_lons = geometry.to_tessellated(tessellate_radians).to_lat_lon_array()
+        yield lat_lons[:,0], lat_lons[:,1]
+    else:
+        lat_lons = np.array(geometry.to_lat_lon_array() if hasattr(geometry, "to_lat_lon_array") else
+                            [geometry.to_lat_lon()]).reshape(-1, 2)
+        yield lat_lons[:,0], lat_lons[:,1]
+
+
+def _split_chunks(nprocs, *arrays):
+    """Splits arrays into matching chunks, a few per worker process, for load balancing."""
+    nchunks = max(1, min(4 * nprocs, len(arrays[0])))
+    return [np.array_split(array, nchunks) for array in arrays]
+
+
+def _chunk_field(chunk, name, column=None):
+    """Returns a named field (or, for plain 2D arrays, a column) of a chunk of points, or None if it is missing."""
+    if isinstance(chunk, np.ndarray) and chunk.dtype.names is None:
+        if column is None or chunk.ndim != 2 or column >= chunk.shape[1]:
+            return None
+        return np.asarray(chunk[:,column])
+    try:
+        return np.asarray(chunk[name])
+    except (KeyError, ValueError, IndexError):
+        return None
+
+
+# parsed feature collections shared by PlateReconstruction objects, keyed by absolute file path
+_feature_collection_cache = {}
+
+
+def _file_signature(filename):
+    """Returns the size, modification time and SHA-1 content hash of a file."""
+    stat = os.stat(filename)
+    sha1 = hashlib.sha1()
+    with open(filename, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            sha1.update(block)
+    return stat.st_size, stat.st_mtime_ns, sha1.hexdigest()
+
+
+def _load_features(features, use_cache=False):
+    """Returns ‘features’ with any filenames replaced by their parsed feature collections, which are taken from the
+    feature collection cache (and added to it) if ‘use_cache’ is True.
+    """
+    if isinstance(features, (str, os.PathLike)):
+        if not use_cache:
+            return pygplates.FeatureCollection(features)
+
+        path = os.path.abspath(features)
+        signature = _file_signature(path)
+        cached = _feature_collection_cache.get(path)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+
+        # new or modified file
+        feature_collection = pygplates.FeatureCollection(path)
+        _feature_collection_cache[path] = (signature, feature_collection)
+        return feature_collection
+
+    if isinstance(features, (list, tuple)):
+        return [_load_features(item, use_cache) for item in features]
+    return features
+
+
+def clear_feature_cache():
+    """Removes all parsed feature collections from the feature collection cache used by PlateReconstruction objects
+    constructed with cache_features=True.
+    """
+    _feature_collection_cache.clear()
+
+
+def _rotation_plate_ids(rotation_features):
+    """Returns the fixed and moving plate IDs of total reconstruction sequence (rotation) features."""
+    plate_ids = set()
+    for feature in rotation_features:
+        total_reconstruction_pole = feature.get_total_reconstruction_pole()
+        if total_reconstruction_pole:
+            fixed_plate_id, moving_plate_id, _ = total_reconstruction_pole
+            plate_ids.update((fixed_plate_id, moving_plate_id))
+    return sorted(plate_ids)
+
+
+# PlateReconstruction object owned by each worker process
+_worker_reconstruction = None
+
+
+def _init_worker(init_args):
+    """Builds the PlateReconstruction object of a worker process once, when the process starts."""
+    global _worker_reconstruction
+    _worker_reconstruction = PlateReconstruction(*init_args)
+
+
+def _run_worker_method(task):
+    """Calls a PlateReconstruction method of the worker process with the given arguments."""
+    method_name, args, kwargs = task
+    return getattr(_worker_reconstruction, method_name)(*args, **kwargs)
+
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "evictions", "maxsize", "currsize"])
+
+
+class _LRUCache(object):
+    """A bounded least-recently-used (LRU) mapping that counts its hits, misses and evictions."""
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self._items = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self._items)
+
+    def _get(self, key, create):
+        """Returns the item stored under ‘key’, or creates it with ‘create()’ (and stores it) on a miss."""
+        items = self._items
+
+        if key in items:
+            self.hits += 1
+            # move to the most recently used end
+            item = items.pop(key)
+            items[key] = item
+            return item
+
+        self.misses += 1
+        item = create()
+        if self.maxsize is None or self.maxsize > 0:
+            items[key] = item
+            while self.maxsize is not None and len(items) > self.maxsize:
+                items.popitem(last=False)
+                self.evictions += 1
+        return item
+
+    def cache_info(self):
+        """Returns the cache statistics as a named tuple of (hits, misses, evictions, maxsize, currsize)."""
+        return CacheInfo(self.hits, self.misses, self.evictions, self.maxsize, len(self._items))
+
+    def clear(self):
+        """Removes all items from the cache and resets the hit, miss and eviction counters."""
+        self._items.clear()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+
+class RotationCache(_LRUCache):
+    """A bounded least-recently-used (LRU) cache of finite rotations that sits in front of a pygplates RotationModel.
+
+    Rotations are keyed on (to_time, plate_id, from_time, anchor_plate_id). Repeated queries for the same key are served
+    from a dictionary lookup instead of traversing the reconstruction tree again. Once the cache holds ‘maxsize’
+    rotations, the least recently used rotation is evicted to make room for a new one.
+
+    Attributes
+    ----------
+    rotation_model : :class:`RotationModel`
+        The pygplates rotation model that rotations are obtained from on a cache miss.
+    maxsize : int
+        The maximum number of rotations held in the cache. None for an unbounded cache.
+    hits, misses, evictions : int
+        Counters for the number of cache hits, cache misses and evicted rotations.
+
+    Methods
+    -------
+    get_rotation(self, to_time, plate_id, from_time=0, anchor_plate_id=0)
+        Returns the finite rotation of a plate from one time to another, from the cache if possible.
+    cache_info(self)
+        Returns the hit, miss and eviction counters along with the maximum and current size of the cache.
+    clear(self)
+        Removes all rotations from the cache and resets the counters.
+    """
+    def __init__(self, rotation_model, maxsize=4096):
+        """Constructs all necessary attributes for the rotation cache.
+
+        Parameters
+        ----------
+        rotation_model : :class:`RotationModel`
+            The pygplates rotation model to cache rotations of.
+
+        maxsize : int, default=4096
+            The maximum number of rotations held in the cache. Set to None for an unbounded cache, or 0 to disable caching.
+        """
+        super(RotationCache, self).__init__(maxsize)
+        self.rotation_model = rotation_model
+
+    def get_rotation(self, to_time, plate_id, from_time=0, anchor_plate_id=0):
+        """Returns the finite rotation of a plate from ‘from_time’ to ‘to_time’ relative to the anchor plate.
+
+        Parameters
+        ----------
+        to_time : float
+            The time (Ma) to rotate to.
+
+        plate_id : int
+            The moving plate ID.
+
+        from_time : float, default=0
+            The time (Ma) to rotate from. By default, this is set to present day.
+
+        anchor_plate_id : int, default=0
+            The anchor plate of the reconstruction model.
+
+        Returns
+        -------
+        rotation : :class:`FiniteRotation`
+            Equivalent to rotation_model.get_rotation(to_time, plate_id, from_time, anchor_plate_id=anchor_plate_id).
+        """
+        key = (float(to_time), int(plate_id), float(from_time), int(anchor_plate_id))
+        return self._get(key, lambda: self.rotation_model.get_rotation(
+            key[0], key[1], key[2], anchor_plate_id=key[3]))
+
+
+class RotationTable(object):
+    """A rotation model compiled into dense arrays of total rotations for a set of plates over a grid of times.
+
+    The total rotation (relative to the anchor plate) of every plate at every time of the grid is stored as a unit 
+    quaternion. Rotations at arbitrary times within the grid are answered with vectorised spherical linear interpolation
+    (slerp) between the two neighbouring grid times, so the rotations of many plates at many times are obtained in a 
+    single array operation rather than one RotationModel query at a time. A rotation table is obtained from 
+    PlateReconstruction.compile_rotation_table, and can be saved to (and loaded from) a numpy .npz file.
+
+    Note: rotations between grid times are interpolated from the compiled total rotations, so they only approximate the
+    rotation model (which interpolates the individual rotation poles of the plate circuit); use a finer time grid for a
+    closer match.
+
+    Attributes
+    ----------
+    plate_ids : 1d array
+        The (sorted) plate IDs held in the table.
+    times : 1d array
+        The (increasing) grid times (Ma) held in the table.
+    quaternions : ndarray
+        An (nplates, ntimes, 4) array of unit quaternions holding the (w, x, y, z) components of the total rotation of 
+        each plate at each grid time.
+    anchor_plate_id : int
+        The anchor plate of the rotations.
+
+    Methods
+    -------
+    get_quaternions(self, to_time, plate_ids, from_time=0)
+        Returns unit quaternions of the rotations of plates from one time to another, broadcasting times and plate IDs.
+    get_matrices(self, to_time, plate_ids, from_time=0)
+        Returns 3x3 rotation matrices of the rotations of plates from one time to another.
+    save(self, filename)
+        Saves the rotation table to a numpy .npz file.
+    load(filename)
+        Loads a rotation table saved with save.
+    """
+    def __init__(self, plate_ids, times, quaternions, anchor_plate_id=0):
+        """Constructs all necessary attributes for the rotation table.
+
+        Parameters
+        ----------
+        plate_ids : 1D array
+            The plate IDs of the table, in the order of the first axis of ‘quaternions’.
+
+        times : 1D array
+            The grid times (Ma), in the order of the second axis of ‘quaternions’. At least two times are required.
+
+        quaternions : ndarray
+            An (nplates, ntimes, 4) array of unit quaternions of the total rotation of each plate at each grid time.
+
+        anchor_plate_id : int, default=0
+            The anchor plate of the rotations.
+        """
+        plate_ids = np.asarray(plate_ids, dtype=int).ravel()
+        times = np.asarray(times, dtype=float).ravel()
+        quaternions = np.asarray(quaternions, dtype=float)
+        if quaternions.shape != (plate_ids.size, times.size, 4):
+            raise ValueError("quaternions must have shape (nplates, ntimes, 4) = ({}, {}, 4)".format(
+                plate_ids.size, times.size))
+        if times.size < 2:
+            raise ValueError("At least two times are required")
+
+        plate_order = np.argsort(plate_ids)
+        time_order = np.argsort(times)
+        self.plate_ids = plate_ids[plate_order]
+        self.times = times[time_order]
+        if np.any(np.diff(self.plate_ids) == 0) or np.any(np.diff(self.times) == 0):
+            raise ValueError("plate_ids and times must not contain duplicates")
+        self.quaternions = quaternions[plate_order][:, time_order]
+        self.anchor_plate_id = int(anchor_plate_id)
+
+
+    def _interpolate(self, time, plate_index):
+        """Returns the total rotation quaternions at ‘time’ for the given indices into the plate axis."""
+        times = self.times
+        if np.any(time < times[0]) or np.any(time > times[-1]):
+            raise ValueError("Times must be within the range of the rotation table ({} - {} Ma)".format(
+                times[0], times[-1]))
+
+        i = np.clip(np.searchsorted(times, time, side="right") - 1, 0, times.size - 2)
+        fraction = (time - times[i]) / (times[i+1] - times[i])
+        return _tools.quaternion_slerp(self.quaternions[plate_index, i], self.quaternions[plate_index, i+1], fraction)
+
+
+    def get_quaternions(self, to_time, plate_ids, from_time=0):
+        """Returns unit quaternions of the rotations of plates from ‘from_time’ to ‘to_time’ relative to the anchor plate.
+
+        ‘to_time’, ‘plate_ids’ and ‘from_time’ broadcast against each other, so (for example) the rotations of many plates
+        at many times are obtained with plate_ids[:,np.newaxis] and to_time[np.newaxis,:]. Plate IDs that are not in 
+        the table are given the identity rotation (as pygplates.RotationModel does for unknown plates).
+
+        Parameters
+        ----------
+        to_time : float, or ndarray
+            The time(s) (Ma) to rotate to.
+
+        plate_ids : int, or ndarray
+            The moving plate ID(s).
+
+        from_time : float, or ndarray, default=0
+            The time(s) (Ma) to rotate from. By default, this is set to present day.
+
+        Returns
+        -------
+        quaternions : ndarray
+            A (..., 4) array of unit quaternions holding (w, x, y, z) components, equivalent to
+            rotation_model.get_rotation(to_time, plate_id, from_time, anchor_plate_id=anchor_plate_id).
+        """
+        to_time, plate_ids, from_time = np.broadcast_arrays(
+            np.asarray(to_time, dtype=float), np.asarray(plate_ids, dtype=int), np.asarray(from_time, dtype=float))
+
+        plate_index = np.clip(np.searchsorted(self.plate_ids, plate_ids), 0, self.plate_ids.size - 1)
+        known_plates = self.plate_ids[plate_index] == plate_ids
+
+        quaternions = self._interpolate(to_time, plate_index)
+        if np.any(from_time != 0.0):
+            # rotate back from 'from_time' to present day first
+            from_quaternions = self._interpolate(from_time, plate_index) * np.array([1.0, -1.0, -1.0, -1.0])
+            quaternions = _tools.quaternion_multiply(quaternions, from_quaternions)
+
+        quaternions[~known_plates] = (1.0, 0.0, 0.0, 0.0)
+        return quaternions
+
+
+    def get_matrices(self, to_time, plate_ids, from_time=0):
+        """Returns 3x3 rotation matrices of the rotations of plates from ‘from_time’ to ‘to_time’.
+
+        Parameters
+        ----------
+        to_time : float, or ndarray
+            The time(s) (Ma) to rotate to.
+
+        plate_ids : int, or ndarray
+            The moving plate ID(s).
+
+        from_time : float, or ndarray, default=0
+            The time(s) (Ma) to rotate from. By default, this is set to present day.
+
+        Returns
+        -------
+        matrices : ndarray
+            A (..., 3, 3) array of rotation matrices (see get_quaternions).
+        """
+        return _tools.quaternion_to_matrix(self.get_quaternions(to_time, plate_ids, from_time))
+
+
+    def save(self, filename):
+        """Saves the rotation table to a numpy .npz file.
+
+        Parameters
+        ----------
+        filename : str
+            The path of the .npz file to write.
+        """
+        np.savez(filename, plate_ids=self.plate_ids, times=self.times, quaternions=self.quaternions,
+                 anchor_plate_id=self.anchor_plate_id)
+
+
+    @classmethod
+    def load(cls, filename):
+        """Loads a rotation table saved with save.
+
+        Parameters
+        ----------
+        filename : str
+            The path of the .npz file to read.
+
+        Returns
+        -------
+        rotation_table : RotationTable
+            The loaded rotation table.
+        """
+        with np.load(filename) as data:
+            return cls(data["plate_ids"], data["times"], data["quaternions"], int(data["anchor_plate_id"]))
+
+
+class PlateIdRaster(object):
+    """A spherical grid index that partitions points into plates with array lookups.
+
+    The globe is divided into regular lat-lon cells. Cells crossed by the boundary of any partitioning plate (and their
+    immediate neighbours) are flagged as boundary cells, as are all cells poleward of ±82.5° where cells become too 
+    narrow for the boundary sampling. Every other cell lies entirely within the same set of plates, so it shares a
+    single partitioning result: connected regions of such cells are partitioned once, at one cell centre, and points
+    falling in them are assigned a plate ID by array indexing. Only points in boundary cells are partitioned exactly
+    with the pygplates PlatePartitioner, so the result is identical to partitioning every point exactly.
+
+    Attributes
+    ----------
+    resolution : float
+        The cell size in degrees.
+    plate_ids : 2D array
+        The plate ID of each (nlat, nlon) cell; -1 where a cell is not within any plate.
+    boundary : 2D array
+        A boolean (nlat, nlon) array that is True for boundary cells.
+    plate_partitioner : :class:`PlatePartitioner`
+        The partitioner used for the exact partitioning of points in boundary cells.
+
+    Methods
+    -------
+    partition_points(self, lons, lats)
+        Returns the plate ID of each lat-lon point, or -1 where a point is not within any plate.
+    """
+    def __init__(self, partitioning_plates, plate_partitioner, resolution=1.0):
+        """Builds the grid index of a set of partitioning plates.
+
+        Parameters
+        ----------
+        partitioning_plates : sequence of :class:`ReconstructionGeometry`
+            The reconstructed static polygons, or resolved topologies, that ‘plate_partitioner’ was built from.
+
+        plate_partitioner : :class:`PlatePartitioner`
+            The partitioner of ‘partitioning_plates’, used to partition cells and points in boundary cells.
+
+        resolution : float, default=1.0
+            The cell size in degrees. Smaller cells leave fewer points to partition exactly, but take longer to build.
+        """
+        resolution = float(resolution)
+        if resolution <= 0:
+            raise ValueError("resolution must be greater than zero (resolution = {})".format(resolution))
+        self.resolution = resolution
+        self.plate_partitioner = plate_partitioner
+
+        nlat = int(np.ceil(180.0 / resolution))
+        nlon = int(np.ceil(360.0 / resolution))
+        boundary = np.zeros((nlat, nlon), dtype=bool)
+        self.boundary = boundary
+
+        # cells near the poles are always partitioned exactly
+        cell_lats = -90.0 + (np.arange(nlat) + 0.5) * resolution
+        boundary[np.abs(cell_lats) > 82.5] = True
+
+        # flag cells containing boundary points sampled at an eighth of a cell (narrower than any cell below 82.5°)
+        tessellate_radians = np.deg2rad(0.125 * resolution)
+        for partitioning_plate in partitioning_plates:
+            for ring_lats, ring_lons in _boundary_lat_lons(partitioning_plate, tessellate_radians):
+                rows, cols = self._cells(ring_lons, ring_lats)
+                boundary[rows, cols] = True
+
+        # grow by one cell (wrapping in longitude) so the boundary between sampled points is covered
+        dilated = boundary.copy()
+        for shift in (-1, 1):
+            dilated |= np.roll(boundary, shift, axis=1)
+        boundary = dilated.copy()
+        dilated[1:] |= boundary[:-1]
+        dilated[:-1] |= boundary[1:]
+        self.boundary = dilated
+
+        # partition one cell centre of each connected region of interior cells
+        labels, nlabels = _ndimage.label(~self.boundary)
+        unique_labels, first_index = np.unique(labels.ravel(), return_index=True)
+        rows, cols = np.unravel_index(first_index[unique_labels > 0], labels.shape)
+        label_plate_ids = np.full(nlabels + 1, -1, dtype=int)
+        label_plate_ids[unique_labels[unique_labels > 0]] = _partition_points(plate_partitioner,
+            -180.0 + (cols + 0.5) * resolution, np.minimum(-90.0 + (rows + 0.5) * resolution, 90.0))
+        self.plate_ids = label_plate_ids[labels]
+        self.plate_ids[self.boundary] = -1
+
+
+    def _cells(self, lons, lats):
+        """Returns the row and column indices of the cells containing lat-lon points."""
+        nlat, nlon = self.boundary.shape
+        rows = np.clip(np.floor((np.asarray(lats) + 90.0) / self.resolution).astype(int), 0, nlat - 1)
+        cols = np.clip(np.floor(np.mod(np.asarray(lons) + 180.0, 360.0) / self.resolution).astype(int), 0, nlon - 1)
+        return rows, cols
+
+
+    def partition_points(self, lons, lats):
+        """Returns the plate ID of each lat-lon point.
+
+        Parameters
+        ----------
+        lons, lats : 1D arrays
+            Longitudes and latitudes (degrees) of the points.
+
+        Returns
+        -------
+        plate_ids : 1D array
+            The plate ID of each point, or -1 where a point is not within any plate.
+        """
+        lons = np.atleast_1d(np.asarray(lons, dtype=float))
+        lats = np.atleast_1d(np.asarray(lats, dtype=float))
+        rows, cols = self._cells(lons, lats)
+
+        plate_ids = self.plate_ids[rows, cols]
+        exact = self.boundary[rows, cols]
+        plate_ids[exact] = _partition_points(self.plate_partitioner, lons[exact], lats[exact])
+        return plate_ids
+
+
+class TopologySnapshot(object):
+    """Topologies resolved once at a particular geological time and shared by every routine that needs them.
+
+    Resolving topologies is one of the most expensive pygplates operations. A snapshot resolves the topology features
+    at a given time once, keeps the resolved topologies and their shared boundary sections, and lazily builds the plate 
+    partitioner and the resolved boundary features (classified by boundary type) from them. Snapshots are obtained from
+    PlateReconstruction.topology_snapshot, which keeps the most recently used snapshots in an LRU cache.
+
+    Attributes
+    ----------
+    time : float
+        The reconstruction time (Ma) the topologies are resolved to.
+    anchor_plate_id : int
+        The anchor plate of the reconstruction model.
+    resolved_topologies : list
+        The resolved topological plates and networks (ResolvedTopologicalBoundary / ResolvedTopologicalNetwork).
+    resolved_topological_sections : list
+        The shared boundary sections (ResolvedTopologicalSection) between resolved topologies.
+    plate_partitioner : :class:`PlatePartitioner`
+        Partitions points into the resolved topologies (built on first access).
+
+    Methods
+    -------
+    plate_id_raster(self, resolution=1.0)
+        Returns a PlateIdRaster of the resolved topologies at the given resolution (built on first request).
+    get_resolved_features(self)
+        Returns the resolved topology features and their boundary sections classified by boundary type.
+    """
+    def __init__(self, topology_features, rotation_model, time, anchor_plate_id=0):
+        """Resolves the topology features at a particular geological time.
+
+        Parameters
+        ----------
+        topology_features : :class:`FeatureCollection`, or sequence of :class:`Feature`
+            The topology features to resolve.
+
+        rotation_model : :class:`RotationModel`
+            The rotation model used to resolve the topologies.
+
+        time : float
+            The reconstruction time (Ma) to resolve the topologies to.
+
+        anchor_plate_id : int, default=0
+            The anchor plate of the reconstruction model.
+        """
+        self.time = float(time)
+        self.anchor_plate_id = int(anchor_plate_id)
+        self.rotation_model = rotation_model
+
+        self.resolved_topologies = []
+        self.resolved_topological_sections = []
+        pygplates.resolve_topologies(topology_features, rotation_model, self.resolved_topologies, self.time,
+            self.resolved_topological_sections, anchor_plate_id=self.anchor_plate_id)
+
+        self._plate_partitioner = None
+        self._plate_id_rasters = {}
+        self._resolved_features = None
+
+    @property
+    def plate_partitioner(self):
+        """A pygplates PlatePartitioner built from the resolved topologies."""
+        if self._plate_partitioner is None:
+            self._plate_partitioner = pygplates.PlatePartitioner(self.resolved_topologies, self.rotation_model)
+        return self._plate_partitioner
+
+    def plate_id_raster(self, resolution=1.0):
+        """Returns a PlateIdRaster (spatial index) of the resolved topologies.
+
+        Rasters are built on first request and kept for the lifetime of the snapshot, one per resolution.
+
+        Parameters
+        ----------
+        resolution : float, default=1.0
+            The cell size of the raster in degrees.
+
+        Returns
+        -------
+        plate_id_raster : PlateIdRaster
+            Partitions points into the resolved topologies by array lookup, falling back to the plate partitioner near
+            plate boundaries.
+        """
+        resolution = float(resolution)
+        if resolution not in self._plate_id_rasters:
+            self._plate_id_rasters[resolution] = PlateIdRaster(
+                self.resolved_topologies, self.plate_partitioner, resolution)
+        return self._plate_id_rasters[resolution]
+
+    def get_resolved_features(self):
+        """Returns the resolved topology features and their boundary sections classified by boundary type.
+
+        This gives the same result as ptt.resolve_topologies.resolve_topologies_into_features, without resolving the
+        topologies again.
+
+        Returns
+        -------
+        resolved_features : tuple of lists
+            A tuple containing the following lists of features:
+                - resolved topology features (topological plates and networks)
+                - ridge and transform boundary sections (resolved features)
+                - ridge boundary sections (resolved features)
+                - transform boundary sections (resolved features)
+                - subduction boundary sections (resolved features)
+                - left subduction boundary sections (resolved features)
+                - right subduction boundary sections (resolved features)
+                - other boundary sections (resolved features) that are not subduction zones or mid-ocean ridges 
+                (ridge/transform)
+        """
+        if self._resolved_features is None:
+            self._resolved_features = self._classify_resolved_features()
+        return self._resolved_features
+
+    def _classify_resolved_features(self):
+        separate_ridge_transform_segments = ptt.separate_ridge_transform_segments
+
+        topologies = [resolved_topology.get_resolved_feature() for resolved_topology in self.resolved_topologies]
+        ridge_transforms = []
+        ridges = []
+        transforms = []
+        trenches = []
+        trench_left = []
+        trench_right = []
+        other = []
+
+        for shared_boundary_section in self.resolved_topological_sections:
+            section_feature = shared_boundary_section.get_feature()
+            shared_sub_segments = shared_boundary_section.get_shared_sub_segments()
+            boundary_section_features = [sub_segment.get_resolved_feature() for sub_segment in shared_sub_segments]
+
+            if section_feature.get_feature_type() == pygplates.FeatureType.gpml_subduction_zone:
+                trenches.extend(boundary_section_features)
+
+                polarity_property = section_feature.get(pygplates.PropertyName.create_gpml('subductionPolarity'))
+                if polarity_property:
+                    polarity = polarity_property.get_value().get_content()
+                    if polarity == 'Left':
+                        trench_left.extend(boundary_section_features)
+                    elif polarity == 'Right':
+                        trench_right.extend(boundary_section_features)
+
+            elif section_feature.get_feature_type() == pygplates.FeatureType.gpml_mid_ocean_ridge:
+                ridge_transforms.extend(boundary_section_features)
+
+                # split into ridge and transform segments using the stage pole of the ridge
+                spreading_stage_rotation = separate_ridge_transform_segments.get_stage_rotation_for_reconstructed_geometry(
+                    section_feature, self.rotation_model, self.time)
+                if not spreading_stage_rotation:
+                    continue
+
+                for sub_segment, boundary_section_feature in zip(shared_sub_segments, boundary_section_features):
+                    ridge_and_transform_geometries = separate_ridge_transform_segments.separate_geometry_into_ridges_and_transforms(
+                        spreading_stage_rotation,
+                        sub_segment.get_resolved_geometry(),
+                        separate_ridge_transform_segments.DEFAULT_TRANSFORM_SEGMENT_DEVIATION_RADIANS)
+                    if not ridge_and_transform_geometries:
+                        continue
+
+                    ridge_geometries, transform_geometries = ridge_and_transform_geometries
+                    if ridge_geometries:
+                        ridge_feature = boundary_section_feature.clone()
+                        ridge_feature.set_geometry(ridge_geometries)
+                        ridges.append(ridge_feature)
+                    if transform_geometries:
+                        transform_feature = boundary_section_feature.clone()
+                        transform_feature.set_geometry(transform_geometries)
+                        transforms.append(transform_feature)
+
+            else:
+                other.extend(boundary_section_features)
+
+        return topologies, ridge_transforms, ridges, transforms, trenches, trench_left, trench_right, other
+
 
 class PlateReconstruction(object):
     """The PlateReconstruction class contains methods to reconstruct topology features at a specific geological time using
@@ -21,18 +729,40 @@ class PlateReconstruction(object):
 
     Attributes
     ----------
-    rotation_model : str or list
-        A pygplates rotation model
+    rotation_model : :class:`RotationModel`
+        A pygplates rotation model (loaded on first access)
     topology_features : list
-        A feature collection list containing pygplates features (aggregated using pygplates.FeatureCollection())
-    static_polygons : str 
-        Path to static polygon file
+        A feature collection list containing pygplates features (aggregated using pygplates.FeatureCollection(), loaded
+        on first access)
+    static_polygons : :class:`FeatureCollection`
+        The static polygon features (loaded on first access)
+    rotation_cache : RotationCache
+        A bounded LRU cache of finite rotations obtained from the rotation model
+    snapshot_cache
+        A bounded LRU cache of TopologySnapshot objects (topologies resolved at a particular time)
         
     Methods
     -------
-    __init__(self, rotation_model=None, topology_features=None, static_polygons=None)
+    __init__(self, rotation_model=None, topology_features=None, static_polygons=None, rotation_cache_size=4096,
+    snapshot_cache_size=8, cache_features=False)
         Constructs all necessary attributes for the plate reconstruction object.
 
+    load_report(self)
+        Returns which of the rotation model, topology features and static polygons have been loaded, and how long each
+        took to load.
+
+    get_rotation(self, to_time, plate_id, from_time=0, anchor_plate_id=0)
+        Returns the finite rotation of a plate between two geological times through the rotation cache.
+
+    topology_snapshot(self, time, anchor_plate_id=0)
+        Returns the topologies resolved at a particular geological time, resolving them only if they are not cached.
+
+    partition_points(self, lons, lats, time=0, resolution=1.0, nprocs=1)
+        Partitions lat-lon points into the static polygons, using a cached spatial index, and returns their plate IDs.
+
+    compile_rotation_table(self, times, plate_ids=None, anchor_plate_id=0)
+        Compiles the total rotations of plates over a grid of times into a RotationTable.
+
     tesselate_subduction_zones(self, time, tessellation_threshold_radians=0.001, anchor_plate_id=0) 
         Samples points along subduction zone trenches and obtains both convergence and absolute velocities at a
         particular geological time.
@@ -41,17 +771,38 @@ class PlateReconstruction(object):
         Samples points along resolved spreading features (e.g. mid-ocean ridges) and calculates spreading rate and length
         of ridge segments at a particular geological time.
 
+    tesselate_subduction_zones_timeseries(self, times, nprocs=1, stream=False, tessellation_threshold_radians=0.001,
+    anchor_plate_id=0)
+        Runs tesselate_subduction_zones over a series of geological times, optionally in a pool of worker processes.
+
+    tesselate_mid_ocean_ridges_timeseries(self, times, nprocs=1, stream=False, tessellation_threshold_radians=0.001,
+    anchor_plate_id=0)
+        Runs tesselate_mid_ocean_ridges over a series of geological times, optionally in a pool of worker processes.
+
     reconstruct(self, feature, to_time, from_time=0, anchor_plate_id=0, **kwargs)
         Reconstructs regular geological features, motion paths or flowlines to a specific geological time.
 
-    get_point_velocities(self, lons, lats, time, delta_time=1.0)
-        Generates a velocity domain feature collection, resolves them into points, and calculates the north and east 
-        components of the velocity vector for each point in the domain at a particular geological time. 
+    reconstruct_points(self, lons, lats, plate_ids, to_time, from_time=0, anchor_plate_id=0)
+        Reconstructs arrays of lat-lon points with numpy, using one rotation per plate ID, without creating pygplates 
+        features.
+
+    reconstruct_point_chunks(self, chunks, to_time=None, from_time=0, anchor_plate_id=0, resolution=1.0, out=None, 
+    dtype=np.float64)
+        Partitions and reconstructs a stream of point chunks with bounded memory, yielding or writing the results.
+
+    get_point_velocities(self, lons, lats, time, delta_time=1.0, resolution=1.0)
+        Partitions lat-lon points into topological plates and calculates the north and east components of the velocity
+        vector for each point at a particular geological time.
     """
     
-    def __init__(self, rotation_model=None, topology_features=None, static_polygons=None):
+    def __init__(self, rotation_model=None, topology_features=None, static_polygons=None, rotation_cache_size=4096,
+                 snapshot_cache_size=8, cache_features=False):
         """Constructs all necessary attributes for the plate reconstruction object.
 
+        The rotation model, topology features and static polygons are not loaded here. Each is loaded (and any files 
+        parsed) the first time it is accessed, so a job that only reconstructs points never parses the topology files.
+        See load_report for what has been loaded so far.
+
         Parameters
         ----------
         rotation_model : str, or :class:`FeatureCollection`, or :class:`Feature`, or sequence of :class:`Feature`, 
@@ -68,27 +819,341 @@ class PlateReconstruction(object):
         static_polygons : :class:`FeatureCollection`, or str, or :class:`Feature`, or sequence of :class:`Feature`, 
         or a sequence of any combination of those four types, default=None
             Can be provided as a static polygon feature collection, or optional filename, or a single feature, or a sequence of
-            features.
-
+            features. Static polygon files are parsed once, on first access, rather than every time points are partitioned.
+
+        rotation_cache_size : int, default=4096
+            The maximum number of finite rotations held in the rotation cache. Set to None for an unbounded cache, or 0 to
+            disable caching.
+
+        snapshot_cache_size : int, default=8
+            The maximum number of resolved topology snapshots (one per reconstruction time) held in the snapshot cache. 
+            The least recently used snapshot is evicted first. Set to None for an unbounded cache, or 0 to disable caching.
+
+        cache_features : bool, default=False
+            Choose whether to keep the feature collections parsed from rotation, topology and static polygon files in a
+            cache shared by all PlateReconstruction objects in the process, so that files are only parsed once. Cached
+            collections are keyed by file path and are re-parsed automatically when the size, modification time or 
+            content hash (SHA-1) of a file changes. The cache only lives in this process; worker processes used by 
+            methods with nprocs > 1 do not need it, since they are given the models already loaded by this object (see 
+            the note on worker processes below). Note: cached features are shared between PlateReconstruction objects, 
+            so modifying them affects every object loaded from the same file.
+            Use clear_feature_cache to release the cache.
 
         Raises
         ------
         OpenFileForReadingError 
-            if any file is not readable (when filenames specified)
+            if any file is not readable (when filenames specified), on first access
 
         FileFormatNotSupportedError 
-            if any file format (identified by the filename extensions) does not support reading (when filenames specified)
-        """
+            if any file format (identified by the filename extensions) does not support reading (when filenames specified),
+            on first access
 
-        rotation_model = pygplates.RotationModel(rotation_model)
+        Notes
+        -----
+        Methods with an nprocs argument run their work in a pool of worker processes when nprocs > 1. The rotation 
+        model, topology features and static polygons are loaded in this process before the pool is created, and when 
+        workers are forked (the default start method on Linux) each worker builds its PlateReconstruction object from 
+        these loaded models, which it inherits from this process, so no worker ever parses a file. With the spawn or 
+        forkserver start methods, the loaded models would have to be pickled, which is slower than parsing the files 
+        again, so those workers are given the arguments this object was constructed with and parse the files themselves.
+        """
+        # keep what was supplied so worker processes can build their own copy
+        self._init_args = (rotation_model, topology_features, static_polygons, rotation_cache_size, snapshot_cache_size,
+            cache_features)
+
+        self._cache_features = cache_features
+        self._rotation_cache_size = rotation_cache_size
+        self._rotation_model = None
+        self._topology_features = None
+        self._static_polygons = None
+        self._rotation_cache = None
+        self._load_times = {}
+        self.snapshot_cache = _LRUCache(snapshot_cache_size)
+        self._plate_id_raster_cache = _LRUCache(4)
+
+
+    def _set_init_arg(self, index, value):
+        """Replaces one of the init args that worker processes build their PlateReconstruction object from."""
+        init_args = list(self._init_args)
+        init_args[index] = value
+        self._init_args = tuple(init_args)
+
+
+    def _load(self, name, load):
+        """Loads data with ‘load()’ and records how long it took under ‘name’."""
+        start = _time.perf_counter()
+        data = load()
+        self._load_times[name] = _time.perf_counter() - start
+        return data
+
+
+    def _load_rotation_model(self):
+        rotation_model = self._init_args[0]
+        if self._cache_features:
+            rotation_model = _load_features(rotation_model, use_cache=True)
+        return pygplates.RotationModel(rotation_model)
+
+
+    def _load_topology_features(self):
+        topology_features = self._init_args[1]
+        if topology_features is None:
+            topology_features = []
+        elif isinstance(topology_features, (str, os.PathLike)):
+            topology_features = [topology_features]
 
         default_topology_features = pygplates.FeatureCollection()
         for topology in topology_features:
-            default_topology_features.add( pygplates.FeatureCollection(topology) )
+            default_topology_features.add( _load_features(topology, use_cache=self._cache_features) )
+        return default_topology_features
+
+
+    @property
+    def rotation_model(self):
+        """The pygplates RotationModel, loaded on first access."""
+        if self._rotation_model is None:
+            self._rotation_model = self._load("rotation_model", self._load_rotation_model)
+        return self._rotation_model
+
+    @rotation_model.setter
+    def rotation_model(self, rotation_model):
+        self._load_times.pop("rotation_model", None)
+        self._rotation_model = pygplates.RotationModel(rotation_model)
+        # worker processes are built from the init args, so they must follow the new model
+        self._set_init_arg(0, rotation_model)
+        # rotations and resolved topologies of the previous model are no longer valid
+        self._rotation_cache = None
+        self.snapshot_cache.clear()
+        self._plate_id_raster_cache.clear()
+
+
+    @property
+    def topology_features(self):
+        """The merged topology features, loaded on first access."""
+        if self._topology_features is None:
+            self._topology_features = self._load("topology_features", self._load_topology_features)
+        return self._topology_features
+
+    @topology_features.setter
+    def topology_features(self, topology_features):
+        self._load_times.pop("topology_features", None)
+        self._topology_features = pygplates.FeatureCollection(topology_features)
+        self._set_init_arg(1, [self._topology_features])
+        self.snapshot_cache.clear()
+
+
+    @property
+    def static_polygons(self):
+        """The static polygon features, loaded on first access."""
+        if self._static_polygons is None and self._init_args[2] is not None:
+            self._static_polygons = self._load("static_polygons",
+                lambda: _load_features(self._init_args[2], use_cache=self._cache_features))
+        return self._static_polygons
+
+    @static_polygons.setter
+    def static_polygons(self, static_polygons):
+        self._load_times.pop("static_polygons", None)
+        self._static_polygons = static_polygons
+        self._set_init_arg(2, static_polygons)
+        self._plate_id_raster_cache.clear()
+
+
+    @property
+    def rotation_cache(self):
+        """The RotationCache in front of the rotation model."""
+        if self._rotation_cache is None:
+            self._rotation_cache = RotationCache(self.rotation_model, maxsize=self._rotation_cache_size)
+        return self._rotation_cache
+
+
+    def load_report(self):
+        """Returns which of the rotation model, topology features and static polygons have been loaded, and how long each
+        took to load.
 
-        self.rotation_model = rotation_model
-        self.topology_features = default_topology_features
-        self.static_polygons = static_polygons
+        Returns
+        -------
+        report : dict
+            Maps "rotation_model", "topology_features" and "static_polygons" to the time (in seconds) taken to load them,
+            or to None if they have not been loaded (yet). Data assigned directly to an attribute is reported as 0.0.
+        """
+        report = {}
+        for name in ("rotation_model", "topology_features", "static_polygons"):
+            if getattr(self, "_" + name) is None:
+                report[name] = None
+            else:
+                report[name] = self._load_times.get(name, 0.0)
+        return report
+
+
+    def get_rotation(self, to_time, plate_id, from_time=0, anchor_plate_id=0):
+        """Returns the finite rotation of a plate from ‘from_time’ to ‘to_time’ relative to the anchor plate.
+
+        Rotations are served from the rotation cache, so that repeated queries for the same plate and times do not 
+        traverse the reconstruction tree of the rotation model again.
+
+        Parameters
+        ----------
+        to_time : float
+            The geological time (Ma) to rotate to.
+
+        plate_id : int
+            The moving plate ID.
+
+        from_time : float, default=0
+            The geological time (Ma) to rotate from. By default, this is set to present day.
+
+        anchor_plate_id : int, default=0
+            The anchor plate of the reconstruction model.
+
+        Returns
+        -------
+        rotation : :class:`FiniteRotation`
+            The finite rotation of the plate from ‘from_time’ to ‘to_time’.
+        """
+        return self.rotation_cache.get_rotation(to_time, plate_id, from_time, anchor_plate_id)
+
+
+    def partition_points(self, lons, lats, time=0, resolution=1.0, nprocs=1):
+        """Partitions lat-lon points into the static polygons and returns the plate ID of each point.
+
+        The static polygons reconstructed to ‘time’ are indexed with a PlateIdRaster of the given resolution, which is
+        cached, so that most points are assigned a plate ID by array lookup and only points near polygon boundaries are 
+        partitioned exactly. The result is the same as partitioning each point with a pygplates PlatePartitioner.
+
+        When nprocs > 1, the points are split into chunks that are partitioned in a pool of worker processes. Each
+        worker builds its own PlateReconstruction object once, from the rotation model and static polygons loaded by 
+        this object (see the notes of the constructor), and returns the plate IDs of its chunks as numpy arrays.
+
+        Parameters
+        ----------
+        lons, lats : 1D arrays
+            Longitudes and latitudes (degrees) of the points at ‘time’.
+
+        time : float, default=0
+            The reconstruction time (Ma) to partition the points at.
+
+        resolution : float, default=1.0
+            The cell size (degrees) of the spatial index. Set to None to partition every point exactly without an index.
+
+        nprocs : int, default=1
+            The number of worker processes.
+
+        Returns
+        -------
+        plate_ids : 1D array
+            The plate ID of each point, or -1 where a point is not within any static polygon.
+        """
+        if self.static_polygons is None:
+            raise ValueError("static_polygons must be provided to partition points")
+        lons = np.atleast_1d(np.asarray(lons, dtype=float))
+        lats = np.atleast_1d(np.asarray(lats, dtype=float))
+
+        if nprocs is not None and nprocs > 1 and lons.size > 1:
+            tasks = [("partition_points", (chunk_lons, chunk_lats, time, resolution), {})
+                     for chunk_lons, chunk_lats in zip(*_split_chunks(nprocs, lons, lats))]
+            return np.concatenate(list(self._map_tasks(tasks, nprocs)))
+
+        if resolution is None:
+            plate_partitioner = pygplates.PlatePartitioner(self.static_polygons, self.rotation_model, float(time))
+            return _partition_points(plate_partitioner, lons, lats)
+
+        key = (float(time), float(resolution))
+        plate_id_raster = self._plate_id_raster_cache._get(key, lambda: self._build_plate_id_raster(*key))
+        return plate_id_raster.partition_points(lons, lats)
+
+
+    def _reconstruct_point_features(self, lons, lats, plate_ids, to_time, from_time=0, anchor_plate_id=0, **kwargs):
+        """Reconstructs lat-lon points as pygplates point features and returns the reconstructed lon-lat arrays."""
+        features = _tools.points_to_features(lons, lats, plate_ids)
+        if float(from_time) != 0.0:
+            features = self._reverse_reconstruct(features, from_time, anchor_plate_id)
+        reconstructed_features = self.reconstruct(features, to_time, anchor_plate_id=anchor_plate_id, **kwargs)
+        return _tools.extract_feature_lonlat(reconstructed_features)
+
+
+    def _build_plate_id_raster(self, time, resolution):
+        """Builds a PlateIdRaster of the static polygons reconstructed to ‘time’."""
+        reconstructed_static_polygons = []
+        pygplates.reconstruct(self.static_polygons, self.rotation_model, reconstructed_static_polygons, time)
+        plate_partitioner = pygplates.PlatePartitioner(reconstructed_static_polygons, self.rotation_model)
+        return PlateIdRaster(reconstructed_static_polygons, plate_partitioner, resolution)
+
+
+    def compile_rotation_table(self, times, plate_ids=None, anchor_plate_id=0):
+        """Compiles the total rotations of plates over a grid of times into a RotationTable.
+
+        The rotation model is queried once per plate and grid time. Rotations at any time within the grid can then be
+        obtained for many plates and times at once with RotationTable.get_quaternions or RotationTable.get_matrices.
+
+        Parameters
+        ----------
+        times : 1D array
+            The grid times (Ma) to compile rotations at (e.g. np.arange(0, 251, 1.0)). Rotations between grid times are 
+            interpolated, so a finer grid gives a closer match to the rotation model.
+
+        plate_ids : 1D array, default=None
+            The plate IDs to compile rotations for. By default, these are all the fixed and moving plate IDs found in 
+            the rotation features this object was constructed with.
+
+        anchor_plate_id : int, default=0
+            The anchor plate of the reconstruction model.
+
+        Returns
+        -------
+        rotation_table : RotationTable
+            The total rotations of each plate at each grid time.
+
+        Raises
+        ------
+        ValueError
+            If ‘plate_ids’ is not given and the rotation model was not constructed from rotation features (e.g. it was
+            given as a pygplates.RotationModel).
+        """
+        if plate_ids is None:
+            rotation_features = self._init_args[0]
+            if not pygplates.FeaturesFunctionArgument.contains_features(rotation_features):
+                raise ValueError("plate_ids must be provided when the rotation model is not given as rotation features")
+            plate_ids = _rotation_plate_ids(pygplates.FeaturesFunctionArgument(rotation_features).get_features())
+        plate_ids = np.unique(np.asarray(plate_ids, dtype=int))
+        times = np.unique(np.asarray(times, dtype=float))
+
+        # the table is usually much larger than the rotation cache, so query the rotation model directly
+        quaternions = np.empty((plate_ids.size, times.size, 4))
+        for i, plate_id in enumerate(plate_ids):
+            for j, time in enumerate(times):
+                quaternions[i,j] = _tools.rotation_to_quaternion(self.rotation_model.get_rotation(
+                    float(time), int(plate_id), anchor_plate_id=anchor_plate_id))
+
+            # keep neighbouring quaternions in the same hemisphere (q and -q are the same rotation)
+            flip = np.sum(quaternions[i,1:] * quaternions[i,:-1], axis=-1) < 0.0
+            sign = np.where(np.cumsum(flip) % 2 == 1, -1.0, 1.0)
+            quaternions[i,1:] *= sign[:,np.newaxis]
+
+        return RotationTable(plate_ids, times, quaternions, anchor_plate_id)
+
+
+    def topology_snapshot(self, time, anchor_plate_id=0):
+        """Returns the topology features resolved at a particular geological time.
+
+        Topologies are resolved once per (time, anchor_plate_id) and the resulting TopologySnapshot is kept in the
+        snapshot cache, so that the plate partitioner, the resolved boundary sections used for plotting and the
+        velocity calculations at that time all share a single resolution of the topologies.
+
+        Parameters
+        ----------
+        time : float
+            The reconstruction time (Ma) to resolve topologies to.
+
+        anchor_plate_id : int, default=0
+            The anchor plate of the reconstruction model.
+
+        Returns
+        -------
+        snapshot : TopologySnapshot
+            The resolved topologies, their boundary sections and plate partitioner at ‘time’.
+        """
+        key = (float(time), int(anchor_plate_id))
+        return self.snapshot_cache._get(key, lambda: TopologySnapshot(
+            self.topology_features, self.rotation_model, key[0], anchor_plate_id=key[1]))
 
 
     def tesselate_subduction_zones(self, time, tessellation_threshold_radians=0.001, anchor_plate_id=0):
@@ -175,6 +1240,8 @@ class PlateReconstruction(object):
                 tessellation_threshold_radians,
                 float(time),
                 anchor_plate_id=anchor_plate_id)
+        if not subduction_data:
+            return np.empty((0, 10))
         subduction_data = np.vstack(subduction_data)
         return subduction_data
 
@@ -226,9 +1293,143 @@ class PlateReconstruction(object):
                 float(time),
                 tessellation_threshold_radians,
                 anchor_plate_id=anchor_plate_id)
+        if not ridge_data:
+            return np.empty((0, 4))
         ridge_data = np.vstack(ridge_data)
         return ridge_data
 
+
+    def tesselate_subduction_zones_timeseries(self, times, nprocs=1, stream=False, tessellation_threshold_radians=0.001,
+                                              anchor_plate_id=0):
+        """Samples points along subduction zone trenches and obtains both convergence and absolute velocities at a series
+        of geological times, optionally in parallel.
+
+        Each time is processed with tesselate_subduction_zones. When nprocs > 1, times are distributed over a pool of 
+        worker processes. Each worker builds its own PlateReconstruction object once, when the pool starts, from the rotation
+        model and topology features loaded by this object (see the notes of the constructor), and then reuses it for every
+        time it is given. Note: unless workers are forked, the rotation model, topology features and static polygons given
+        to this object must be picklable (e.g. filenames) when nprocs > 1.
+
+        Parameters
+        ----------
+        times : 1D array
+            The reconstruction times (Ma) at which to query subduction convergence.
+
+        nprocs : int, default=1
+            The number of worker processes.
+
+        stream : bool, default=False
+            Choose whether to return a generator that yields a (time, subduction_data) tuple for each time, in the order
+            of ‘times’, as soon as it is available, rather than a single concatenated array.
+
+        tessellation_threshold_radians : float, default=0.001 
+            The threshold sampling distance along the subducting trench (in radians).
+
+        anchor_plate_id : int, default=0
+            The anchor plate of the reconstruction model.
+
+        Returns
+        -------
+        subduction_data : ndarray
+            The results of tesselate_subduction_zones at all times, stacked vertically, with an extra (last) column
+            holding the reconstruction time of each tessellated point. If stream=True, a generator of 
+            (time, subduction_data) tuples is returned instead.
+        """
+        return self._tesselate_timeseries("tesselate_subduction_zones", 10, times, nprocs, stream,
+            tessellation_threshold_radians=tessellation_threshold_radians, anchor_plate_id=anchor_plate_id)
+
+
+    def tesselate_mid_ocean_ridges_timeseries(self, times, nprocs=1, stream=False, tessellation_threshold_radians=0.001,
+                                              anchor_plate_id=0):
+        """Samples points along resolved spreading features (e.g. mid-ocean ridges) and calculates spreading rate and 
+        length of ridge segments at a series of geological times, optionally in parallel.
+
+        Each time is processed with tesselate_mid_ocean_ridges. When nprocs > 1, times are distributed over a pool of 
+        worker processes. Each worker builds its own PlateReconstruction object once, when the pool starts, from the rotation
+        model and topology features loaded by this object (see the notes of the constructor), and then reuses it for every
+        time it is given. Note: unless workers are forked, the rotation model, topology features and static polygons given
+        to this object must be picklable (e.g. filenames) when nprocs > 1.
+
+        Parameters
+        ----------
+        times : 1D array
+            The reconstruction times (Ma) at which to query spreading rates.
+
+        nprocs : int, default=1
+            The number of worker processes.
+
+        stream : bool, default=False
+            Choose whether to return a generator that yields a (time, ridge_data) tuple for each time, in the order of 
+            ‘times’, as soon as it is available, rather than a single concatenated array.
+
+        tessellation_threshold_radians : float, default=0.001 
+            The threshold sampling distance along the ridges (in radians).
+
+        anchor_plate_id : int, default=0
+            The anchor plate of the reconstruction model.
+
+        Returns
+        -------
+        ridge_data : ndarray
+            The results of tesselate_mid_ocean_ridges at all times, stacked vertically, with an extra (last) column
+            holding the reconstruction time of each tessellated point. If stream=True, a generator of (time, ridge_data)
+            tuples is returned instead.
+        """
+        return self._tesselate_timeseries("tesselate_mid_ocean_ridges", 4, times, nprocs, stream,
+            tessellation_threshold_radians=tessellation_threshold_radians, anchor_plate_id=anchor_plate_id)
+
+
+    def _tesselate_timeseries(self, method_name, ncols, times, nprocs, stream, **kwargs):
+        """Runs a tessellation method (whose results have ‘ncols’ columns) at each time and either streams or 
+        concatenates the results."""
+        results = self._iter_timeseries(method_name, times, nprocs, **kwargs)
+        if stream:
+            return results
+
+        all_data = [np.c_[data, np.full(len(data), time)] for time, data in results]
+        if not all_data:
+            return np.empty((0, ncols + 1))
+        return np.vstack(all_data)
+
+
+    def _iter_timeseries(self, method_name, times, nprocs, **kwargs):
+        """Yields (time, result) tuples of a PlateReconstruction method evaluated at each time, in order."""
+        times = [float(time) for time in np.atleast_1d(times)]
+        tasks = [(method_name, (time,), kwargs) for time in times]
+        for time, result in zip(times, self._map_tasks(tasks, nprocs)):
+            yield time, result
+
+
+    def _worker_init_args(self):
+        """Returns the init args that worker processes build their PlateReconstruction object from.
+
+        Forked workers are given the rotation model, topology features and static polygons loaded in this process, which
+        they inherit without pickling, so they never parse a file. Other start methods pickle the init args, and pickled
+        pygplates objects are slower to load than the files they came from, so those workers get the original arguments.
+        """
+        if get_start_method() != "fork":
+            return self._init_args
+
+        topology_features = None if self._init_args[1] is None else [self.topology_features]
+        return (self.rotation_model, topology_features, self.static_polygons) + self._init_args[3:]
+
+    def _map_tasks(self, tasks, nprocs):
+        """Yields the results of (method_name, args, kwargs) tasks in order, calling PlateReconstruction methods either
+        in this process or, when nprocs > 1, in a pool of worker processes that each build their own copy of this object.
+        """
+        if nprocs is None or nprocs <= 1 or not tasks:
+            for method_name, args, kwargs in tasks:
+                yield getattr(self, method_name)(*args, **kwargs)
+            return
+
+        pool = Pool(processes=min(nprocs, len(tasks)), initializer=_init_worker, initargs=(self._worker_init_args(),))
+        try:
+            for result in pool.imap(_run_worker_method, tasks):
+                yield result
+        finally:
+            pool.terminate()
+            pool.join()
+
     def reconstruct(self, feature, to_time, from_time=0, anchor_plate_id=0, **kwargs):
         """Reconstructs regular geological features, motion paths or flowlines to a specific geological time.
         
@@ -244,8 +1445,11 @@ class PlateReconstruction(object):
             The specific geological time to reconstruct to.
 
         from_time : float, default=0
-            The specific geological time to reconstruct from. By default, this is set to present day. Raises 
-            NotImplementedError if from_time not equal to 0.0.
+            The specific geological time to reconstruct from. By default, this is set to present day. If from_time is 
+            not 0.0, the feature geometries are taken to be positioned at ‘from_time’: they are first rotated back to 
+            present day by the inverse of the from-time rotation of their plate, and then reconstructed to ‘to_time’. 
+            Features are grouped by reconstruction plate ID so each plate rotation is only obtained once (through the 
+            rotation cache) and applied to all geometries of that plate.
 
         anchor_plate_id : int, default=0
             The anchor plate of the reconstruction model.
@@ -277,15 +1481,10 @@ class PlateReconstruction(object):
             of whether *features* and *reconstructed_features* include files or not. Note: if keyword argument 
             group_with_feature=True then the list contains tuples that group each :class:`feature<Feature>` with a list 
             of its reconstructed geometries.
-
-        Raises
-        ------
-        NotImplementedError
-            if the starting time for reconstruction “from_time” not equal to 0.0
         """
         from_time, to_time = float(from_time), float(to_time)
         if from_time != 0.0:
-            raise NotImplementedError("Soon...")
+            feature = self._reverse_reconstruct(feature, from_time, anchor_plate_id)
 
         reconstructed_features = []
         pygplates.reconstruct(feature, self.rotation_model, reconstructed_features, to_time,\
@@ -293,101 +1492,241 @@ class PlateReconstruction(object):
         return reconstructed_features
 
 
-    def get_point_velocities(self, lons, lats, time, delta_time=1.0):
-        """Generates a velocity domain feature collection, resolves them into points, and calculates the north and east 
-        components of the velocity vector for each point in the domain at a particular geological time. 
-        
-        Velocity domain feature collections are MeshNode-type features. These are produced from lat-lon points represented as
-        multi-point geometries (projections onto the surface of the unit length sphere). These features are resolved into 
-        domain points and assigned plate IDs, which are used to obtain the equivalent stage rotations of identified tectonic
-        plates over a time interval. Each velocity domain point and its stage rotation are used to calculate its velocity at 
-        a particular geological time. Obtained velocities for each domain point are represented in the north-east-down 
-        coordinate system. 
+    def _reverse_reconstruct(self, feature, from_time, anchor_plate_id=0):
+        """Returns copies of features whose geometries (positioned at ‘from_time’) are rotated back to present day."""
+        features = pygplates.FeaturesFunctionArgument(feature).get_features()
+
+        # group features by plate ID so each plate's rotation is obtained once
+        features_by_plate = {}
+        for i, feature in enumerate(features):
+            features_by_plate.setdefault(feature.get_reconstruction_plate_id(), []).append(i)
+
+        # retain the order of the input features
+        present_day_features = [None] * len(features)
+        for plate_id, indices in features_by_plate.items():
+            # rotation from 'from_time' to present day, i.e. the inverse of the from-time rotation
+            rotation = self.get_rotation(0.0, plate_id, from_time, anchor_plate_id)
+            for i in indices:
+                present_day_feature = features[i].clone()
+                geometry_property_names = set(
+                    prop.get_name() for prop in present_day_feature if present_day_feature.get_geometries(prop.get_name()))
+                for property_name in geometry_property_names:
+                    geometries = present_day_feature.get_geometries(property_name)
+                    present_day_feature.set_geometry([rotation * geometry for geometry in geometries], property_name)
+                present_day_features[i] = present_day_feature
+
+        return present_day_features
+
+
+    def reconstruct_points(self, lons, lats, plate_ids, to_time, from_time=0, anchor_plate_id=0):
+        """Reconstructs arrays of lat-lon points from one geological time to another using numpy array operations.
+
+        This is an array-native alternative to reconstructing point features with pygplates. The finite rotation of 
+        each unique (plate ID, reconstruction time) pair is obtained once (through the rotation cache) and converted to a
+        rotation matrix. All points are converted to Cartesian coordinates and rotated by the matrix of their pair with
+        vectorised matrix products, so no pygplates features or geometries are created.
 
         Parameters
         ----------
-        lons : array
-            A 1D array of longitude points.
+        lons, lats : 1D arrays
+            Longitudes and latitudes (degrees) of the points at ‘from_time’.
 
-        lats : array
-            A 1D array of latitude points.
+        plate_ids : int, or 1D array
+            The reconstruction plate ID of each point, or a single plate ID shared by all points.
 
-        time : float
-            The specific geological time (Ma) at which to calculate plate velocities.
+        to_time : float, or 1D array
+            The specific geological time (Ma) to reconstruct to, or the time to reconstruct each point to (e.g. its 
+            age). Points with a NaN time are returned as NaN.
 
-        delta_time : float, default=1.0
-            The time increment used for generating partitioning plate stage rotations. 1.0Ma by default.
+        from_time : float, default=0
+            The specific geological time (Ma) to reconstruct from. By default, this is set to present day.
+
+        anchor_plate_id : int, default=0
+            The anchor plate of the reconstruction model.
 
         Returns
         -------
-        all_velocities : 1D list of tuples
-            For each velocity domain feature point, a tuple of (north, east, down) velocity components is generated and 
-            appended to a list of velocity data. The length of all_velocities is equivalent to the number of domain points
-            resolved from the lat-lon array parameters.
+        rlons, rlats : 1D arrays
+            The reconstructed longitudes and latitudes (degrees) of the points at ‘to_time’.
         """
-        # Add points to a multipoint geometry
+        lons = np.atleast_1d(np.asarray(lons, dtype=float))
+        lats = np.atleast_1d(np.asarray(lats, dtype=float))
+        if lons.shape != lats.shape:
+            raise ValueError("'lons' and 'lats' must be of equal length ({} != {})".format(lons.size, lats.size))
+        plate_ids = np.broadcast_to(np.asarray(plate_ids, dtype=int), lons.shape).ravel()
+        to_time = np.broadcast_to(np.asarray(to_time, dtype=float), lons.shape).ravel()
+
+        rlons = np.full(lons.size, np.nan)
+        rlats = np.full(lats.size, np.nan)
+        valid = ~np.isnan(to_time)
+        if valid.any():
+            # one rotation matrix per unique (plate ID, time) pair
+            if np.all(to_time[valid] == to_time[valid][0]):
+                unique_plate_ids, rotation_index = np.unique(plate_ids[valid], return_inverse=True)
+                unique_times = np.full(unique_plate_ids.size, to_time[valid][0])
+            else:
+                unique_pairs, rotation_index = np.unique(
+                    np.column_stack((plate_ids[valid], to_time[valid])), axis=0, return_inverse=True)
+                unique_plate_ids, unique_times = unique_pairs[:,0].astype(int), unique_pairs[:,1]
+
+            quaternions = np.array([_tools.rotation_to_quaternion(
+                self.get_rotation(time, plate_id, from_time, anchor_plate_id))
+                for plate_id, time in zip(unique_plate_ids, unique_times)])
+            matrices = _tools.quaternion_to_matrix(quaternions.reshape(-1, 4))
+
+            xyz = np.column_stack(_tools.lonlat2xyz(lons.ravel()[valid], lats.ravel()[valid]))
+            rxyz = _tools.rotate_points(matrices, xyz, rotation_index.ravel())
+
+            # keep the rotated unit vectors on the sphere before converting back to lat-lon
+            rz = np.clip(rxyz[:,2], -1.0, 1.0)
+            rlons[valid] = np.rad2deg(np.arctan2(rxyz[:,1], rxyz[:,0]))
+            rlats[valid] = np.rad2deg(np.arcsin(rz))
+        return rlons.reshape(lons.shape), rlats.reshape(lats.shape)
+
+
+    def reconstruct_point_chunks(self, chunks, to_time=None, from_time=0, anchor_plate_id=0, resolution=1.0, out=None,
+                                 dtype=np.float64):
+        """Partitions and reconstructs a stream of point chunks, so that peak memory depends on the chunk size rather than
+        the size of the dataset.
+
+        Each chunk is handled as a Points object (without pygplates features): points without plate IDs are partitioned
+        into the static polygons at ‘from_time’ and then reconstructed with numpy, either to ‘to_time’ or, if ‘to_time’
+        is None, each to its own age. Results are yielded chunk by chunk, or written incrementally to ‘out’.
 
-        time = float(time)
+        Parameters
+        ----------
+        chunks : iterable
+            Chunks of points, e.g. from a memory-mapped .npy file or a CSV reader. Each chunk is either an (n,2) or (n,3)
+            array with columns of lon, lat and (optionally) age, or an object with fields "lons" and "lats" and, 
+            optionally, "ages" and "plate_ids" (a dict of arrays, a numpy structured array or a pandas DataFrame).
 
-        multi_point = pygplates.MultiPointOnSphere([(float(lat),float(lon)) for lat, lon in zip(lats,lons)])
+        to_time : float, default=None
+            The geological time (Ma) to reconstruct the points to. If None, each point is reconstructed to its age,
+            which the chunks must provide.
 
-        # Create a feature containing the multipoint feature, and defined as MeshNode type
-        meshnode_feature = pygplates.Feature(pygplates.FeatureType.create_from_qualified_string('gpml:MeshNode'))
-        meshnode_feature.set_geometry(multi_point)
-        meshnode_feature.set_name('Velocity Mesh Nodes from pygplates')
+        from_time : float, default=0
+            The geological time (Ma) at which the points are positioned.
 
-        velocity_domain_features = pygplates.FeatureCollection(meshnode_feature)
-        
-        # NB: at this point, the feature could be written to a file using
-        # output_feature_collection.write('myfilename.gpmlz')
-        
-        
-        # All domain points and associated (magnitude, azimuth, inclination) velocities for the current time.
-        all_domain_points = []
-        all_velocities = []
+        anchor_plate_id : int, default=0
+            The anchor plate of the reconstruction model.
 
-        # Partition our velocity domain features into our topological plate polygons at the current 'time'.
-        plate_partitioner = pygplates.PlatePartitioner(self.topology_features, self.rotation_model, time)
+        resolution : float, default=1.0
+            The cell size (degrees) of the spatial index used to partition the points (see partition_points).
 
-        for velocity_domain_feature in velocity_domain_features:
-            # A velocity domain feature usually has a single geometry but we'll assume it can be any number.
-            # Iterate over them all.
-            for velocity_domain_geometry in velocity_domain_feature.get_geometries():
+        out : array or file, default=None
+            An (N,2) array (e.g. a np.memmap or np.lib.format.open_memmap) to write the reconstructed [lon, lat] points 
+            to, in the order of the chunks, or a binary file object to append them to as raw (lon, lat) pairs of
+            ‘dtype’. By default, the results are yielded instead.
 
-                for velocity_domain_point in velocity_domain_geometry.get_points():
+        dtype : data-type, default=np.float64
+            The floating-point type of each chunk of points (and of the results written to a file).
 
-                    all_domain_points.append(velocity_domain_point)
+        Returns
+        -------
+        out : array or file
+            ‘out’, once all chunks have been written to it. If ‘out’ is None, a generator is returned instead, yielding
+            a (rlons, rlats, plate_ids) tuple of arrays for each chunk.
+        """
+        results = self._iter_point_chunks(chunks, to_time, from_time, anchor_plate_id, resolution, dtype)
+        if out is None:
+            return results
+
+        start = 0
+        for rlons, rlats, _ in results:
+            if hasattr(out, "write"):
+                out.write(np.column_stack((rlons, rlats)).astype(dtype).tobytes())
+            else:
+                out[start:start+rlons.size, 0] = rlons
+                out[start:start+rlons.size, 1] = rlats
+            start += rlons.size
+        return out
+
+
+    def _iter_point_chunks(self, chunks, to_time, from_time, anchor_plate_id, resolution, dtype):
+        """Yields (rlons, rlats, plate_ids) for each chunk of points."""
+        for chunk in chunks:
+            lons = _chunk_field(chunk, "lons", 0)
+            lats = _chunk_field(chunk, "lats", 1)
+            ages = _chunk_field(chunk, "ages", 2)
+            plate_ids = _chunk_field(chunk, "plate_ids")
+
+            if plate_ids is None:
+                plate_ids = self.partition_points(lons, lats, from_time, resolution)
+                plate_ids[plate_ids < 0] = 0 # points outside the static polygons keep the default plate ID
+            points = Points(self, lons, lats, from_time, plate_ids, dtype=dtype)
+
+            if to_time is not None:
+                rlons, rlats = points.reconstruct(to_time, anchor_plate_id, backend="numpy")
+            elif ages is None:
+                raise ValueError("Chunks must provide ages when to_time is None")
+            else:
+                rlons, rlats = points.reconstruct_to_birth_age(ages, anchor_plate_id)
+            yield rlons, rlats, points.plate_id
+
+
+    def get_point_velocities(self, lons, lats, time, delta_time=1.0, resolution=1.0):
+        """Partitions a set of lat-lon points into topological plates and calculates the north and east components of the
+        velocity vector for each point at a particular geological time.
+
+        All points are partitioned first, using the plate-ID raster of the resolved topologies at ‘time’ (see 
+        TopologySnapshot.plate_id_raster) so that only points near plate boundaries are partitioned exactly, and then
+        grouped by their partitioning plate ID. The equivalent stage rotation of each plate over the time interval is only
+        obtained once and converted to an angular velocity, from which the velocities of all points are evaluated together
+        as array operations. Obtained velocities for each point are represented in the north-east-down coordinate system.
+        Points that do not fall within a topological plate are given a velocity of zero.
 
-                    partitioning_plate = plate_partitioner.partition_point(velocity_domain_point)
-                    if partitioning_plate:
+        Parameters
+        ----------
+        lons : array
+            A 1D array of longitude points.
 
-                        # We need the newly assigned plate ID
-                        # to get the equivalent stage rotation of that tectonic plate.
-                        partitioning_plate_id = partitioning_plate.get_feature().get_reconstruction_plate_id()
+        lats : array
+            A 1D array of latitude points.
 
-                        # Get the stage rotation of partitioning plate from 'time + delta_time' to 'time'.
-                        equivalent_stage_rotation = self.rotation_model.get_rotation(time,
-                                                                                     partitioning_plate_id,
-                                                                                     time + delta_time)
+        time : float
+            The specific geological time (Ma) at which to calculate plate velocities.
 
-                        # Calculate velocity at the velocity domain point.
-                        # This is from 'time + delta_time' to 'time' on the partitioning plate.
-                        velocity_vectors = pygplates.calculate_velocities(
-                            [velocity_domain_point],
-                            equivalent_stage_rotation,
-                            delta_time)
+        delta_time : float, default=1.0
+            The time increment used for generating partitioning plate stage rotations. 1.0Ma by default.
 
-                        # Convert global 3D velocity vectors to local (magnitude, azimuth, inclination) tuples
-                        # (one tuple per point).
-                        velocities =pygplates.LocalCartesian.convert_from_geocentric_to_north_east_down(
-                                [velocity_domain_point],
-                                velocity_vectors)
-                        all_velocities.append((velocities[0].get_x(), velocities[0].get_y()))
+        resolution : float, default=1.0
+            The cell size (degrees) of the plate-ID raster used to partition points. Set to None to partition every point
+            exactly.
 
-                    else:
-                        all_velocities.append((0,0))
-                        
-        return np.array(all_velocities)
+        Returns
+        -------
+        all_velocities : 2D numpy array
+            An array of shape (n,2) holding the (north, east) velocity components (in kms/Myr) of each point. The length
+            of all_velocities is equivalent to the number of points in the lat-lon array parameters.
+        """
+        time = float(time)
+        lons = np.atleast_1d(np.asarray(lons, dtype=float)).ravel()
+        lats = np.atleast_1d(np.asarray(lats, dtype=float)).ravel()
+
+        # Partition all points into our topological plate polygons at the current 'time'.
+        snapshot = self.topology_snapshot(time)
+        if resolution is None:
+            plate_ids = _partition_points(snapshot.plate_partitioner, lons, lats)
+        else:
+            plate_ids = snapshot.plate_id_raster(resolution).partition_points(lons, lats)
+
+        all_velocities = np.zeros((lons.size, 2))
+        partitioned = plate_ids >= 0
+        if not partitioned.any():
+            return all_velocities
+
+        # one stage rotation from 'time + delta_time' to 'time' per partitioning plate
+        unique_plate_ids, plate_index = np.unique(plate_ids[partitioned], return_inverse=True)
+        angular_velocities = np.empty((unique_plate_ids.size, 3))
+        for i, partitioning_plate_id in enumerate(unique_plate_ids):
+            equivalent_stage_rotation = self.get_rotation(time, partitioning_plate_id, time + delta_time)
+            angular_velocities[i] = _tools.angular_velocity(equivalent_stage_rotation, delta_time)
+
+        north, east = _tools.calculate_north_east_velocities(
+            lons[partitioned], lats[partitioned], angular_velocities[plate_index])
+        all_velocities[partitioned, 0] = north
+        all_velocities[partitioned, 1] = east
+        return all_velocities
 
 
 
@@ -400,34 +1739,49 @@ class Points(object):
     Attributes
     ----------
     PlateReconstruction_object : object pointer
-    lons, lats : 1d array
+    lons, lats : 1d array (views of lonlat)
     time : float
-    plate_id : int
-    x, y, z : 1d array
-    lonlat, xyz : list
+    plate_id : 1d array (int32)
+    x, y, z : 1d array (derived on first access)
+    lonlat : 2d array
+    xyz : 2d array (derived on first access)
     rotation_model : str, or list (accessed using PlateReconstruction_object.rotation_model)
     static_polygons : str, or list (accessed using PlateReconstruction_object.static_polygons)
-    features : list
-    FeatureCollection : list 
+    features : list (built on first access)
+    FeatureCollection : list (built on first access)
 
     Methods
     -------
-     __init__(self, PlateReconstruction_object, lons, lats, time=0, plate_id=None)
+     __init__(self, PlateReconstruction_object, lons, lats, time=0, plate_id=None, dtype=np.float64, nprocs=1)
         Constructs all necessary attributes for the points object.
         
-    reconstruct(self, time, anchor_plate_id=0, **kwargs)
+    reconstruct(self, time, anchor_plate_id=0, backend="pygplates", nprocs=1, **kwargs)
         Reconstructs regular geological features, motion paths or flowlines to a specific geological time and extracts
         the latitudinal and longitudinal points of these features.
         
-    plate_velocity(self, time, delta_time=1)
+    reconstruct_series(self, times, anchor_plate_id=0, stream=False, chunk_size=100, rotation_table=None)
+        Reconstructs the points to a series of geological times and returns (ntimes, npoints) trajectory arrays.
+
+    reconstruct_to_birth_age(self, ages, anchor_plate_id=0, age_tolerance=None)
+        Reconstructs each point to its own age, rotating each point only once.
+
+    plate_velocity(self, time, delta_time=1, reconstruct=False)
         Calculates the x and y components of tectonic plate velocities at a particular geological time.
         
     save(self, filename)
-        Saves the feature collection used in the Points object under a given filename to the current directory. 
+        Saves the Points object, as a compact ‘.npz’ file or as a feature collection, under a given filename to the 
+        current directory. 
+
+    load(PlateReconstruction_object, filename)
+        Loads a Points object saved in the ‘.npz’ format without partitioning the points again.
     """
-    def __init__(self, PlateReconstruction_object, lons, lats, time=0, plate_id=None):
+    def __init__(self, PlateReconstruction_object, lons, lats, time=0, plate_id=None, dtype=np.float64, nprocs=1):
         """Constructs all necessary attributes for the points object.
 
+        The points are stored once, as a compact (n,2) lon-lat array and an int32 plate ID array. Everything else (the
+        Cartesian coordinates and the pygplates point features) is derived from them on first access and then cached, so 
+        large point sets that are only reconstructed with numpy never create pygplates objects.
+
         Parameters
         ----------
         PlateReconstruction_object : object pointer
@@ -442,21 +1796,35 @@ class Points(object):
             A single point, or a 1D array of latitude points.
 
         time : float, default=0
-            The specific geological time (Ma) at which to start reconstructing. Default time is present day (0).
+            The specific geological time (Ma) at which to start reconstructing, i.e. the time at which the given points
+            are positioned. Default time is present day (0). The points are kept positioned at this time, and are 
+            reconstructed from it (in the frame of the anchor plate given to each reconstruction).
+
+        plate_id : int, or 1D array, default=None
+            The plate ID of a particular tectonic plate, or the plate ID of each point. Defaults to none, in which case
+            points are partitioned into the static polygons to obtain their plate IDs.
 
-        plate_id : int, default=None
-            The plate ID of a particular tectonic plate. Defaults to none.
+        dtype : data-type, default=np.float64
+            The floating-point type of the stored lon-lat array. np.float32 halves the memory of the points (at a 
+            precision of about a metre).
+
+        nprocs : int, default=1
+            The number of worker processes used to partition the points into the static polygons (see 
+            PlateReconstruction.partition_points).
 
         Returns
         -------
         An extension of accessible points object attributes, such as:
 
-        x, y, z : float, or 1D array
-            Cartesian coordinate equivalents of supplied lat, lon points scaled to mean Earth radius in km.
+        x, y, z : 1D array
+            Cartesian coordinate equivalents of supplied lat, lon points scaled to mean Earth radius in km (views of xyz).
+
+        plate_id : 1D array
+            The reconstruction plate ID of each point.
 
-        lonlat, xyz : list
-            Concatenated arrays of [lat, lon] points or their [x, y, z] Cartesian coordinate equivalents. Each list element 
-            can be a float or 1D array.
+        lonlat, xyz : 2D array
+            The canonical (n,2) array of [lon, lat] points, and the (n,3) array of their [x, y, z] Cartesian coordinate 
+            equivalents.
 
         rotation_model, static_polygons : :class:`FeatureCollection`, or str, or :class:`Feature`, or sequence of
         :class:`Feature`, or a sequence of any combination of those four types, default=None
@@ -473,41 +1841,83 @@ class Points(object):
         FeatureCollection : list
             A list of a set of features aggregated into a feature collection. 
         """
-        self.lons = lons
-        self.lats = lats
+        lons = np.atleast_1d(np.asarray(lons, dtype=dtype)).ravel()
+        lats = np.atleast_1d(np.asarray(lats, dtype=dtype)).ravel()
+        if lons.size != lats.size:
+            raise ValueError("'lons' and 'lats' must be of equal length ({} != {})".format(lons.size, lats.size))
+
+        # the canonical copy of the points
+        self.lonlat = np.empty((lons.size, 2), dtype=dtype)
+        self.lonlat[:,0] = lons
+        self.lonlat[:,1] = lats
         self.time = time
 
-        # get Cartesian coordinates
-        self.x, self.y, self.z = _tools.lonlat2xyz(lons, lats, degrees=False)
-
-        # scale by average radius of the Earth
-        self.x *= _tools.EARTH_RADIUS
-        self.y *= _tools.EARTH_RADIUS
-        self.z *= _tools.EARTH_RADIUS
-
-        # store concatenated arrays
-        self.lonlat = np.c_[self.lons, self.lats]
-        self.xyz = np.c_[self.x, self.y, self.z]
-
-
-        rotation_model = PlateReconstruction_object.rotation_model
-        static_polygons = PlateReconstruction_object.static_polygons
         self.PlateReconstruction_object = PlateReconstruction_object
 
-        features = _tools.points_to_features(lons, lats, plate_id)
-
-        if plate_id:
-            self.features = features
-        else:
+        if plate_id is None:
             # partition using static polygons
             # being careful to observe 'from time'
-            partitioned_features = pygplates.partition_into_plates(static_polygons, rotation_model, features)
-            self.features = partitioned_features
-
-        self.FeatureCollection = pygplates.FeatureCollection(self.features)
-
-
-    def reconstruct(self, time, anchor_plate_id=0, **kwargs):
+            plate_id = PlateReconstruction_object.partition_points(self.lons, self.lats, time, nprocs=nprocs)
+            plate_id[plate_id < 0] = 0 # points outside the static polygons keep the default plate ID
+        self.plate_id = np.array(np.broadcast_to(plate_id, lons.shape), dtype=np.int32)
+
+        # derived on first access
+        self._xyz = None
+        self._features = None
+        self._FeatureCollection = None
+
+
+    @property
+    def lons(self):
+        """The longitudes of the points (a view of lonlat)."""
+        return self.lonlat[:,0]
+
+    @property
+    def lats(self):
+        """The latitudes of the points (a view of lonlat)."""
+        return self.lonlat[:,1]
+
+    @property
+    def xyz(self):
+        """The (n,3) Cartesian coordinates of the points scaled to mean Earth radius in km, derived on first access."""
+        if self._xyz is None:
+            xyz = np.column_stack(_tools.lonlat2xyz(self.lons, self.lats))
+            xyz *= _tools.EARTH_RADIUS
+            self._xyz = xyz
+        return self._xyz
+
+    @property
+    def x(self):
+        """The x coordinates of the points in km (a view of xyz)."""
+        return self.xyz[:,0]
+
+    @property
+    def y(self):
+        """The y coordinates of the points in km (a view of xyz)."""
+        return self.xyz[:,1]
+
+    @property
+    def z(self):
+        """The z coordinates of the points in km (a view of xyz)."""
+        return self.xyz[:,2]
+
+    @property
+    def features(self):
+        """The pygplates point features of the points (with geometries positioned at ‘time’), built on first access."""
+        if self._features is None:
+            self._features = _tools.points_to_features(
+                self.lons.astype(float), self.lats.astype(float), self.plate_id.tolist())
+        return self._features
+
+    @property
+    def FeatureCollection(self):
+        """A feature collection of the point features, built on first access."""
+        if self._FeatureCollection is None:
+            self._FeatureCollection = pygplates.FeatureCollection(self.features)
+        return self._FeatureCollection
+
+
+    def reconstruct(self, time, anchor_plate_id=0, backend="pygplates", nprocs=1, **kwargs):
         """Reconstructs regular geological features, motion paths or flowlines to a specific geological time and extracts 
         the latitudinal and longitudinal points of these features.
 
@@ -522,6 +1932,17 @@ class Points(object):
         anchor_plate_id : int, default=0
             The anchor plate of the reconstruction model.
 
+        backend : str, default="pygplates"
+            The reconstruction engine. "pygplates" reconstructs the point features with pygplates.reconstruct. "numpy" 
+            rotates the lat-lon point arrays directly by the rotation of each plate ID (see 
+            PlateReconstruction.reconstruct_points), which is much faster and lighter for large numbers of points. 
+            Keyword arguments below only apply to the "pygplates" backend.
+
+        nprocs : int, default=1
+            The number of worker processes used by the "pygplates" backend. When nprocs > 1, the points are split into 
+            chunks that are reconstructed in a pool of worker processes, each of which loads the rotation model once and 
+            returns its reconstructed points as numpy arrays rather than pygplates objects.
+
         **reconstruct_type : ReconstructType, default=ReconstructType.feature_geometry
             The specific reconstruction type to generate based on input feature geometry type. Can be provided as
             ReconstructType.feature_geometry to only reconstruct regular feature geometries, or ReconstructType.MotionPath to
@@ -543,14 +1964,25 @@ class Points(object):
         -------
         rlons, rlats : lists
             Two 1D numpy arrays enclosing all reconstructed feature points transformed into lat-lon points. 
-
-        Raises
-        ------
-        NotImplementedError
-            if the starting time for reconstruction “from_time” not equal to 0.0
         """
-        from_time = self.time
+        if backend == "numpy":
+            return self.PlateReconstruction_object.reconstruct_points(
+                self.lons, self.lats, self.plate_id, time, self.time, anchor_plate_id=anchor_plate_id)
+        elif backend != "pygplates":
+            raise ValueError("backend must be 'pygplates' or 'numpy' (backend = {})".format(backend))
+
         to_time = time
+        if nprocs is not None and nprocs > 1 and self.plate_id.size > 1:
+            tasks = [("_reconstruct_point_features", (chunk_lons, chunk_lats, chunk_plate_ids.tolist(), to_time, self.time),
+                      dict(kwargs, anchor_plate_id=anchor_plate_id))
+                     for chunk_lons, chunk_lats, chunk_plate_ids in zip(
+                         *_split_chunks(nprocs, self.lons.astype(float), self.lats.astype(float), self.plate_id))]
+            results = list(self.PlateReconstruction_object._map_tasks(tasks, nprocs))
+            rlons = np.concatenate([np.atleast_1d(result[0]) for result in results])
+            rlats = np.concatenate([np.atleast_1d(result[1]) for result in results])
+            return rlons, rlats
+
+        from_time = self.time
         reconstructed_features = self.PlateReconstruction_object.reconstruct(
             self.features, to_time, from_time, anchor_plate_id=anchor_plate_id, **kwargs)
 
@@ -558,39 +1990,139 @@ class Points(object):
         return rlons, rlats
 
 
-    def reconstruct_to_birth_age(self, ages, anchor_plate_id=0, **kwargs):
-        from_time = self.time
-        ages = np.array(ages)
-
-        if len(ages) != len(self.features):
-            raise ValueError("Number of points and ages must be identical")
+    def reconstruct_series(self, times, anchor_plate_id=0, stream=False, chunk_size=100, rotation_table=None):
+        """Reconstructs the points to a series of geological times and returns their trajectories.
 
-        unique_ages = np.unique(ages)
-        rlons = np.zeros(ages.shape)
-        rlats = np.zeros(ages.shape)
+        The points are converted to Cartesian coordinates and sorted by plate ID once. At each time, one rotation 
+        matrix per plate is obtained (from the rotation cache of the PlateReconstruction object, or from a compiled 
+        RotationTable) and the points of each plate are rotated as one block with a matrix product.
 
-        for age in unique_ages:
-            mask_age = ages == age
+        Parameters
+        ----------
+        times : 1D array
+            The geological times (Ma) to reconstruct the points to.
 
-            reconstructed_features = self.PlateReconstruction_object.reconstruct(
-                self.features, age, from_time, anchor_plate_id=anchor_plate_id, **kwargs)
+        anchor_plate_id : int, default=0
+            The anchor plate of the reconstruction model.
 
-            lons, lats = _tools.extract_feature_lonlat(reconstructed_features)
+        stream : bool, default=False
+            Choose whether to return a generator that yields the trajectories in chunks of ‘chunk_size’ times, so that
+            memory stays bounded for long series, rather than the full arrays.
 
-            rlons[mask_age] = lons[mask_age]
-            rlats[mask_age] = lats[mask_age]
+        chunk_size : int, default=100
+            The number of times in each chunk yielded when stream=True.
 
+        rotation_table : RotationTable, default=None
+            A compiled rotation table (see PlateReconstruction.compile_rotation_table) to obtain the rotations from. Its
+            time grid must cover ‘times’ and the time of the points, and its anchor plate must be ‘anchor_plate_id’.
 
+        Returns
+        -------
+        rlons, rlats : 2D arrays
+            Arrays of shape (ntimes, npoints) holding the reconstructed longitudes and latitudes (degrees) of each point
+            at each time. If stream=True, a generator of (times, rlons, rlats) tuples is returned instead, where each 
+            tuple holds a chunk of times and the (nchunk, npoints) trajectories at those times.
+        """
+        times = np.atleast_1d(np.asarray(times, dtype=float))
+        if rotation_table is not None and rotation_table.anchor_plate_id != anchor_plate_id:
+            raise ValueError("The anchor plate of the rotation table ({}) is not anchor_plate_id ({})".format(
+                rotation_table.anchor_plate_id, anchor_plate_id))
+
+        chunks = self._iter_reconstruct_series(times, anchor_plate_id, int(chunk_size), rotation_table)
+        if stream:
+            return chunks
+
+        rlons = np.empty((times.size, self.plate_id.size))
+        rlats = np.empty((times.size, self.plate_id.size))
+        start = 0
+        for chunk_times, chunk_lons, chunk_lats in chunks:
+            rlons[start:start+chunk_times.size] = chunk_lons
+            rlats[start:start+chunk_times.size] = chunk_lats
+            start += chunk_times.size
         return rlons, rlats
 
-    def plate_velocity(self, time, delta_time=1):
+
+    def _iter_reconstruct_series(self, times, anchor_plate_id, chunk_size, rotation_table):
+        """Yields (times, rlons, rlats) for chunks of ‘times’, reusing the plate grouping of the points."""
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be greater than zero (chunk_size = {})".format(chunk_size))
+
+        # sort the points by plate once so each plate's points are rotated as one contiguous block
+        unique_plate_ids, plate_index = np.unique(self.plate_id, return_inverse=True)
+        order = np.argsort(plate_index.ravel(), kind="stable")
+        bounds = np.searchsorted(plate_index.ravel()[order], np.arange(unique_plate_ids.size + 1))
+        xyz = np.column_stack(_tools.lonlat2xyz(self.lons[order].astype(float), self.lats[order].astype(float)))
+        rxyz = np.empty_like(xyz)
+
+        for start in range(0, times.size, chunk_size):
+            chunk_times = times[start:start+chunk_size]
+
+            # rotation matrices of shape (nchunk, nplates, 3, 3)
+            if rotation_table is not None:
+                matrices = rotation_table.get_matrices(
+                    chunk_times[:,np.newaxis], unique_plate_ids[np.newaxis,:], self.time)
+            else:
+                quaternions = np.array([[_tools.rotation_to_quaternion(
+                    self.PlateReconstruction_object.get_rotation(time, plate_id, self.time, anchor_plate_id))
+                    for plate_id in unique_plate_ids] for time in chunk_times])
+                matrices = _tools.quaternion_to_matrix(quaternions.reshape(chunk_times.size, -1, 4))
+
+            rlons = np.empty((chunk_times.size, xyz.shape[0]))
+            rlats = np.empty((chunk_times.size, xyz.shape[0]))
+            for i in range(chunk_times.size):
+                for j in range(unique_plate_ids.size):
+                    np.dot(xyz[bounds[j]:bounds[j+1]], matrices[i,j].T, out=rxyz[bounds[j]:bounds[j+1]])
+                rlons[i, order] = np.rad2deg(np.arctan2(rxyz[:,1], rxyz[:,0]))
+                rlats[i, order] = np.rad2deg(np.arcsin(np.clip(rxyz[:,2], -1.0, 1.0)))
+            yield chunk_times, rlons, rlats
+
+
+    def reconstruct_to_birth_age(self, ages, anchor_plate_id=0, age_tolerance=None):
+        """Reconstructs each point to its own age (e.g. the age of the seafloor at that point).
+
+        Points are grouped by (plate ID, age) so each point is rotated only once, by the rotation of its group, with
+        PlateReconstruction.reconstruct_points.
+
+        Parameters
+        ----------
+        ages : 1D array
+            The age (Ma) to reconstruct each point to. Points with a NaN age are returned as NaN.
+
+        anchor_plate_id : int, default=0
+            The anchor plate of the reconstruction model.
+
+        age_tolerance : float, default=None
+            If given, ages are rounded to the nearest multiple of ‘age_tolerance’ (Myr) before grouping, which bounds the
+            number of rotations needed for continuous ages at the cost of a small positional error. By default, every 
+            distinct age is reconstructed exactly.
+
+        Returns
+        -------
+        rlons, rlats : 1D arrays
+            The longitudes and latitudes (degrees) of the points reconstructed to their ages.
+        """
+        ages = np.array(ages, dtype=float)
+
+        if len(ages) != len(self.plate_id):
+            raise ValueError("Number of points and ages must be identical")
+
+        if age_tolerance is not None:
+            if age_tolerance <= 0:
+                raise ValueError("age_tolerance must be greater than zero (age_tolerance = {})".format(age_tolerance))
+            ages = np.round(ages / age_tolerance) * age_tolerance
+
+        return self.PlateReconstruction_object.reconstruct_points(
+            self.lons, self.lats, self.plate_id, ages, self.time, anchor_plate_id=anchor_plate_id)
+
+    def plate_velocity(self, time, delta_time=1, reconstruct=False):
         """Calculates the x and y components of tectonic plate velocities at a particular geological time.
 
-        This method accesses and uses the rotation_model attribute from the PointReconstruction object, and uses the features
-        attribute of this Points object. Feature points are extracted and assigned plate IDs that are used to obtain the
-        equivalent stage rotations of identified tectonic plates over a time interval. Each feature point and its stage rotation
-        are used to calculate its plate velocity at a particular geological time. Obtained velocities for each domain point are
-        represented in the north-east-down coordinate system, and their x,y Cartesian coordinate components are extracted. 
+        This method obtains rotations through the rotation cache of the PlateReconstruction object, and uses the stored
+        lat-lon coordinates and plate IDs of the points of this Points object. Points are grouped by plate ID, and the 
+        equivalent stage rotation of each plate over the time interval is obtained once and converted to an angular 
+        velocity. The velocities of all points are then evaluated together as numpy cross products. Obtained velocities 
+        for each point are represented in the north-east-down coordinate system, and their x,y (north, east) components 
+        are extracted. 
 
         Parameters
         ----------
@@ -599,42 +2131,47 @@ class Points(object):
 
         delta_time : float, default=1.0
             The time increment used for generating partitioning plate stage rotations. 1.0Ma by default.
-            
+
+        reconstruct : bool, default=False
+            Choose whether to evaluate the velocities where the points are at ‘time’, by first reconstructing the points
+            from the time they are positioned at (see PlateReconstruction.reconstruct_points). By default, velocities 
+            are evaluated at the stored coordinates of the points.
 
         Returns
         -------
         all_velocities.T : 2D numpy list
             A transposed 2D numpy list with two rows and a number of columns equal to the number of x,y Cartesian velocity 
             components obtained (and thus the number of feature points extracted from a supplied feature). Each list column 
-            stores one point’s x,y, velocity components along its two rows.
+            stores one point’s x,y, velocity components (in cm/yr) along its two rows.
         """
-        rotation_model = self.PlateReconstruction_object.rotation_model
-        all_velocities = np.empty((len(self.features), 2))
-
-        for i, feature in enumerate(self.features):
-            geometry = feature.get_geometry()
-            partitioning_plate_id = feature.get_reconstruction_plate_id()
-            equivalent_stage_rotation = rotation_model.get_rotation(time, partitioning_plate_id, time+delta_time)
-            
-            velocity_vectors = pygplates.calculate_velocities(
-                [geometry],
-                equivalent_stage_rotation,
-                delta_time,
-                pygplates.VelocityUnits.cms_per_yr)
-            
-            velocities = pygplates.LocalCartesian.convert_from_geocentric_to_north_east_down(
-                [geometry],
-                velocity_vectors)
-
-            all_velocities[i] = velocities[0].get_x(), velocities[0].get_y()
-
+        lons, lats = self.lons, self.lats
+        if reconstruct and float(time) != float(self.time):
+            lons, lats = self.PlateReconstruction_object.reconstruct_points(lons, lats, self.plate_id, time, self.time)
+        lons = np.atleast_1d(np.asarray(lons, dtype=float))
+        lats = np.atleast_1d(np.asarray(lats, dtype=float))
+
+        # one stage rotation from 'time + delta_time' to 'time' per plate
+        unique_plate_ids, plate_index = np.unique(self.plate_id, return_inverse=True)
+        angular_velocities = np.empty((unique_plate_ids.size, 3))
+        for i, partitioning_plate_id in enumerate(unique_plate_ids):
+            equivalent_stage_rotation = self.PlateReconstruction_object.get_rotation(
+                time, partitioning_plate_id, time+delta_time)
+            angular_velocities[i] = _tools.angular_velocity(equivalent_stage_rotation, delta_time)
+
+        north, east = _tools.calculate_north_east_velocities(
+            lons, lats, angular_velocities[plate_index.ravel()], pygplates.VelocityUnits.cms_per_yr)
+
+        all_velocities = np.column_stack((north, east))
         return list(all_velocities.T)
 
 
     def save(self, filename):
-        """Saves the feature collection used in the Points object under a given filename to the current directory. 
+        """Saves the Points object under a given filename to the current directory. 
 
-        The needed file format to save to is determined from the filename extension. 
+        The needed file format to save to is determined from the filename extension. A ‘.npz’ filename saves the points
+        in a compact binary numpy format (lon-lat array, plate IDs and time) that can be read back quickly with 
+        Points.load, without partitioning the points again. Any other extension saves the point features through 
+        pygplates (e.g. ‘.gpml’).
 
         Parameters
         ----------
@@ -643,6 +2180,34 @@ class Points(object):
 
         Returns
         -------
-        Feature collection saved under given filename to current directory.
+        Points or feature collection saved under given filename to current directory.
+        """
+        if str(filename).lower().endswith(".npz"):
+            np.savez(filename, lonlat=self.lonlat, plate_id=self.plate_id, time=self.time)
+        else:
+            self.FeatureCollection.write(filename)
+
+
+    @classmethod
+    def load(cls, PlateReconstruction_object, filename):
+        """Loads a Points object saved in the ‘.npz’ format by Points.save.
+
+        The stored plate IDs are restored as they are, so the points are not partitioned into the static polygons again.
+
+        Parameters
+        ----------
+        PlateReconstruction_object : object pointer
+            The PlateReconstruction object used by the loaded points.
+
+        filename : string
+            The path of the ‘.npz’ file to read.
+
+        Returns
+        -------
+        points : Points
+            The loaded points, with the same lon-lat precision, plate IDs and time as the saved points.
         """
-        self.FeatureCollection.save(filename)
+        with np.load(filename) as data:
+            lonlat = data["lonlat"]
+            return cls(PlateReconstruction_object, lonlat[:,0], lonlat[:,1], time=float(data["time"]),
+                       plate_id=data["plate_id"], dtype=lonlat.dtype)
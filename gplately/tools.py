@@ -2,6 +2,7 @@
 """
 import numpy as np
 import pygplates
+from scipy.special import erfinv as _erfinv
 
 EARTH_RADIUS = pygplates.Earth.mean_radius_in_kms
 
@@ -10,6 +11,56 @@ _DEFAULT_T_MANTLE = 1350.0
 _DEFAULT_KAPPA = 8.04e-7
 _SEC_PER_MYR = 3.15576e13
 
+_N_TERMS = 19
+
+def _plate_temp_series(age, z, plate_thickness, kappa, t_mantle, t_surface, gradient=False):
+    """Sums the cooling plate series for 1D arrays of `age` (Ma) and `z` (m), and optionally its depth derivative.
+
+    sin(k*x), cos(k*x) and exp(k**2 * e) are advanced by recurrence so each term costs a few in-place multiplies.
+    """
+    x = np.pi / plate_thickness * z
+    q = np.exp(-kappa * np.pi ** 2 / plate_thickness ** 2 * _SEC_PER_MYR * age)
+    q2 = q * q
+    two_cos = 2.0 * np.cos(x)
+
+    sin_prev = np.zeros_like(x)
+    sin_k = np.sin(x)
+    decay = q.copy()    # exp(k**2 * e)
+    step = q2 * q       # exp((2k + 1) * e)
+    total = sin_k * decay
+    if gradient:
+        cos_prev = np.ones_like(x)
+        cos_k = 0.5 * two_cos
+        dtotal = cos_k * decay
+        cos_next = np.empty_like(x)
+    sin_next = np.empty_like(x)
+    term = np.empty_like(x)
+    for k in range(2, _N_TERMS + 1):
+        np.multiply(two_cos, sin_k, out=sin_next)
+        sin_next -= sin_prev
+        sin_prev, sin_k, sin_next = sin_k, sin_next, sin_prev
+        decay *= step
+        step *= q2
+        np.multiply(sin_k, decay, out=term)
+        term /= k
+        total += term
+        if gradient:
+            np.multiply(two_cos, cos_k, out=cos_next)
+            cos_next -= cos_prev
+            cos_prev, cos_k, cos_next = cos_k, cos_next, cos_prev
+            np.multiply(cos_k, decay, out=term)
+            dtotal += term
+
+    delta_t = t_mantle - t_surface
+    total *= 2.0 * delta_t / np.pi
+    total += t_surface + delta_t / plate_thickness * z
+    if not gradient:
+        return total
+    dtotal *= 2.0 * delta_t / plate_thickness
+    dtotal += delta_t / plate_thickness
+    return total, dtotal
+
+
 def plate_temp(
     age,
     z,
@@ -24,36 +75,28 @@ def plate_temp(
 
     Parameters
     ----------
-    age : float
+    age : float or ndarray
         The geological time (Ma) at which to calculate plate temperature.
 
-    z : float
-        The plate depth (m) at which to calculate temperature.
+    z : float or ndarray
+        The plate depth (m) at which to calculate temperature. `age` and `z` are broadcast against each other.
 
     PLATE_THICKNESS : float
         The thickness (m) of the plate in consideration.
 
     Returns
     -------
-    list
-        A list enclosing ONE floating-point number equal to plate temperature (e.g. [1367.33962383]).
+    float or ndarray
+        The plate temperature, as a single floating-point number (e.g. 1367.33962383) if only one temperature is
+        computed, otherwise as an array with the broadcast shape of `age` and `z`.
     """
-
-    age = age * _SEC_PER_MYR
-
-    sine_arg = np.pi * z / plate_thickness
-    exp_arg = -kappa * (np.pi ** 2) * age / (plate_thickness ** 2)
-    k = np.arange(1, 20).reshape(-1, 1)
-    cumsum = (np.sin(k * sine_arg) * np.exp((k ** 2) * exp_arg) / k).sum(axis=0)
-
-    result = (
-        t_surface
-        + 2.0 * cumsum * (t_mantle - t_surface) / np.pi
-        + (t_mantle - t_surface) * z / plate_thickness
+    age, z = np.broadcast_arrays(np.asarray(age, dtype=float), np.asarray(z, dtype=float))
+    result = _plate_temp_series(
+        age.ravel(), z.ravel(), plate_thickness, kappa, t_mantle, t_surface
     )
     if result.size == 1:
         return result[0]
-    return result
+    return result.reshape(age.shape)
 
 def plate_isotherm_depth(
     age,
@@ -64,7 +107,8 @@ def plate_isotherm_depth(
 ):
     """Computes the depth to the temp - isotherm in a cooling plate mode. Solution by iteration. 
 
-    By default the plate thickness is 125 km as in Parsons/Sclater.
+    By default the plate thickness is 125 km as in Parsons/Sclater. Each depth is found with a Newton iteration 
+    safeguarded by bisection inside [0, plate_thickness]; elements drop out of the iteration once they converge.
 
     Parameters
     ----------
@@ -74,42 +118,237 @@ def plate_isotherm_depth(
     temp : float, default=1350.0
         The temperature of a temp-isotherm to calculate the depth to. Defaults to 1350 degrees.
 
+    n : int, default=20
+        The maximum number of iterations.
+
+    rtol : float, default=0.001
+        The tolerance (degrees) on the isotherm temperature at which an element is considered converged.
+
     Returns
     -------
     zi : ndarray
         An array of depths to the chosen temperature isotherm. Each entry corresponds to each unique ‘age’ given. 
+        Ages of zero or less give a depth of zero and NaN ages give NaN.
     """
     n = int(n)
     if n <= 0:
         raise ValueError("n must be greater than zero (n = {})".format(n))
-    age = np.atleast_1d(age)
-
-    zi = np.atleast_1d(np.zeros_like(age, dtype=float))  # starting depth is 0
-
-    z_too_small = np.atleast_1d(np.zeros_like(age, dtype=float))
-    z_too_big = np.atleast_1d(np.full_like(age, plate_thickness, dtype=float))
+    age, temp = np.broadcast_arrays(np.atleast_1d(np.asarray(age, dtype=float)), temp)
+    shape = age.shape
+    age = age.ravel()
+    temp = np.asarray(temp, dtype=float).ravel()
+
+    zi = np.zeros(age.shape, dtype=float)
+    zi[np.isnan(age)] = np.nan
+
+    # only positive ages are iterated; the rest keep 0 (or NaN)
+    active = np.flatnonzero(age > 0)
+    a = age[active]
+    t = temp[active]
+    z_too_small = np.zeros(active.size)
+    z_too_big = np.full(active.size, float(plate_thickness))
+    # start from the half-space cooling depth, which is close to the plate solution except near the base
+    with np.errstate(divide="ignore", invalid="ignore"):
+        z = 2.0 * np.sqrt(_DEFAULT_KAPPA * _SEC_PER_MYR * a) * _erfinv(t / _DEFAULT_T_MANTLE)
+    z = np.clip(np.nan_to_num(z, nan=0.5 * plate_thickness), 0.01 * plate_thickness, 0.99 * plate_thickness)
 
-    func = np.vectorize(plate_temp)
     for _ in range(n):
-        zi = 0.5 * (z_too_small + z_too_big)
-        ti = func(age, zi, plate_thickness)
-        t_diff = temp - ti
-        z_too_big[t_diff < -rtol] = zi[t_diff < -rtol]
-        z_too_small[t_diff > rtol] = zi[t_diff > rtol]
-
-        if (np.abs(t_diff) < rtol).all():
+        if active.size == 0:
             break
+        ti, dtdz = _plate_temp_series(
+            a, z, plate_thickness, _DEFAULT_KAPPA, _DEFAULT_T_MANTLE, 0.0, gradient=True
+        )
+        t_diff = t - ti
+        converged = np.abs(t_diff) < rtol
+        zi[active[converged]] = z[converged]
+
+        # temperature increases with depth, so the sign of t_diff tells which side of the root z is on
+        too_big = t_diff < 0
+        np.copyto(z_too_big, z, where=too_big)
+        np.copyto(z_too_small, z, where=~too_big)
+
+        # Newton step, falling back to bisection when it leaves the bracket
+        with np.errstate(divide="ignore", invalid="ignore"):
+            z_new = z + t_diff / dtdz
+        bisect = ~((z_new > z_too_small) & (z_new < z_too_big))
+        z_new[bisect] = 0.5 * (z_too_small[bisect] + z_too_big[bisect])
+
+        keep = ~converged
+        active = active[keep]
+        a = a[keep]
+        t = t[keep]
+        z = z_new[keep]
+        z_too_small = z_too_small[keep]
+        z_too_big = z_too_big[keep]
 
     # convergence warning
-    if np.abs(t_diff).any() > rtol:
+    if active.size:
+        zi[active] = z
         import warnings
         warnings.warn("Iterations did not converge below rtol={}".format(rtol))
 
-    # protect against negative ages
-    zi[age <= 0] = 0
-    zi = np.squeeze(zi)
+    zi = np.squeeze(zi.reshape(shape))
     return zi
 
+_MIN_TABLE_AGE = 1e-12
+
+class _AgeTable(object):
+    """A cooling-model quantity tabulated against sqrt(age), linearly interpolated on a uniform axis.
+
+    The table is refined by doubling until linear interpolation reproduces `func` at every interval midpoint to 
+    within `tol`; the midpoint error actually reached is kept as `max_error`. The first node holds the limit as age 
+    tends to zero, which is also given to ages of zero or less unless a `zero_age_value` is set for them; ages older 
+    than `max_age` are passed to `func` directly.
+    """
+    def __init__(self, func, max_age, tol, n=1024, max_n=2 ** 20, zero_age_value=None):
+        self.func = func
+        self.zero_age_value = zero_age_value
+        self.max_age = float(max_age)
+        s_max = np.sqrt(self.max_age)
+
+        values = func(np.maximum(np.linspace(0.0, s_max, n + 1) ** 2, _MIN_TABLE_AGE))
+        while True:
+            mid = func(((np.arange(n) + 0.5) * (s_max / n)) ** 2)
+            self.max_error = np.abs(mid - 0.5 * (values[:-1] + values[1:])).max()
+            if self.max_error <= tol or n >= max_n:
+                break
+            refined = np.empty(2 * n + 1)
+            refined[0::2] = values
+            refined[1::2] = mid
+            values = refined
+            n *= 2
+        if self.max_error > tol:
+            import warnings
+            warnings.warn(
+                "Lookup table error {:.3g} exceeds tol={} at {} intervals".format(self.max_error, tol, n)
+            )
+
+        self.values = values
+        self.slopes = np.append(np.diff(values), 0.0)
+        self.scale = n / s_max
+        self.n = n
+
+    def __call__(self, age, out=None):
+        age = np.asarray(age, dtype=float)
+        if out is None:
+            out = np.empty(age.shape)
+        with np.errstate(invalid="ignore"):
+            u = np.array(np.sqrt(np.maximum(age, 0.0)))    # ages of zero or less are clipped to the first node
+            u *= self.scale
+            outside = ~(u <= self.n)    # too old or NaN ages
+            u[outside] = 0.0
+        i = u.astype(np.intp)
+        u -= i
+        out = np.multiply(self.slopes[i], u, out=out)
+        out += self.values[i]
+        if outside.any():
+            out[outside] = self.func(age[outside])
+        if self.zero_age_value is not None:
+            out[age <= 0] = self.zero_age_value
+        return out
+
+
+_age_tables = {}
+
+def _age_table(key, func, max_age, tol, zero_age_value=None):
+    table = _age_tables.get(key)
+    if table is None:
+        table = _age_tables[key] = _AgeTable(func, max_age, tol, zero_age_value=zero_age_value)
+    return table
+
+def plate_temp_lookup(
+    age,
+    z,
+    plate_thickness,
+    kappa=_DEFAULT_KAPPA,
+    t_mantle=_DEFAULT_T_MANTLE,
+    t_surface=0.0,
+    max_age=400.0,
+    tol=0.01,
+    out=None,
+):
+    """Computes the cooling plate temperature at a fixed depth = z for an array of ages using a lookup table.
+
+    The table is built with `plate_temp` on an axis uniform in sqrt(age), which follows the square-root growth of 
+    the thermal boundary layer, and is memoized per parameter set so later calls only interpolate.
+
+    Parameters
+    ----------
+    age : ndarray
+        An array (e.g. an age grid) of geological ages (Ma). Ages of zero or less are clipped to zero (the limit as 
+        age tends to zero), and ages older than `max_age` are computed directly.
+
+    z : float
+        The plate depth (m) at which to calculate temperature.
+
+    plate_thickness : float
+        The thickness (m) of the plate in consideration.
+
+    max_age : float, default=400.0
+        The oldest age (Ma) held in the table.
+
+    tol : float, default=0.01
+        The largest interpolation error (degrees) allowed in the table.
+
+    out : ndarray, optional
+        An array with the shape of `age` to write the temperatures into.
+
+    Returns
+    -------
+    ndarray
+        The plate temperatures, with the shape of `age`.
+    """
+    key = ("temp", float(z), float(plate_thickness), kappa, t_mantle, t_surface, float(max_age), tol)
+    func = lambda a: plate_temp(a, np.full(a.shape, float(z)), plate_thickness, kappa, t_mantle, t_surface)
+    return _age_table(key, func, max_age, tol)(age, out=out)
+
+def plate_isotherm_depth_lookup(
+    age,
+    temp=_DEFAULT_T_MANTLE,
+    plate_thickness=_DEFAULT_PLATE_THICKNESS,
+    max_age=400.0,
+    tol=1.0,
+    out=None,
+):
+    """Computes the depth to the temp - isotherm in a cooling plate model for an array of ages using a lookup table.
+
+    The table is built with `plate_isotherm_depth` on an axis uniform in sqrt(age) and is memoized per parameter 
+    set, so converting a time series of age grids only interpolates after the first call.
+
+    Parameters
+    ----------
+    age : ndarray
+        An array (e.g. an age grid) of geological ages (Ma). Ages of zero or less give a depth of zero, as in 
+        `plate_isotherm_depth`, and ages older than `max_age` are computed directly.
+
+    temp : float, default=1350.0
+        The temperature of a temp-isotherm to calculate the depth to. Defaults to 1350 degrees.
+
+    plate_thickness : float, default=125e3
+        The thickness (m) of the plate in consideration.
+
+    max_age : float, default=400.0
+        The oldest age (Ma) held in the table.
+
+    tol : float, default=1.0
+        The largest interpolation error (m) allowed in the table.
+
+    out : ndarray, optional
+        An array with the shape of `age` to write the depths into.
+
+    Returns
+    -------
+    ndarray
+        The isotherm depths, with the shape of `age`.
+    """
+    key = ("isotherm", float(temp), float(plate_thickness), float(max_age), tol)
+    func = lambda a: np.reshape(plate_isotherm_depth(a, temp, plate_thickness, n=50, rtol=1e-6), a.shape)
+    return _age_table(key, func, max_age, tol, zero_age_value=0.0)(age, out=out)
+
+def clear_cooling_tables():
+    """Discards the lookup tables memoized by `plate_temp_lookup` and `plate_isotherm_depth_lookup`."""
+    _age_tables.clear()
+
 def points_to_features(lons, lats, plate_ID=None):
     """Creates point features represented on a unit length sphere in 3D cartesian coordinates from a latitude and 
     longitude list.
@@ -250,6 +489,222 @@ def xyz2lonlat(x, y, z, validate=False, degrees=True):
     return lons, lats
 
 
+def angular_velocity(stage_rotation, delta_time=1.0):
+    """Converts a stage rotation into an angular velocity vector on the unit sphere.
+
+    Parameters
+    ----------
+    stage_rotation : :class:`FiniteRotation`
+        The stage rotation of a plate over the time interval ‘delta_time’.
+
+    delta_time : float, default=1.0
+        The time interval (Myr) spanned by the stage rotation.
+
+    Returns
+    -------
+    omega : ndarray
+        A (3,) array holding the Cartesian components of the angular velocity vector in radians per Myr.
+    """
+    pole, angle = stage_rotation.get_euler_pole_and_angle()
+    return np.array(pole.to_xyz()) * angle / delta_time
+
+
+def calculate_north_east_velocities(lons, lats, angular_velocities, velocity_units=pygplates.VelocityUnits.kms_per_my):
+    """Computes the north and east components of plate velocities at a set of points from their angular velocities.
+
+    This is the array equivalent of calling pygplates.calculate_velocities and
+    pygplates.LocalCartesian.convert_from_geocentric_to_north_east_down on each point, i.e. the velocity is the
+    cross product of the angular velocity vector with the position vector of the point on an Earth of mean radius.
+
+    Parameters
+    ----------
+    lons, lats : ndarray
+        Longitudes and latitudes (degrees) of the points.
+
+    angular_velocities : ndarray
+        A (3,) array of one angular velocity vector (radians per Myr) shared by all points, or an (n,3) array holding
+        one angular velocity vector per point.
+
+    velocity_units : :class:`VelocityUnits`, default=VelocityUnits.kms_per_my
+        The units of the returned velocities. Either pygplates.VelocityUnits.kms_per_my or
+        pygplates.VelocityUnits.cms_per_yr.
+
+    Returns
+    -------
+    north, east : ndarrays
+        The north and east components of the velocity vector at each point.
+    """
+    # the local frame at the poles is defined at zero longitude (as in pygplates)
+    lons = np.deg2rad(np.where(np.abs(lats) >= 90.0, 0.0, lons))
+    lats = np.deg2rad(lats)
+    coslon, sinlon = np.cos(lons), np.sin(lons)
+    coslat, sinlat = np.cos(lats), np.sin(lats)
+    x, y, z = coslat * coslon, coslat * sinlon, sinlat
+
+    omega = np.asarray(angular_velocities, dtype=float)
+    wx, wy, wz = omega[..., 0], omega[..., 1], omega[..., 2]
+
+    # velocity vector = omega x position
+    vx = wy * z - wz * y
+    vy = wz * x - wx * z
+    vz = wx * y - wy * x
+
+    # project onto local north and east unit vectors
+    north = coslat * vz - sinlat * (coslon * vx + sinlon * vy)
+    east = coslon * vy - sinlon * vx
+
+    scale = EARTH_RADIUS # kms per Myr
+    if velocity_units == pygplates.VelocityUnits.cms_per_yr:
+        scale *= 0.1
+    elif velocity_units != pygplates.VelocityUnits.kms_per_my:
+        raise ValueError("velocity_units must be VelocityUnits.kms_per_my or VelocityUnits.cms_per_yr")
+    north *= scale
+    east *= scale
+    return north, east
+
+
+def rotation_to_quaternion(finite_rotation):
+    """Converts a pygplates finite rotation into a unit quaternion.
+
+    Parameters
+    ----------
+    finite_rotation : :class:`FiniteRotation`
+        The finite rotation to convert. The identity rotation is returned as (1, 0, 0, 0).
+
+    Returns
+    -------
+    quaternion : ndarray
+        A (4,) array holding the (w, x, y, z) components of the unit quaternion.
+    """
+    pole, angle = finite_rotation.get_euler_pole_and_angle()
+    half_angle = 0.5 * angle
+    return np.r_[np.cos(half_angle), np.sin(half_angle) * np.array(pole.to_xyz())]
+
+
+def quaternion_multiply(q1, q2):
+    """Multiplies unit quaternions, i.e. composes rotations so that q2 is applied first and then q1.
+
+    Parameters
+    ----------
+    q1, q2 : ndarray
+        (..., 4) arrays of quaternions holding (w, x, y, z) components that broadcast against each other.
+
+    Returns
+    -------
+    q : ndarray
+        The (..., 4) array of quaternion products q1 * q2.
+    """
+    q1 = np.asarray(q1, dtype=float)
+    q2 = np.asarray(q2, dtype=float)
+    w1, x1, y1, z1 = q1[..., 0], q1[..., 1], q1[..., 2], q1[..., 3]
+    w2, x2, y2, z2 = q2[..., 0], q2[..., 1], q2[..., 2], q2[..., 3]
+    return np.stack([
+        w1 * w2 - x1 * x2 - y1 * y2 - z1 * z2,
+        w1 * x2 + x1 * w2 + y1 * z2 - z1 * y2,
+        w1 * y2 - x1 * z2 + y1 * w2 + z1 * x2,
+        w1 * z2 + x1 * y2 - y1 * x2 + z1 * w2], axis=-1)
+
+
+def quaternion_slerp(q0, q1, fraction):
+    """Spherically interpolates between unit quaternions along the shortest path.
+
+    Parameters
+    ----------
+    q0, q1 : ndarray
+        (..., 4) arrays of unit quaternions holding (w, x, y, z) components.
+
+    fraction : float, or ndarray
+        The interpolation fraction(s) between 0 (q0) and 1 (q1). Broadcasts against the leading dimensions of q0 and q1.
+
+    Returns
+    -------
+    q : ndarray
+        The (..., 4) array of interpolated unit quaternions.
+    """
+    q0 = np.asarray(q0, dtype=float)
+    q1 = np.asarray(q1, dtype=float)
+    fraction = np.asarray(fraction, dtype=float)[..., np.newaxis]
+
+    # q and -q are the same rotation, take the shortest path
+    dot = np.sum(q0 * q1, axis=-1, keepdims=True)
+    q1 = np.where(dot < 0.0, -q1, q1)
+    dot = np.clip(np.abs(dot), 0.0, 1.0)
+
+    theta = np.arccos(dot)
+    sin_theta = np.sin(theta)
+    nearly_parallel = sin_theta < 1.0e-10
+    sin_theta = np.where(nearly_parallel, 1.0, sin_theta)
+
+    # fall back to linear interpolation for (nearly) identical quaternions
+    w0 = np.where(nearly_parallel, 1.0 - fraction, np.sin((1.0 - fraction) * theta) / sin_theta)
+    w1 = np.where(nearly_parallel, fraction, np.sin(fraction * theta) / sin_theta)
+    q = w0 * q0 + w1 * q1
+    return q / np.linalg.norm(q, axis=-1, keepdims=True)
+
+
+def quaternion_to_matrix(quaternions):
+    """Converts unit quaternions into 3x3 rotation matrices.
+
+    Parameters
+    ----------
+    quaternions : ndarray
+        A (4,) array, or an (..., 4) array, of unit quaternions holding (w, x, y, z) components.
+
+    Returns
+    -------
+    matrices : ndarray
+        A (3,3) array, or an (..., 3, 3) array, of rotation matrices that rotate column vectors of Cartesian coordinates.
+    """
+    q = np.asarray(quaternions, dtype=float)
+    w, x, y, z = q[..., 0], q[..., 1], q[..., 2], q[..., 3]
+    matrices = np.empty(q.shape[:-1] + (3, 3))
+    matrices[..., 0, 0] = 1.0 - 2.0 * (y * y + z * z)
+    matrices[..., 0, 1] = 2.0 * (x * y - w * z)
+    matrices[..., 0, 2] = 2.0 * (x * z + w * y)
+    matrices[..., 1, 0] = 2.0 * (x * y + w * z)
+    matrices[..., 1, 1] = 1.0 - 2.0 * (x * x + z * z)
+    matrices[..., 1, 2] = 2.0 * (y * z - w * x)
+    matrices[..., 2, 0] = 2.0 * (x * z - w * y)
+    matrices[..., 2, 1] = 2.0 * (y * z + w * x)
+    matrices[..., 2, 2] = 1.0 - 2.0 * (x * x + y * y)
+    return matrices
+
+
+def rotate_points(matrices, xyz, index=None, chunk_size=1000000):
+    """Rotates Cartesian points by rotation matrices, selecting the matrix of each point by index.
+
+    Parameters
+    ----------
+    matrices : ndarray
+        An (m,3,3) array of rotation matrices (e.g. one per plate ID).
+
+    xyz : ndarray
+        An (n,3) array of Cartesian points to rotate.
+
+    index : ndarray, default=None
+        An (n,) integer array giving the matrix of each point. If None, ‘matrices’ must hold a single (3,3) rotation 
+        matrix that is applied to all points.
+
+    chunk_size : int, default=1000000
+        The number of points rotated at a time, which bounds the size of temporary arrays.
+
+    Returns
+    -------
+    rotated_xyz : ndarray
+        An (n,3) array of rotated Cartesian points.
+    """
+    xyz = np.asarray(xyz, dtype=float)
+    matrices = np.asarray(matrices, dtype=float)
+    if index is None:
+        return xyz.dot(matrices.T)
+
+    rotated_xyz = np.empty_like(xyz)
+    for start in range(0, len(xyz), chunk_size):
+        stop = start + chunk_size
+        rotated_xyz[start:stop] = np.einsum("nij,nj->ni", matrices[index[start:stop]], xyz[start:stop])
+    return rotated_xyz
+
+
 def haversine_distance(lon1, lon2, lat1, lat2, degrees=True):
     """Computes the Haversine distance (the shortest distance on the surface of an ideal spherical Earth) between two 
     points given their latitudes and longitudes.
@@ -0,0 +1,110 @@
+"""Small synthetic plate models shared by the test modules.
+
+The models are written to a temporary directory once per test session, so the tests do not depend on any plate model
+being downloaded.
+"""
+import numpy as np
+import pygplates
+import pytest
+
+from gplately.reconstruction import PlateReconstruction
+
+PLATE_IDS = (101, 201, 301, 501, 701, 801, 901)
+
+
+def _rotation_features(plate_ids=PLATE_IDS, max_time=300, seed=0):
+    """Total reconstruction sequences (relative to plate 0) with a random rotation every 10 Myr."""
+    rng = np.random.default_rng(seed)
+    features = []
+    for plate_id in plate_ids:
+        samples = []
+        for time in np.arange(0, max_time + 1, 10.0):
+            pole = (rng.uniform(-80, 80), rng.uniform(-180, 180))
+            angle = 0.0 if time == 0 else time * rng.uniform(0.1, 0.5)
+            samples.append(pygplates.GpmlTimeSample(
+                pygplates.GpmlFiniteRotation(pygplates.FiniteRotation(pole, np.radians(angle))), float(time)))
+        features.append(pygplates.Feature.create_total_reconstruction_sequence(
+            0, plate_id, pygplates.GpmlIrregularSampling(samples)))
+    return pygplates.FeatureCollection(features)
+
+
+def _static_polygon_features(plate_ids=PLATE_IDS):
+    """Longitudinal wedge polygons covering the globe, plus a small polygon overlapping one of the wedges."""
+    features = []
+    edges = np.linspace(-180, 180, len(plate_ids))
+    for lon0, lon1, plate_id in zip(edges[:-1], edges[1:], plate_ids[:-1]):
+        lons = np.concatenate([np.linspace(lon0, lon1, 20), np.linspace(lon1, lon0, 20)])
+        lats = np.concatenate([np.full(20, -89.0), np.full(20, 89.0)])
+        features.append(pygplates.Feature.create_reconstructable_feature(
+            pygplates.FeatureType.gpml_closed_continental_boundary,
+            pygplates.PolygonOnSphere(list(zip(lats, lons))), reconstruction_plate_id=plate_id))
+    features.append(pygplates.Feature.create_reconstructable_feature(
+        pygplates.FeatureType.gpml_closed_continental_boundary,
+        pygplates.PolygonOnSphere([(10, 10), (10, 40), (40, 40), (40, 10)]), reconstruction_plate_id=plate_ids[-1]))
+    return pygplates.FeatureCollection(features)
+
+
+def _meridian(lon, n=30):
+    return pygplates.PolylineOnSphere([(lat, lon) for lat in np.linspace(-90, 90, n)])
+
+
+def _topology_features():
+    """Three topological plates (101, 201, 301) bounded by a subduction zone, a mid-ocean ridge and a transform along
+    the -60, 60 and 180 degree meridians.
+    """
+    subduction_zone = pygplates.Feature.create_tectonic_section(
+        pygplates.FeatureType.gpml_subduction_zone, _meridian(-60.0), reconstruction_plate_id=101)
+    subduction_zone.set_enumeration(pygplates.PropertyName.gpml_subduction_polarity, "Left")
+    ridge = pygplates.Feature.create_tectonic_section(
+        pygplates.FeatureType.gpml_mid_ocean_ridge, _meridian(60.0), left_plate=201, right_plate=301,
+        reconstruction_method="HalfStageRotationVersion2")
+    transform = pygplates.Feature.create_tectonic_section(
+        pygplates.FeatureType.gpml_transform, _meridian(180.0), reconstruction_plate_id=301)
+
+    def plate(plate_id, *sections):
+        polygon = pygplates.GpmlTopologicalPolygon([
+            pygplates.GpmlTopologicalSection.create(
+                section, topological_geometry_type=pygplates.GpmlTopologicalPolygon) for section in sections])
+        feature = pygplates.Feature.create_topological_feature(
+            pygplates.FeatureType.gpml_topological_closed_plate_boundary, polygon)
+        feature.set_reconstruction_plate_id(plate_id)
+        return feature
+
+    plates = [plate(101, transform, subduction_zone), plate(201, subduction_zone, ridge), plate(301, ridge, transform)]
+    return pygplates.FeatureCollection([subduction_zone, ridge, transform] + plates)
+
+
+def _topology_rotation_features():
+    """Rotations of the three topological plates about the north pole, so that their boundaries stay meridians."""
+    features = []
+    for plate_id, rate in [(101, 0.2), (201, 0.5), (301, -0.3)]:
+        samples = [pygplates.GpmlTimeSample(pygplates.GpmlFiniteRotation(
+            pygplates.FiniteRotation((90, 0), np.radians(rate * time))), float(time)) for time in np.arange(0, 301, 10.0)]
+        features.append(pygplates.Feature.create_total_reconstruction_sequence(
+            0, plate_id, pygplates.GpmlIrregularSampling(samples)))
+    return pygplates.FeatureCollection(features)
+
+
+@pytest.fixture(scope="session")
+def model_dir(tmp_path_factory):
+    """A directory holding the rotation, static polygon and topology files of the synthetic models."""
+    directory = tmp_path_factory.mktemp("model")
+    _rotation_features().write(str(directory / "rotations.rot"))
+    _static_polygon_features().write(str(directory / "static_polygons.gpml"))
+    _topology_features().write(str(directory / "topologies.gpml"))
+    _topology_rotation_features().write(str(directory / "topology_rotations.rot"))
+    return directory
+
+
+@pytest.fixture
+def static_model(model_dir):
+    """A PlateReconstruction of the random rotation model and its static polygons."""
+    return PlateReconstruction(
+        str(model_dir / "rotations.rot"), static_polygons=str(model_dir / "static_polygons.gpml"))
+
+
+@pytest.fixture
+def topology_model(model_dir):
+    """A PlateReconstruction of the three topological plates."""
+    return PlateReconstruction(
+        str(model_dir / "topology_rotations.rot"), [str(model_dir / "topologies.gpml")])
@@ -0,0 +1,80 @@
+"""Tests of the cooling plate model: the isotherm depth solver and the age lookup tables."""
+import numpy as np
+import pytest
+
+from gplately import tools as _tools
+
+
+def _bisection_isotherm_depth(age, temp, plate_thickness=125e3, n=60, rtol=1e-9):
+    """The depth to the temp-isotherm found by bisection alone, as calculated before the Newton iteration."""
+    age = np.atleast_1d(np.asarray(age, dtype=float))
+    z_too_small = np.zeros(age.shape)
+    z_too_big = np.full(age.shape, plate_thickness)
+    for _ in range(n):
+        zi = 0.5 * (z_too_small + z_too_big)
+        t_diff = temp - np.array([_tools.plate_temp(a, z, plate_thickness) for a, z in zip(age, zi)])
+        z_too_big[t_diff < -rtol] = zi[t_diff < -rtol]
+        z_too_small[t_diff > rtol] = zi[t_diff > rtol]
+    zi[age <= 0] = 0
+    return zi
+
+
+AGES = np.array([0.5, 2.0, 10.0, 35.0, 80.0, 150.0, 250.0])
+
+
+@pytest.mark.parametrize("temp", [300.0, 800.0, 1200.0, 1340.0, 1350.0])
+def test_isotherm_depth_matches_bisection(temp):
+    depths = _tools.plate_isotherm_depth(AGES, temp, n=50, rtol=1e-6)
+    if temp < _tools._DEFAULT_T_MANTLE:
+        # (young plates are at the mantle temperature over a range of depths, so its isotherm depth is not unique)
+        np.testing.assert_allclose(depths, _bisection_isotherm_depth(AGES, temp), rtol=0, atol=0.01)
+
+    # with the default tolerance, the isotherm temperature is reached at each depth
+    depths = _tools.plate_isotherm_depth(AGES, temp)
+    temps = _tools.plate_temp(AGES, depths, 125e3)
+    assert np.all(np.abs(temps - temp) < 0.001)
+
+
+def test_isotherm_depth_of_zero_negative_and_nan_ages():
+    ages = np.array([[np.nan, 0.0, -5.0], [20.0, np.nan, 100.0]])
+    depths = _tools.plate_isotherm_depth(ages, 1200.0)
+    assert depths.shape == ages.shape
+    assert np.isnan(depths[np.isnan(ages)]).all()
+    np.testing.assert_array_equal(depths[0,1:], 0.0)
+    np.testing.assert_allclose(depths[1,[0,2]], _bisection_isotherm_depth([20.0, 100.0], 1200.0), rtol=0, atol=0.01)
+
+
+def test_plate_temp_lookup_accuracy():
+    _tools.clear_cooling_tables()
+    ages = np.concatenate([np.random.default_rng(0).uniform(0, 400, 2000), np.linspace(1e-3, 1, 50), [400.0]])
+    for z in (5e3, 40e3, 100e3):
+        temps = _tools.plate_temp_lookup(ages, z, 125e3, tol=0.01)
+        expected = _tools.plate_temp(ages, np.full(ages.shape, z), 125e3)
+        np.testing.assert_allclose(temps, expected, rtol=0, atol=0.01)
+
+
+def test_isotherm_depth_lookup_accuracy():
+    _tools.clear_cooling_tables()
+    ages = np.concatenate([np.random.default_rng(1).uniform(0, 400, 500), np.linspace(1e-3, 1, 20), [400.0]])
+    for temp in (600.0, 1200.0):
+        depths = _tools.plate_isotherm_depth_lookup(ages, temp, tol=1.0)
+        expected = _tools.plate_isotherm_depth(ages, temp, n=50, rtol=1e-6)
+        np.testing.assert_allclose(depths, expected, rtol=0, atol=1.0)
+
+
+def test_lookups_of_zero_negative_old_and_nan_ages():
+    _tools.clear_cooling_tables()
+    ages = np.array([0.0, -10.0, np.nan, 500.0])
+
+    # ages of zero or less take the limit as age tends to zero, not the series summed at age zero
+    temps = _tools.plate_temp_lookup(ages, 40e3, 125e3)
+    np.testing.assert_allclose(temps[:2], _tools.plate_temp(1e-12, 40e3, 125e3), rtol=0, atol=0.01)
+    assert np.all(temps[:2] <= _tools._DEFAULT_T_MANTLE + 0.01)
+    assert np.isnan(temps[2])
+    np.testing.assert_allclose(temps[3], _tools.plate_temp(500.0, 40e3, 125e3), rtol=1e-12)
+
+    # and the isotherm depth of ages of zero or less is zero, as from plate_isotherm_depth
+    depths = _tools.plate_isotherm_depth_lookup(ages, 1200.0)
+    np.testing.assert_array_equal(depths[:2], _tools.plate_isotherm_depth(ages[:2], 1200.0))
+    assert np.isnan(depths[2])
+    np.testing.assert_allclose(depths[3], _tools.plate_isotherm_depth(500.0, 1200.0, n=50, rtol=1e-6), rtol=1e-9)
@@ -0,0 +1,227 @@
+"""Tests of reading and sampling netCDF grids."""
+import warnings
+
+import numpy as np
+import pytest
+
+from gplately.grids import (
+    LonWrappedGrid, Raster, RegularGridInterpolator, SamplingPlan, read_netcdf_grid, sample_grid, write_netcdf_grid
+)
+
+
+@pytest.fixture
+def grid_360(tmp_path):
+    """A half-degree grid stored with longitudes from 0 to 359.5 degrees (no repeated column at 360), with a masked
+    patch, and the field it was sampled from."""
+    def field(lons, lats):
+        return np.cos(np.radians(lats)) * np.sin(np.radians(lons)) + 0.01 * lats
+
+    lons, lats = np.meshgrid(np.arange(0, 360, 0.5), np.arange(-90, 90.1, 0.5))
+    grid = np.ma.masked_array(field(lons, lats), mask=np.zeros(lons.shape, dtype=bool))
+    grid[10:20, 30:40] = np.ma.masked
+    filename = str(tmp_path / "grid_360.nc")
+    write_netcdf_grid(filename, grid, extent=[0, 359.5, -90, 90])
+    return filename, field
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_raster_data_is_a_masked_array(grid_360, lazy):
+    filename, _ = grid_360
+    raster = Raster(filename, lazy=lazy)
+    assert isinstance(raster.data, np.ma.MaskedArray)
+    assert raster.data.mask.sum() == 100
+    assert raster.data.shape == (raster.lats.size, raster.lons.size)
+    # array methods and arithmetic work on the data
+    assert (raster.data * 2).max() == 2 * raster.data.max()
+    assert raster.data.T.shape == raster.data.shape[::-1]
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_raster_wrap_view(grid_360, lazy):
+    filename, _ = grid_360
+    data = Raster(filename).data
+    raster = Raster(filename, lazy=lazy, wrap_view=True)
+    assert isinstance(raster.data, LonWrappedGrid)
+
+    copy = raster.data.copy()
+    assert isinstance(copy, np.ma.MaskedArray)
+    np.testing.assert_array_equal(copy.mask, data.mask)
+    np.testing.assert_array_equal(copy.filled(np.nan), data.filled(np.nan))
+
+    rng = np.random.default_rng(0)
+    lons, lats = rng.uniform(-180, 180, 1000), rng.uniform(-90, 90, 1000)
+    np.testing.assert_array_equal(raster.interpolate(lons, lats), Raster(filename).interpolate(lons, lats))
+
+
+def test_read_pads_global_grid_only_for_windows_across_seam(grid_360, tmp_path):
+    filename, _ = grid_360
+    # the whole grid is read as stored, re-aligned from -180 to 180 degrees
+    grid, lons, lats = read_netcdf_grid(filename, return_grids=True)
+    assert grid.shape == (361, 720)
+    assert lons[0] == -179.5 and lons[-1] == 180
+
+    # windows reaching into the gap at the seam from either side include the column across it
+    window, window_lons, _ = read_netcdf_grid(filename, return_grids=True, extent=[-179.9, -170, -10, 10])
+    assert window_lons[0] == -180
+    np.testing.assert_array_equal(window[:,0], grid[160:201,-1])
+    _, window_lons, _ = read_netcdf_grid(filename, return_grids=True, extent=[-179.5, -170, -10, 10])
+    assert window_lons[0] == -179.5
+    _, window_lons, _ = read_netcdf_grid(filename, return_grids=True, extent=[170, 180, -10, 10])
+    assert window_lons[-1] == 180
+
+    # a grid stored from -180 to 179.5 degrees is read as stored too
+    stored = np.random.default_rng(0).random((361, 720))
+    write_netcdf_grid(str(tmp_path / "grid.nc"), stored, extent=[-180, 179.5, -90, 90])
+    grid, lons, _ = read_netcdf_grid(str(tmp_path / "grid.nc"), return_grids=True)
+    np.testing.assert_array_equal(grid, stored)
+    assert lons[0] == -180 and lons[-1] == 179.5
+    window, window_lons, _ = read_netcdf_grid(str(tmp_path / "grid.nc"), return_grids=True, extent=[170, 180, -90, 90])
+    assert window_lons[-1] == 180
+    np.testing.assert_array_equal(window[:,-1], stored[:,0])
+
+    # blocks are only taken from the stored columns
+    _, block_lons, _ = read_netcdf_grid(filename, return_grids=True, block=4)
+    np.testing.assert_allclose(block_lons[[0, -1]], [-178.75, 179.25])
+
+
+@pytest.mark.parametrize("wrap_view", [False, True])
+def test_sample_0_360_grid_at_seam(grid_360, wrap_view):
+    filename, field = grid_360
+    lons = np.array([-180.0, -179.9, -179.6, 179.9, 180.0])
+    lats = np.array([-45.2, 0.3, 10.0, 33.3, 60.1])
+    expected = field(lons, lats)
+
+    raster = Raster(filename, wrap_view=wrap_view)
+    np.testing.assert_allclose(raster.interpolate(lons, lats), expected, atol=1e-4)
+    np.testing.assert_allclose(
+        sample_grid(lons, lats, raster.data, extent=raster.extent), expected, atol=1e-4)
+
+
+def test_resample_0_360_grid_has_no_empty_column(grid_360):
+    filename, field = grid_360
+    grid, lons, lats = read_netcdf_grid(filename, return_grids=True, resample=(2, 2))
+    assert lons[0] == -179.5 and lons[-1] == 178.5
+    assert not np.isnan(grid).any()
+    np.testing.assert_allclose(grid[:,-1], field(178.5, lats))
+
+
+def test_sample_global_grid_across_seam():
+    # a grid from -180 to 179.5 degrees, sampled between its last column and its first one
+    def field(lons, lats):
+        return np.cos(np.radians(lats)) * np.cos(np.radians(lons))
+
+    lons, lats = np.meshgrid(np.arange(-180, 180, 0.5), np.arange(-90, 90.1, 0.5))
+    raster = Raster(array=field(lons, lats), extent=[-180, 179.5, -90, 90])
+    qlons = np.array([179.6, 179.75, 180.0, -180.0, 0.2])
+    qlats = np.array([10.1, -30.3, 45.0, 45.0, 0.0])
+    np.testing.assert_allclose(raster.interpolate(qlons, qlats), field(qlons, qlats), atol=1e-4)
+    np.testing.assert_allclose(raster.sampling_plan(qlons, qlats)(raster.data), field(qlons, qlats), atol=1e-4)
+    np.testing.assert_allclose(sample_grid(qlons, qlats, raster.data, extent=raster.extent), field(qlons, qlats),
+                               atol=1e-4)
+
+    # indices are columns of the grid itself
+    _, (rows, cols) = raster.interpolate(qlons, qlats, return_indices=True)
+    np.testing.assert_array_equal(cols, [719, 719, 719, 0, 360])
+    _, (rows, cols) = sample_grid(qlons, qlats, raster.data, extent=raster.extent, return_indices=True)
+    np.testing.assert_array_equal(cols, [719, 719, 719, 0, 360])
+
+
+@pytest.mark.parametrize("method", ["linear", "nearest"])
+def test_float32_axes_are_indexed_arithmetically(method):
+    from scipy.interpolate import RegularGridInterpolator as ScipyInterpolator
+
+    lons = np.linspace(-180, 180, 3601).astype(np.float32)
+    lats = np.linspace(-90, 90, 1801).astype(np.float32)
+    values = np.random.default_rng(0).random((lats.size, lons.size))
+    interpolator = RegularGridInterpolator((lats, lons), values, method=method)
+    assert all(spacing is not None for spacing in interpolator._spacings)
+
+    rng = np.random.default_rng(1)
+    qlons, qlats = rng.uniform(-180, 180, 10000), rng.uniform(-90, 90, 10000)
+    expected = ScipyInterpolator((lats.astype(float), lons.astype(float)), values, method=method)((qlats, qlons))
+    if method == "nearest":
+        # points within the rounding error of the float32 axes from a cell centre may snap either way
+        assert np.mean(interpolator((qlats, qlons)) == expected) > 0.999
+    else:
+        np.testing.assert_allclose(interpolator((qlats, qlons)), expected, atol=1e-3)
+
+    plan = SamplingPlan(qlons, qlats, lons, lats, method=method)
+    np.testing.assert_allclose(plan(values), interpolator((qlats, qlons)), rtol=1e-12)
+
+
+def _block_reduce(grid, block_x, block_y, reduce):
+    """Reduces each complete (block_y, block_x) block of a masked grid with a reshape of the whole grid."""
+    nrows, ncols = grid.shape[0] // block_y, grid.shape[1] // block_x
+    values = np.ma.filled(grid.astype(float), np.nan)[:nrows * block_y, :ncols * block_x]
+    values = values.reshape(nrows, block_y, ncols, block_x).transpose(0, 2, 1, 3).reshape(nrows, ncols, -1)
+    with warnings.catch_warnings():
+        # blocks without a valid cell
+        warnings.simplefilter("ignore", RuntimeWarning)
+        return np.ma.masked_invalid(reduce(values, axis=-1))
+
+
+@pytest.mark.parametrize("block_method, reduce", [("mean", np.nanmean), ("median", np.nanmedian)])
+def test_read_blocks_match_reshaped_grid(tmp_path, block_method, reduce):
+    # a regional grid whose size is not a multiple of the block, with a fully masked block, partly masked blocks and
+    # a NaN cell
+    lons, lats = np.meshgrid(np.arange(-100, 60, 0.5), np.arange(-60, 40.1, 0.5))
+    grid = np.ma.masked_array(np.sin(np.radians(3 * lons)) * np.cos(np.radians(2 * lats)) + 0.01 * lats)
+    grid[:5, :7] = np.ma.masked
+    grid[20:33, 40:52] = np.ma.masked
+    grid[50, 60] = np.nan
+    filename = str(tmp_path / "grid.nc")
+    write_netcdf_grid(filename, grid, extent=[-100, 59.5, -60, 40])
+
+    for extent in (None, [-80.2, 10.3, -33.1, 25.4]):
+        window, window_lons, window_lats = read_netcdf_grid(filename, return_grids=True, extent=extent)
+        blocks, block_lons, block_lats = read_netcdf_grid(
+            filename, return_grids=True, extent=extent, block=(7, 5), block_method=block_method)
+
+        expected = _block_reduce(window, 7, 5, reduce)
+        assert blocks.shape == expected.shape == (window.shape[0] // 5, window.shape[1] // 7)
+        np.testing.assert_array_equal(np.ma.getmaskarray(blocks), np.ma.getmaskarray(expected))
+        np.testing.assert_allclose(blocks.compressed(), expected.compressed(), rtol=1e-12)
+        np.testing.assert_allclose(block_lons, window_lons[:block_lons.size * 7].reshape(-1, 7).mean(axis=1))
+        np.testing.assert_allclose(block_lats, window_lats[:block_lats.size * 5].reshape(-1, 5).mean(axis=1))
+
+    # reduced straight from the written grid
+    blocks = read_netcdf_grid(filename, block=(7, 5), block_method=block_method)
+    expected = _block_reduce(grid, 7, 5, reduce)
+    assert blocks[0, 0] is np.ma.masked
+    np.testing.assert_allclose(blocks.filled(np.nan), expected.filled(np.nan), rtol=1e-12)
+
+
+@pytest.mark.parametrize("xi", [
+    np.array([1.0, 2.0]),                                   # one point as a 1D array
+    [1.0, 2.0],
+    (1.0, 2.0),                                             # scalar coordinates
+    (np.array(1.0), np.array(2.0)),
+    (np.array([1.0, 1.5]), np.array([2.0, 2.5])),
+    (np.array([[1.0], [1.5]]), np.array([2.0, 2.5, 0.5])),  # broadcast coordinates
+    np.array([[1.0, 2.0]]),
+    np.array([[[1.0, 2.0], [1.5, 2.5]]]),
+    (np.array([1.0, 2.0]),),
+    np.array([1.0, 2.0, 1.5, 2.5]),
+])
+@pytest.mark.parametrize("method", ["linear", "nearest"])
+def test_sample_shapes_match_scipy(xi, method):
+    from scipy.interpolate import RegularGridInterpolator as ScipyInterpolator
+
+    points = (np.arange(3.0), np.arange(4.0))
+    values = np.random.default_rng(0).random((3, 4))
+    expected = ScipyInterpolator(points, values, method=method)(xi)
+    result = RegularGridInterpolator(points, values, method=method)(xi)
+    assert result.shape == expected.shape
+    np.testing.assert_allclose(result, expected, rtol=1e-12)
+
+
+def test_sample_single_point_shapes():
+    raster = Raster(array=np.random.default_rng(0).random((181, 361)))
+    # scalar coordinates give a scalar, and arrays of one point an array of one value
+    assert raster.interpolate(10.0, 5.0).shape == ()
+    assert raster.interpolate(np.array([10.0]), np.array([5.0])).shape == (1,)
+    assert raster.sampling_plan(10.0, 5.0)(raster.data).shape == ()
+    # sample_grid samples a single point as np.c_[lat, lon], i.e. as an array of one point
+    assert sample_grid(10.0, 5.0, raster.data).shape == (1,)
+    assert sample_grid(10.0, 5.0, raster.data, return_indices=True)[0].shape == (1,)
+    np.testing.assert_allclose(sample_grid(10.0, 5.0, raster.data), raster.interpolate(10.0, 5.0))
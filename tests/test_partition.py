@@ -0,0 +1,32 @@
+"""Tests of partitioning points into the static polygons with a plate-ID raster."""
+import numpy as np
+import pygplates
+import pytest
+
+from gplately.reconstruction import _partition_points
+
+
+def _random_points(n, seed=0):
+    rng = np.random.default_rng(seed)
+    lons = rng.uniform(-180, 180, n)
+    lats = np.degrees(np.arcsin(rng.uniform(-1, 1, n)))
+    return lons, lats
+
+
+@pytest.mark.parametrize("time", [0.0, 45.0])
+def test_partition_points_matches_plate_partitioner(static_model, time):
+    lons, lats = _random_points(20000)
+    plate_partitioner = pygplates.PlatePartitioner(static_model.static_polygons, static_model.rotation_model, time)
+    expected = _partition_points(plate_partitioner, lons, lats)
+    for resolution in (1.0, 0.25, None):
+        plate_ids = static_model.partition_points(lons, lats, time, resolution=resolution)
+        np.testing.assert_array_equal(plate_ids, expected)
+
+
+def test_partition_points_on_a_regular_grid(static_model):
+    # grid points lie exactly on cell edges and at the poles
+    lons, lats = np.meshgrid(np.arange(-180, 180.1, 1.0), np.arange(-90, 90.1, 1.0))
+    lons, lats = lons.ravel(), lats.ravel()
+    plate_partitioner = pygplates.PlatePartitioner(static_model.static_polygons, static_model.rotation_model, 20.0)
+    expected = _partition_points(plate_partitioner, lons, lats)
+    np.testing.assert_array_equal(static_model.partition_points(lons, lats, 20.0), expected)
@@ -0,0 +1,181 @@
+"""Tests of reconstructing Points with the pygplates and numpy backends."""
+import numpy as np
+import pygplates
+import pytest
+
+from gplately import tools as _tools
+from gplately.reconstruction import Points
+
+
+def _random_points(n, seed=0):
+    rng = np.random.default_rng(seed)
+    lons = rng.uniform(-180, 180, n)
+    lats = np.degrees(np.arcsin(rng.uniform(-1, 1, n)))
+    return lons, lats
+
+
+def assert_same_positions(lons, lats, expected_lons, expected_lats, atol=1e-6):
+    """Asserts that lat-lon points are within ‘atol’ degrees of each other (longitudes may differ by 360 degrees)."""
+    xyz = np.column_stack(_tools.lonlat2xyz(np.asarray(lons, dtype=float), np.asarray(lats, dtype=float)))
+    expected_xyz = np.column_stack(_tools.lonlat2xyz(
+        np.asarray(expected_lons, dtype=float), np.asarray(expected_lats, dtype=float)))
+    np.testing.assert_allclose(xyz, expected_xyz, rtol=0, atol=np.radians(atol))
+
+
+def test_reconstruct_from_time_matches_reconstructing_from_present_day(static_model):
+    lons, lats = _random_points(500)
+    plate_ids = static_model.partition_points(lons, lats)
+    features = _tools.points_to_features(lons, lats, plate_ids.tolist())
+
+    # position the features at 30 Ma, then reconstruct them from there
+    positioned = _tools.extract_feature_lonlat(static_model.reconstruct(features, 30.0, anchor_plate_id=201))
+    positioned_features = _tools.points_to_features(positioned[0], positioned[1], plate_ids.tolist())
+    rlons, rlats = _tools.extract_feature_lonlat(
+        static_model.reconstruct(positioned_features, 60.0, 30.0, anchor_plate_id=201))
+
+    expected_lons, expected_lats = _tools.extract_feature_lonlat(
+        static_model.reconstruct(features, 60.0, anchor_plate_id=201))
+    assert_same_positions(rlons, rlats, expected_lons, expected_lats)
+
+
+@pytest.mark.parametrize("time, anchor_plate_id", [(0.0, 0), (30.0, 0), (0.0, 201), (30.0, 201)])
+def test_points_backends_agree(static_model, time, anchor_plate_id):
+    lons, lats = _random_points(500, seed=1)
+    points = Points(static_model, lons, lats, time=time)
+
+    # reconstructing to the time of the points returns them unchanged
+    for backend in ("pygplates", "numpy"):
+        rlons, rlats = points.reconstruct(time, anchor_plate_id=anchor_plate_id, backend=backend)
+        assert_same_positions(rlons, rlats, lons, lats)
+
+    expected_lons, expected_lats = points.reconstruct(60.0, anchor_plate_id=anchor_plate_id)
+    rlons, rlats = points.reconstruct(60.0, anchor_plate_id=anchor_plate_id, backend="numpy")
+    assert_same_positions(rlons, rlats, expected_lons, expected_lats)
+    rlons, rlats = points.reconstruct(60.0, anchor_plate_id=anchor_plate_id, nprocs=2)
+    assert_same_positions(rlons, rlats, expected_lons, expected_lats)
+
+    # the pygplates backend is independent of the anchor plate used by earlier reconstructions
+    other_anchor_plate_id = 301 if anchor_plate_id else 201
+    points.reconstruct(60.0, anchor_plate_id=other_anchor_plate_id)
+    rlons, rlats = points.reconstruct(60.0, anchor_plate_id=anchor_plate_id)
+    assert_same_positions(rlons, rlats, expected_lons, expected_lats)
+
+    # against rotating each point with the rotation model
+    for i in range(0, lons.size, 50):
+        rotation = static_model.rotation_model.get_rotation(
+            60.0, int(points.plate_id[i]), time, anchor_plate_id=anchor_plate_id)
+        expected_lat, expected_lon = (rotation * pygplates.PointOnSphere(lats[i], lons[i])).to_lat_lon()
+        assert_same_positions(rlons[i], rlats[i], expected_lon, expected_lat)
+
+
+@pytest.mark.parametrize("dtype", [np.float64, np.float32])
+def test_points_derive_coordinates_and_features_lazily(static_model, dtype):
+    lons, lats = _random_points(200, seed=2)
+    points = Points(static_model, lons, lats, time=30.0, dtype=dtype)
+    assert points.lonlat.dtype == dtype and points.lonlat.shape == (200, 2)
+    assert points.plate_id.dtype == np.int32
+    assert points._xyz is None and points._features is None
+
+    np.testing.assert_allclose(np.linalg.norm(points.xyz, axis=1), _tools.EARTH_RADIUS, rtol=1e-6)
+    assert np.shares_memory(points.x, points.xyz)
+
+    # the features hold the points as given, whatever anchor plate the points are reconstructed in
+    features = points.features
+    points.reconstruct(60.0, anchor_plate_id=201)
+    points.reconstruct(60.0)
+    assert points.features is features
+    feature_lats, feature_lons = np.array([feature.get_geometry().to_lat_lon() for feature in features]).T
+    assert_same_positions(feature_lons, feature_lats, points.lons, points.lats, atol=1e-9)
+    assert [feature.get_reconstruction_plate_id() for feature in features] == points.plate_id.tolist()
+
+
+@pytest.mark.parametrize("from_time, to_time, anchor_plate_id",
+                         [(0.0, 60.0, 0), (30.0, 60.0, 0), (0.0, 45.0, 201), (30.0, 0.0, 201), (60.0, 25.0, 301)])
+def test_reconstruct_points_matches_pygplates(static_model, from_time, to_time, anchor_plate_id):
+    lons, lats = _random_points(500, seed=3)
+    plate_ids = static_model.partition_points(lons, lats)
+    plate_ids[plate_ids < 0] = 0
+
+    features = _tools.points_to_features(lons, lats, plate_ids.tolist())
+    expected_lons, expected_lats = _tools.extract_feature_lonlat(
+        static_model.reconstruct(features, to_time, from_time, anchor_plate_id=anchor_plate_id))
+
+    rlons, rlats = static_model.reconstruct_points(lons, lats, plate_ids, to_time, from_time, anchor_plate_id)
+    assert_same_positions(rlons, rlats, expected_lons, expected_lats)
+
+    points = Points(static_model, lons, lats, time=from_time, plate_id=plate_ids)
+    rlons, rlats = points.reconstruct(to_time, anchor_plate_id=anchor_plate_id, backend="numpy")
+    assert_same_positions(rlons, rlats, expected_lons, expected_lats)
+
+
+def test_reconstruct_points_to_the_time_of_each_point(static_model):
+    lons, lats = _random_points(300, seed=4)
+    plate_ids = np.random.default_rng(4).choice([101, 201, 301], lons.size)
+    to_times = np.random.default_rng(5).choice([0.0, 15.0, 40.0, np.nan], lons.size)
+
+    rlons, rlats = static_model.reconstruct_points(lons, lats, plate_ids, to_times, 20.0, anchor_plate_id=201)
+    nan = np.isnan(to_times)
+    assert np.isnan(rlons[nan]).all() and np.isnan(rlats[nan]).all()
+    for i in np.flatnonzero(~nan):
+        rotation = static_model.rotation_model.get_rotation(to_times[i], int(plate_ids[i]), 20.0, anchor_plate_id=201)
+        expected_lat, expected_lon = (rotation * pygplates.PointOnSphere(lats[i], lons[i])).to_lat_lon()
+        assert_same_positions(rlons[i], rlats[i], expected_lon, expected_lat)
+
+
+@pytest.mark.parametrize("dtype", [np.float64, np.float32])
+def test_points_save_load_round_trip(static_model, tmp_path, dtype):
+    lons, lats = _random_points(300, seed=6)
+    points = Points(static_model, lons, lats, time=30.0, dtype=dtype)
+
+    # the compact numpy format restores the points exactly, without partitioning them again
+    filename = str(tmp_path / "points.npz")
+    points.save(filename)
+    loaded = Points.load(static_model, filename)
+    assert loaded.time == 30.0
+    assert loaded.lonlat.dtype == dtype and loaded.plate_id.dtype == np.int32
+    np.testing.assert_array_equal(loaded.lonlat, points.lonlat)
+    np.testing.assert_array_equal(loaded.plate_id, points.plate_id)
+
+    # other extensions write the point features, with their plate IDs, through pygplates
+    filename = str(tmp_path / "points.gpml")
+    points.save(filename)
+    features = list(pygplates.FeatureCollection(filename))
+    assert [feature.get_reconstruction_plate_id() for feature in features] == points.plate_id.tolist()
+    feature_lats, feature_lons = np.array([feature.get_geometry().to_lat_lon() for feature in features]).T
+    assert_same_positions(feature_lons, feature_lats, points.lons, points.lats, atol=1e-9)
+
+
+@pytest.mark.parametrize("to_time, from_time, anchor_plate_id", [(60.0, 0.0, 0), (None, 0.0, 0), (45.0, 20.0, 201)])
+def test_point_chunks_concatenate_to_the_unchunked_result(static_model, tmp_path, to_time, from_time, anchor_plate_id):
+    lons, lats = _random_points(1000, seed=7)
+    ages = np.random.default_rng(7).uniform(0, 100, lons.size)
+
+    plate_ids = static_model.partition_points(lons, lats, from_time)
+    plate_ids[plate_ids < 0] = 0
+    expected_lons, expected_lats = static_model.reconstruct_points(
+        lons, lats, plate_ids, ages if to_time is None else to_time, from_time, anchor_plate_id)
+
+    # uneven chunks of lon, lat, age columns, streamed in order
+    chunks = np.array_split(np.column_stack((lons, lats, ages)), [1, 250, 260, 700])
+    results = list(static_model.reconstruct_point_chunks(chunks, to_time, from_time, anchor_plate_id))
+    assert [result[0].size for result in results] == [chunk.shape[0] for chunk in chunks]
+    rlons, rlats, chunk_plate_ids = (np.concatenate(arrays) for arrays in zip(*results))
+    np.testing.assert_array_equal(chunk_plate_ids, plate_ids)
+    assert_same_positions(rlons, rlats, expected_lons, expected_lats, atol=1e-9)
+
+    # chunks of named fields, with their own plate IDs
+    chunks = [{"lons": lons[i:i+300], "lats": lats[i:i+300], "ages": ages[i:i+300], "plate_ids": plate_ids[i:i+300]}
+              for i in range(0, lons.size, 300)]
+    results = list(static_model.reconstruct_point_chunks(chunks, to_time, from_time, anchor_plate_id))
+    rlons, rlats, _ = (np.concatenate(arrays) for arrays in zip(*results))
+    assert_same_positions(rlons, rlats, expected_lons, expected_lats, atol=1e-9)
+
+    # written incrementally to an array and to a file
+    out = np.lib.format.open_memmap(str(tmp_path / "points.npy"), mode="w+", shape=(lons.size, 2))
+    static_model.reconstruct_point_chunks(chunks, to_time, from_time, anchor_plate_id, out=out)
+    assert_same_positions(out[:,0], out[:,1], expected_lons, expected_lats, atol=1e-9)
+
+    with open(str(tmp_path / "points.bin"), "wb") as f:
+        static_model.reconstruct_point_chunks(chunks, to_time, from_time, anchor_plate_id, out=f)
+    written = np.fromfile(str(tmp_path / "points.bin")).reshape(-1, 2)
+    assert_same_positions(written[:,0], written[:,1], expected_lons, expected_lats, atol=1e-9)
@@ -0,0 +1,66 @@
+"""Tests of the LRU rotation cache in front of the rotation model."""
+import numpy as np
+import pygplates
+import pytest
+
+from conftest import PLATE_IDS
+from gplately import tools as _tools
+from gplately.reconstruction import PlateReconstruction, RotationCache
+
+
+def test_rotation_cache_counts_hits_misses_and_evictions(static_model):
+    cache = RotationCache(static_model.rotation_model, maxsize=3)
+    assert tuple(cache.cache_info()) == (0, 0, 0, 3, 0)
+
+    first = cache.get_rotation(10.0, 101)
+    assert cache.get_rotation(10, 101, 0, 0) is first     # the same key, given as ints
+    cache.get_rotation(20.0, 101)
+    cache.get_rotation(10.0, 201)
+    assert tuple(cache.cache_info()) == (1, 3, 0, 3, 3)
+
+    # (10, 101) is the most recently used rotation, so (20, 101) is evicted
+    cache.get_rotation(10.0, 101)
+    cache.get_rotation(30.0, 301)
+    assert tuple(cache.cache_info()) == (2, 4, 1, 3, 3)
+    assert cache.get_rotation(10.0, 101) is first
+    cache.get_rotation(20.0, 101)
+    assert tuple(cache.cache_info()) == (3, 5, 2, 3, 3)
+
+    # other from times and anchor plates are other keys
+    cache.get_rotation(10.0, 101, 5.0)
+    cache.get_rotation(10.0, 101, anchor_plate_id=201)
+    assert cache.cache_info().misses == 7
+
+    cache.clear()
+    assert tuple(cache.cache_info()) == (0, 0, 0, 3, 0)
+
+
+@pytest.mark.parametrize("maxsize", [0, None])
+def test_rotation_cache_sizes(static_model, maxsize):
+    cache = RotationCache(static_model.rotation_model, maxsize=maxsize)
+    for _ in range(2):
+        for time in np.arange(0, 100, 1.0):
+            cache.get_rotation(time, 101)
+    info = cache.cache_info()
+    if maxsize == 0:
+        # caching is disabled
+        assert (info.hits, info.misses, info.evictions, info.currsize) == (0, 200, 0, 0)
+    else:
+        assert (info.hits, info.misses, info.evictions, info.currsize) == (100, 100, 0, 100)
+
+
+def test_cached_rotations_are_identical_to_the_rotation_model(model_dir):
+    rotation_model = pygplates.RotationModel(str(model_dir / "rotations.rot"))
+    model = PlateReconstruction(str(model_dir / "rotations.rot"), rotation_cache_size=50)
+
+    rng = np.random.default_rng(0)
+    queries = [(float(rng.choice([0.0, 5.5, 10.0, 47.3, 120.0])), int(rng.choice(PLATE_IDS)),
+                float(rng.choice([0.0, 10.0, 33.0])), int(rng.choice([0, 201, 701]))) for _ in range(300)]
+    for to_time, plate_id, from_time, anchor_plate_id in queries:
+        expected = rotation_model.get_rotation(to_time, plate_id, from_time, anchor_plate_id=anchor_plate_id)
+        rotation = model.get_rotation(to_time, plate_id, from_time, anchor_plate_id)
+        np.testing.assert_array_equal(_tools.rotation_to_quaternion(rotation), _tools.rotation_to_quaternion(expected))
+
+    info = model.rotation_cache.cache_info()
+    assert info.hits > 0 and info.evictions > 0 and info.currsize == 50
+    assert info.hits + info.misses == len(queries)
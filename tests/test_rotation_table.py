@@ -0,0 +1,87 @@
+"""Tests of RotationTable against the pygplates rotation model it is compiled from."""
+import numpy as np
+import pytest
+
+from gplately import tools as _tools
+from gplately.reconstruction import RotationTable
+
+from conftest import PLATE_IDS
+
+# the rotation model of the static_model fixture has rotation poles every 10 Myr from 0 to 300 Ma
+NODE_TIMES = np.arange(0, 301, 10.0)
+
+
+def _rotation_angles(quaternions, expected_quaternions):
+    """The angles (degrees) of the rotations between two arrays of unit quaternions."""
+    difference = _tools.quaternion_multiply(quaternions * np.array([1.0, -1.0, -1.0, -1.0]), expected_quaternions)
+    return 2.0 * np.degrees(np.arctan2(np.linalg.norm(difference[...,1:], axis=-1), np.abs(difference[...,0])))
+
+
+def _model_quaternions(model, to_times, plate_ids, from_time=0.0, anchor_plate_id=0):
+    return np.array([[_tools.rotation_to_quaternion(model.rotation_model.get_rotation(
+        float(to_time), int(plate_id), float(from_time), anchor_plate_id=anchor_plate_id))
+        for to_time in to_times] for plate_id in plate_ids])
+
+
+def _assert_matches_rotation_model(model, table, times, from_time, tolerance):
+    plate_ids = np.array(PLATE_IDS)
+    quaternions = table.get_quaternions(times[np.newaxis,:], plate_ids[:,np.newaxis], from_time)
+    expected = _model_quaternions(model, times, plate_ids, from_time, table.anchor_plate_id)
+    assert _rotation_angles(quaternions, expected).max() < tolerance
+
+
+@pytest.mark.parametrize("anchor_plate_id", [0, 201])
+def test_rotation_table_matches_rotation_model_at_grid_times(static_model, anchor_plate_id):
+    table = static_model.compile_rotation_table(NODE_TIMES, anchor_plate_id=anchor_plate_id)
+    np.testing.assert_array_equal(table.plate_ids, sorted(PLATE_IDS + (0,)))
+    for from_time in (0.0, 40.0):
+        _assert_matches_rotation_model(static_model, table, NODE_TIMES, from_time, 1e-9)
+
+
+def test_rotation_table_matches_rotation_model_between_grid_times(static_model):
+    # the rotation poles of every plate are relative to the anchor plate, so the rotation model interpolates the same
+    # total rotations as the table
+    table = static_model.compile_rotation_table(NODE_TIMES)
+    times = NODE_TIMES[:-1] + 3.7
+    for from_time in (0.0, 42.5):
+        _assert_matches_rotation_model(static_model, table, times, from_time, 1e-6)
+
+
+def test_rotation_table_approximates_plate_circuits_between_grid_times(static_model):
+    # relative to another anchor plate, the rotation model interpolates the rotation poles of the plate circuit
+    # separately, which the table only approximates (more closely the finer its time grid)
+    times = np.arange(0, 300.01, 0.1)
+    table = static_model.compile_rotation_table(times, anchor_plate_id=201)
+    times = times[:-1] + 0.037
+    for from_time in (0.0, 42.55):
+        _assert_matches_rotation_model(static_model, table, times, from_time, 0.01)
+
+
+def test_rotation_table_matrices_rotate_like_quaternions(static_model):
+    table = static_model.compile_rotation_table(NODE_TIMES)
+    matrices = table.get_matrices(55.0, PLATE_IDS)
+    expected = _tools.quaternion_to_matrix(table.get_quaternions(55.0, PLATE_IDS))
+    np.testing.assert_allclose(matrices, expected, rtol=0, atol=1e-15)
+    np.testing.assert_allclose(matrices @ np.swapaxes(matrices, -1, -2), np.broadcast_to(np.eye(3), matrices.shape),
+                               rtol=0, atol=1e-12)
+
+
+def test_rotation_table_unknown_plate_is_identity(static_model):
+    table = static_model.compile_rotation_table(NODE_TIMES)
+    np.testing.assert_array_equal(table.get_quaternions([10.0, 20.0], 999), [[1, 0, 0, 0], [1, 0, 0, 0]])
+
+
+def test_rotation_table_save_load_round_trip(static_model, tmp_path):
+    table = static_model.compile_rotation_table(NODE_TIMES, anchor_plate_id=201)
+    filename = str(tmp_path / "rotation_table.npz")
+    table.save(filename)
+    loaded = RotationTable.load(filename)
+
+    np.testing.assert_array_equal(loaded.plate_ids, table.plate_ids)
+    np.testing.assert_array_equal(loaded.times, table.times)
+    np.testing.assert_array_equal(loaded.quaternions, table.quaternions)
+    assert loaded.anchor_plate_id == 201
+
+    times = np.linspace(0, 300, 41)
+    np.testing.assert_array_equal(loaded.get_quaternions(times, 501, from_time=12.0),
+                                  table.get_quaternions(times, 501, from_time=12.0))
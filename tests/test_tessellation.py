@@ -0,0 +1,34 @@
+"""Tests of the time-series tessellation of trenches and ridges."""
+import numpy as np
+import pytest
+
+TESSELLATIONS = [
+    ("tesselate_subduction_zones", "tesselate_subduction_zones_timeseries", 10),
+    ("tesselate_mid_ocean_ridges", "tesselate_mid_ocean_ridges_timeseries", 4),
+]
+
+
+@pytest.mark.parametrize("method_name, timeseries_method_name, ncols", TESSELLATIONS)
+@pytest.mark.parametrize("nprocs", [1, 2])
+def test_timeseries_stacks_single_time_results(topology_model, method_name, timeseries_method_name, ncols, nprocs):
+    times = [0.0, 10.0, 25.0]
+    data = getattr(topology_model, timeseries_method_name)(times, nprocs=nprocs)
+
+    expected = [getattr(topology_model, method_name)(time) for time in times]
+    assert all(single.shape[1] == ncols for single in expected)
+    assert data.shape == (sum(len(single) for single in expected), ncols + 1)
+    np.testing.assert_array_equal(data[:,:ncols], np.vstack(expected))
+    np.testing.assert_array_equal(data[:,-1], np.repeat(times, [len(single) for single in expected]))
+
+    streamed = list(getattr(topology_model, timeseries_method_name)(times, nprocs=nprocs, stream=True))
+    assert [time for time, _ in streamed] == times
+    for (_, single), single_expected in zip(streamed, expected):
+        np.testing.assert_array_equal(single, single_expected)
+
+
+@pytest.mark.parametrize("method_name, timeseries_method_name, ncols", TESSELLATIONS)
+@pytest.mark.parametrize("nprocs", [1, 2])
+def test_timeseries_of_no_times_is_empty(topology_model, method_name, timeseries_method_name, ncols, nprocs):
+    data = getattr(topology_model, timeseries_method_name)([], nprocs=nprocs)
+    assert data.shape == (0, ncols + 1)
+    assert list(getattr(topology_model, timeseries_method_name)([], nprocs=nprocs, stream=True)) == []
@@ -0,0 +1,35 @@
+"""Tests of the topologies resolved once per reconstruction time."""
+import numpy as np
+import pytest
+from ptt.resolve_topologies import resolve_topologies_into_features
+
+CATEGORIES = ["topologies", "ridge_transforms", "ridges", "transforms", "trenches", "trench_left", "trench_right",
+              "other"]
+
+
+def _summary(feature):
+    """The type, plate IDs, name and geometries (as lat-lon arrays) of a feature."""
+    geometries = [np.asarray(geometry.to_lat_lon_array()) for geometry in feature.get_all_geometries()]
+    return (feature.get_feature_type(), feature.get_reconstruction_plate_id(), feature.get_left_plate(None),
+            feature.get_right_plate(None), feature.get_name(), geometries)
+
+
+@pytest.mark.parametrize("time", [0.0, 35.0, 120.0])
+def test_resolved_features_match_ptt(topology_model, time):
+    resolved_features = topology_model.topology_snapshot(time).get_resolved_features()
+    expected_features = resolve_topologies_into_features(
+        topology_model.rotation_model, topology_model.topology_features, time)
+    assert len(resolved_features) == len(expected_features) == len(CATEGORIES)
+
+    for category, features, expected in zip(CATEGORIES, resolved_features, expected_features):
+        assert len(features) == len(expected), category
+        for feature, expected_feature in zip(features, expected):
+            summary, expected_summary = _summary(feature), _summary(expected_feature)
+            assert summary[:5] == expected_summary[:5], category
+            assert len(summary[5]) == len(expected_summary[5]), category
+            for geometry, expected_geometry in zip(summary[5], expected_summary[5]):
+                np.testing.assert_allclose(geometry, expected_geometry, rtol=0, atol=1e-9)
+
+    # the synthetic model has a ridge and a trench with left polarity
+    topologies, _, ridges, _, trenches, trench_left, trench_right, _ = resolved_features
+    assert topologies and ridges and trenches and len(trench_left) == len(trenches) and not trench_right
@@ -0,0 +1,84 @@
+"""Regression tests of the vectorised velocity calculations against per-point pygplates loops."""
+import numpy as np
+import pygplates
+import pytest
+
+from gplately.reconstruction import Points
+
+
+
+def _random_points(n, seed=0):
+    rng = np.random.default_rng(seed)
+    lons = rng.uniform(-180, 180, n)
+    lats = np.degrees(np.arcsin(rng.uniform(-1, 1, n)))
+    return lons, lats
+
+
+def _point_velocity(point, rotation_model, plate_id, time, delta_time, velocity_units=pygplates.VelocityUnits.kms_per_my):
+    """The (north, east) velocity of one point, as calculated before the velocity calculations were vectorised."""
+    stage_rotation = rotation_model.get_rotation(time, plate_id, time + delta_time)
+    velocity_vectors = pygplates.calculate_velocities([point], stage_rotation, delta_time, velocity_units)
+    velocity = pygplates.LocalCartesian.convert_from_geocentric_to_north_east_down([point], velocity_vectors)[0]
+    return velocity.get_x(), velocity.get_y()
+
+
+def _point_velocities_loop(model, lons, lats, time, delta_time=1.0):
+    """The (n,2) velocities of points partitioned into the topological plates, calculated one point at a time."""
+    plate_partitioner = pygplates.PlatePartitioner(model.topology_features, model.rotation_model, time)
+    velocities = np.zeros((lons.size, 2))
+    for i, (lon, lat) in enumerate(zip(lons, lats)):
+        point = pygplates.PointOnSphere(lat, lon)
+        partitioning_plate = plate_partitioner.partition_point(point)
+        if partitioning_plate:
+            plate_id = partitioning_plate.get_feature().get_reconstruction_plate_id()
+            velocities[i] = _point_velocity(point, model.rotation_model, plate_id, time, delta_time)
+    return velocities
+
+
+@pytest.mark.parametrize("time", [0.0, 20.0])
+def test_get_point_velocities_matches_per_point_loop(topology_model, time):
+    lons, lats = _random_points(2000, seed=1)
+    expected = _point_velocities_loop(topology_model, lons, lats, time)
+    velocities = topology_model.get_point_velocities(lons, lats, time, resolution=None)
+    np.testing.assert_allclose(velocities, expected, rtol=0, atol=1e-9)
+
+
+@pytest.mark.parametrize("time", [0.0, 20.0])
+def test_get_point_velocities_plate_id_raster_matches_per_point_loop(topology_model, time):
+    # random points, and a regular grid whose points lie on the cell edges of the raster and at the poles
+    lons, lats = _random_points(2000, seed=2)
+    grid_lons, grid_lats = np.meshgrid(np.arange(-180, 180.1, 2.0), np.arange(-90, 90.1, 2.0))
+    lons, lats = np.concatenate([lons, grid_lons.ravel()]), np.concatenate([lats, grid_lats.ravel()])
+
+    expected = _point_velocities_loop(topology_model, lons, lats, time)
+    for resolution in (1.0, 0.5):
+        velocities = topology_model.get_point_velocities(lons, lats, time, resolution=resolution)
+        np.testing.assert_allclose(velocities, expected, rtol=0, atol=1e-9)
+
+
+def _plate_velocity_loop(model, lons, lats, plate_ids, time, delta_time):
+    """The (n,2) velocities (cm/yr) of points on the given plates, calculated one point at a time."""
+    velocities = np.empty((lons.size, 2))
+    for i, (lon, lat, plate_id) in enumerate(zip(lons, lats, plate_ids)):
+        velocities[i] = _point_velocity(pygplates.PointOnSphere(lat, lon), model.rotation_model, int(plate_id), time,
+                                        delta_time, pygplates.VelocityUnits.cms_per_yr)
+    return velocities
+
+
+@pytest.mark.parametrize("points_time, time", [(0.0, 0.0), (0.0, 30.0), (25.0, 25.0), (25.0, 60.0)])
+def test_plate_velocity_matches_per_point_loop(static_model, points_time, time):
+    lons, lats = _random_points(2000, seed=3)
+    points = Points(static_model, lons, lats, time=points_time)
+
+    # velocities are evaluated at the stored coordinates of the points
+    expected = _plate_velocity_loop(static_model, lons, lats, points.plate_id, time, 2.0)
+    north, east = points.plate_velocity(time, delta_time=2.0)
+    np.testing.assert_allclose(north, expected[:,0], rtol=0, atol=1e-9)
+    np.testing.assert_allclose(east, expected[:,1], rtol=0, atol=1e-9)
+
+    # or where the points are at 'time'
+    rlons, rlats = static_model.reconstruct_points(lons, lats, points.plate_id, time, points_time)
+    expected = _plate_velocity_loop(static_model, rlons, rlats, points.plate_id, time, 2.0)
+    north, east = points.plate_velocity(time, delta_time=2.0, reconstruct=True)
+    np.testing.assert_allclose(north, expected[:,0], rtol=0, atol=1e-9)
+    np.testing.assert_allclose(east, expected[:,1], rtol=0, atol=1e-9)
@@ -0,0 +1,56 @@
+"""Tests of the worker processes used by PlateReconstruction methods with nprocs > 1."""
+import multiprocessing
+import os
+import shutil
+
+import numpy as np
+import pygplates
+import pytest
+
+from gplately.reconstruction import PlateReconstruction
+
+pytestmark = pytest.mark.skipif(multiprocessing.get_start_method() != "fork", reason="worker processes are not forked")
+
+
+@pytest.fixture
+def model_copy(model_dir, tmp_path):
+    """Copies of the rotation and static polygon files of the static model, which tests may delete."""
+    rotation_file = str(tmp_path / "rotations.rot")
+    static_polygons_file = str(tmp_path / "static_polygons.gpml")
+    shutil.copy(str(model_dir / "rotations.rot"), rotation_file)
+    shutil.copy(str(model_dir / "static_polygons.gpml"), static_polygons_file)
+    return rotation_file, static_polygons_file
+
+
+def _lons_lats():
+    lons, lats = np.meshgrid(np.arange(-180, 180, 5.0), np.arange(-87.5, 90, 5.0))
+    return lons.ravel(), lats.ravel()
+
+
+def test_forked_workers_use_models_loaded_before_the_pool(model_copy):
+    rotation_file, static_polygons_file = model_copy
+    model = PlateReconstruction(rotation_file, static_polygons=static_polygons_file)
+    lons, lats = _lons_lats()
+
+    # nothing is loaded yet, so the models are loaded in this process before the workers start
+    plate_ids = model.partition_points(lons, lats, 30.0, nprocs=2)
+    assert isinstance(model._worker_init_args()[0], pygplates.RotationModel)
+
+    # workers that tried to parse the files would fail now
+    for filename in model_copy:
+        os.remove(filename)
+    np.testing.assert_array_equal(model.partition_points(lons, lats, 30.0, nprocs=2), plate_ids)
+    np.testing.assert_array_equal(model.partition_points(lons, lats, 30.0), plate_ids)
+
+
+def test_forked_workers_follow_replaced_models(model_dir, model_copy):
+    rotation_file, static_polygons_file = model_copy
+    model = PlateReconstruction(rotation_file, static_polygons=static_polygons_file)
+    lons, lats = _lons_lats()
+    model.partition_points(lons, lats, 30.0, nprocs=2)
+
+    model.rotation_model = str(model_dir / "topology_rotations.rot")
+    tasks = [("reconstruct_points", (lons, lats, 101, 30.0), {})] * 2
+    serial = list(model._map_tasks(tasks, 1))
+    parallel = list(model._map_tasks(tasks, 2))
+    np.testing.assert_array_equal(parallel, serial)